@@ -1,23 +1,55 @@
 """Press releases API."""
 
 import tempfile
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Dict
+from uuid import uuid4
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile
 from fastapi.concurrency import run_in_threadpool
 
-from api.schemas import PressReleaseIn
+from api.schemas import BatchExtractEventsIn, PressReleaseIn
 from pr_flow_agents.ingestion import run_bulk
-from pr_flow_agents.orchestration import BaselineSummaryOrchestrator, IngestionEventOrchestrator
+from pr_flow_agents.orchestration import BaselineSummaryOrchestrator, BatchIngestionRunner, IngestionEventOrchestrator
+from pr_flow_agents.orchestration.batch_ingestion_runner import BATCH_MODES, parse_bound
 from pr_flow_agents.storage import save_crawl_to_mongo, MongoStore
 from pr_flow_agents.crawler import crawl_from_link
 from pr_flow_agents.models import PressReleaseLink
 
 router = APIRouter(prefix="/press-releases", tags=["press-releases"])
 orchestrator = IngestionEventOrchestrator()
+batch_runner = BatchIngestionRunner(orchestrator=orchestrator)
 baseline_orchestrator = BaselineSummaryOrchestrator()
 
+# Batch extraction jobs of this process, newest last. A batch can outlast any
+# HTTP timeout, so it runs in the background and is polled by job id. Jobs
+# are lost on restart; finished ones beyond the cap are forgotten.
+MAX_BATCH_JOBS = 100
+_batch_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_batch_jobs_lock = threading.Lock()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _update_batch_job(job_id: str, **fields: Any) -> None:
+    with _batch_jobs_lock:
+        _batch_jobs[job_id].update(fields)
+
+
+def _run_batch_job(job_id: str, kwargs: Dict[str, Any]) -> None:
+    _update_batch_job(job_id, status="running", started_at=_now())
+    try:
+        out = batch_runner.run(**kwargs)
+    except Exception as exc:  # noqa: BLE001
+        _update_batch_job(job_id, status="failed", finished_at=_now(), error=f"batch_orchestration_failed: {exc}")
+        return
+    _update_batch_job(job_id, status="done", finished_at=_now(), result=out)
+
 
 @router.get("")
 async def list_press_releases(ticker: str | None = None):
@@ -48,6 +80,53 @@ async def add_press_release_bulk(file: UploadFile = File(...)):
         Path(path).unlink(missing_ok=True)
 
 
+@router.post("/extract-events/batch", status_code=202)
+async def extract_events_batch(body: BatchExtractEventsIn, background_tasks: BackgroundTasks):
+    if not body.ticker and not body.ids:
+        raise HTTPException(400, "ticker or ids required")
+    try:
+        start = parse_bound(body.start)
+        end = parse_bound(body.end, end=True)
+    except ValueError as exc:
+        raise HTTPException(400, f"invalid date: {exc}") from exc
+    if body.mode not in BATCH_MODES:
+        raise HTTPException(400, f"mode must be one of {', '.join(BATCH_MODES)}")
+    kwargs = {
+        "ticker": body.ticker,
+        "start": start,
+        "end": end,
+        "press_release_ids": body.ids,
+        "parallelism": body.parallelism,
+        "mode": body.mode,
+        "queue_depth": body.queue_depth,
+        "max_hops": body.max_hops,
+        "local_validator_strict": body.local_validator_strict,
+        "pack_short_releases": body.pack_short_releases,
+        "severity_gate": body.severity_gate,
+        "revision_mode": body.revision_mode,
+        "force": body.force,
+    }
+    job_id = uuid4().hex[:12]
+    with _batch_jobs_lock:
+        _batch_jobs[job_id] = {"job_id": job_id, "status": "queued", "created_at": _now()}
+        finished = [k for k, job in _batch_jobs.items() if job["status"] in {"done", "failed"}]
+        for k in finished[: max(0, len(_batch_jobs) - MAX_BATCH_JOBS)]:
+            del _batch_jobs[k]
+    # Sync background tasks run in the threadpool after the response is sent.
+    background_tasks.add_task(_run_batch_job, job_id, kwargs)
+    return {"ok": True, "job_id": job_id, "status": "queued"}
+
+
+@router.get("/extract-events/batch/{job_id}")
+async def get_extract_events_batch(job_id: str):
+    with _batch_jobs_lock:
+        job = _batch_jobs.get(job_id)
+        job = dict(job) if job else None
+    if not job:
+        raise HTTPException(404, "Not found")
+    return job
+
+
 @router.get("/{id}")
 async def get_press_release(id: str):
     doc = MongoStore().get_by_id(id)
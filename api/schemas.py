@@ -1,5 +1,7 @@
 """Request/response schemas."""
 
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -14,3 +16,19 @@ class PressReleaseIn(BaseModel):
     ticker: str
     title: str
     press_ts: str  # ISO format required
+
+
+class BatchExtractEventsIn(BaseModel):
+    ticker: str | None = None
+    start: str | None = None  # ISO date or datetime
+    end: str | None = None  # ISO date or datetime, inclusive
+    ids: list[str] | None = None
+    parallelism: int = 4
+    mode: str = "pipelined"  # pipelined | phased | serial
+    queue_depth: int | None = None
+    max_hops: int | None = None
+    local_validator_strict: bool | None = None
+    pack_short_releases: bool = False
+    severity_gate: bool | None = None
+    revision_mode: Literal["patch", "full"] | None = None
+    force: bool = False
@@ -8,7 +8,7 @@ from pr_flow_agents.graph.baseline import nodes
 from pr_flow_agents.graph.baseline.state import BaselineState
 
 
-def build_graph():
+def build_graph(checkpointer=None):
     builder = StateGraph(BaselineState)
 
     builder.add_node("load_press_release", nodes.load_press_release)
@@ -57,4 +57,4 @@ def build_graph():
     builder.add_edge("persist_summaries", "finalize_output")
     builder.add_edge("finalize_output", END)
 
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict
 
 from pr_flow_agents.graph.baseline.prompts import (
@@ -10,10 +11,12 @@ from pr_flow_agents.graph.baseline.prompts import (
     UPDATE_QUARTERLY_SUMMARY_PROMPT,
 )
 from pr_flow_agents.graph.baseline.state import BaselineState
+from pr_flow_agents.graph.checkpointing import checkpointer_mode
 from pr_flow_agents.llm import generate_json
 from pr_flow_agents.logging_utils import get_logger
 from pr_flow_agents.storage.baseline_summary_store import BaselineSummaryStore
 from pr_flow_agents.storage.mongo_store import MongoStore
+from pr_flow_agents.storage.run_blob_store import RunBlobStore
 
 logger = get_logger(__name__)
 
@@ -41,6 +44,21 @@ def _mlflow_enabled() -> bool:
     return mlflow is not None and mlflow.active_run() is not None
 
 
+@lru_cache(maxsize=1)
+def _blob_store() -> RunBlobStore:
+    # Blobs must outlive the process only when a checkpoint may be resumed.
+    return RunBlobStore(durable=checkpointer_mode() != "off")
+
+
+def release_run_blobs(run_id: str) -> None:
+    """Drop the in-process payloads of a finished, failed or cancelled run."""
+    _blob_store().release(str(run_id or ""))
+
+
+def _content(state: BaselineState) -> str:
+    return str(_blob_store().get(state.get("content_ref"), "") or "")
+
+
 @_trace(span_type="CHAIN", name="load_press_release")
 def load_press_release(state: BaselineState) -> BaselineState:
     press_release_id = str(state.get("press_release_id") or "").strip()
@@ -85,7 +103,7 @@ def load_press_release(state: BaselineState) -> BaselineState:
         "ticker": ticker,
         "press_release_title": str(doc.get("title") or ""),
         "press_release_timestamp": ts_iso,
-        "press_release_content": content,
+        "content_ref": _blob_store().put(content, run_id=str(state.get("run_id") or "")),
         "status": "PENDING",
         "error": None,
     }
@@ -141,13 +159,14 @@ def load_existing_summaries(state: BaselineState) -> BaselineState:
 
 @_trace(span_type="CHAIN", name="update_summaries")
 def update_summaries(state: BaselineState) -> BaselineState:
+    content = _content(state)
     company_prompt = UPDATE_COMPANY_SUMMARY_PROMPT.format(
         ticker=str(state.get("ticker") or ""),
         press_release_id=str(state.get("press_release_id") or ""),
         press_release_title=str(state.get("press_release_title") or ""),
         press_release_timestamp=str(state.get("press_release_timestamp") or ""),
         existing_company_summary=str(state.get("existing_company_summary") or "<none>"),
-        press_release_content=str(state.get("press_release_content") or ""),
+        press_release_content=content,
     )
     quarterly_prompt = UPDATE_QUARTERLY_SUMMARY_PROMPT.format(
         ticker=str(state.get("ticker") or ""),
@@ -157,7 +176,7 @@ def update_summaries(state: BaselineState) -> BaselineState:
         fiscal_year=int(state.get("fiscal_year") or 0),
         fiscal_quarter=str(state.get("fiscal_quarter") or ""),
         existing_quarterly_summary=str(state.get("existing_quarterly_summary") or "<none>"),
-        press_release_content=str(state.get("press_release_content") or ""),
+        press_release_content=content,
     )
 
     try:
@@ -7,7 +7,9 @@ import json
 import os
 
 from pr_flow_agents.graph.baseline.graph import build_graph
+from pr_flow_agents.graph.baseline.nodes import release_run_blobs
 from pr_flow_agents.graph.baseline.state import BaselineState
+from pr_flow_agents.graph.checkpointing import new_run_id
 from pr_flow_agents.logging_utils import configure_logging, get_logger
 
 logger = get_logger(__name__)
@@ -44,18 +46,21 @@ def main() -> None:
             mlflow = None
             logger.warning("mlflow_init_failed error=%s", exc)
 
-    state: BaselineState = {"press_release_id": args.press_release_id}
+    state: BaselineState = {"press_release_id": args.press_release_id, "run_id": new_run_id()}
     logger.info("baseline_graph_start press_release_id=%s", args.press_release_id)
     app = build_graph()
 
-    if mlflow is not None:
-        with mlflow.start_run(run_name=f"baseline_{args.press_release_id}"):
-            with mlflow.start_span(name="baseline_graph") as span:
-                span.set_inputs(state)
-                out = app.invoke(state)
-                span.set_outputs(out.get("result") or {})
-    else:
-        out = app.invoke(state)
+    try:
+        if mlflow is not None:
+            with mlflow.start_run(run_name=f"baseline_{args.press_release_id}"):
+                with mlflow.start_span(name="baseline_graph") as span:
+                    span.set_inputs(state)
+                    out = app.invoke(state)
+                    span.set_outputs(out.get("result") or {})
+        else:
+            out = app.invoke(state)
+    finally:
+        release_run_blobs(state["run_id"])
 
     logger.info("baseline_graph_done press_release_id=%s", args.press_release_id)
     print(json.dumps(out.get("result") or {}, indent=2))
@@ -11,12 +11,14 @@ BaselineStatus = Literal["PENDING", "DONE", "ERROR"]
 class BaselineState(TypedDict, total=False):
     # Inputs
     press_release_id: str
+    run_id: str
 
     # Loaded source data
     ticker: str
     press_release_title: str
     press_release_timestamp: str
-    press_release_content: str
+    # Handle into RunBlobStore; the body itself never rides in state.
+    content_ref: str
 
     # Derived fiscal context
     fiscal_year: int
@@ -0,0 +1,112 @@
+"""Optional durable checkpointing shared by the ingestion, linker and baseline graphs.
+
+Select a backend with ``PR_FLOW_CHECKPOINTER``:
+
+- ``off`` (default): graphs compile without a checkpointer.
+- ``mongo``: ``langgraph-checkpoint-mongodb`` in the configured MongoDB.
+- ``sqlite``: ``langgraph-checkpoint-sqlite`` at ``PR_FLOW_CHECKPOINT_SQLITE_PATH``.
+
+Runs are keyed by graph name, press release id and run id, so a crashed run
+can be resumed from its last completed node with the same run id.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from pr_flow_agents.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINTER_ENV = "PR_FLOW_CHECKPOINTER"
+SQLITE_PATH_ENV = "PR_FLOW_CHECKPOINT_SQLITE_PATH"
+SQLITE_PATH_DEFAULT = "pr_flow_checkpoints.sqlite"
+MONGO_CHECKPOINT_COLLECTION = "graph_checkpoints"
+MONGO_WRITES_COLLECTION = "graph_checkpoint_writes"
+
+_checkpointer: Any = None
+_checkpointer_mode: Optional[str] = None
+
+
+def checkpointer_mode() -> str:
+    return str(os.getenv(CHECKPOINTER_ENV, "off")).strip().lower() or "off"
+
+
+def get_checkpointer() -> Any:
+    """Return a process-wide checkpointer for the configured backend, or None."""
+
+    global _checkpointer, _checkpointer_mode
+    mode = checkpointer_mode()
+    if mode == _checkpointer_mode:
+        return _checkpointer
+
+    saver = None
+    try:
+        if mode == "mongo":
+            import pymongo
+            from langgraph.checkpoint.mongodb import MongoDBSaver
+
+            from pr_flow_agents.storage.config import get_database, get_uri
+
+            saver = MongoDBSaver(
+                pymongo.MongoClient(get_uri()),
+                db_name=get_database(),
+                checkpoint_collection_name=MONGO_CHECKPOINT_COLLECTION,
+                writes_collection_name=MONGO_WRITES_COLLECTION,
+            )
+        elif mode == "sqlite":
+            from langgraph.checkpoint.sqlite import SqliteSaver
+
+            path = str(os.getenv(SQLITE_PATH_ENV, SQLITE_PATH_DEFAULT)).strip() or SQLITE_PATH_DEFAULT
+            saver = SqliteSaver(sqlite3.connect(path, check_same_thread=False))
+        elif mode not in {"off", "0", "false", "no", "none"}:
+            logger.warning("checkpointer_unknown_mode mode=%s", mode)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("checkpointer_init_failed mode=%s error=%s", mode, exc)
+        saver = None
+
+    if saver is not None:
+        logger.info("checkpointer_configured mode=%s", mode)
+    _checkpointer, _checkpointer_mode = saver, mode
+    return saver
+
+
+def new_run_id() -> str:
+    return uuid4().hex[:12]
+
+
+def run_config(graph_name: str, press_release_id: str, run_id: str) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": f"{graph_name}:{press_release_id}:{run_id}"}}
+
+
+def has_checkpoint(app: Any, config: Dict[str, Any]) -> bool:
+    if getattr(app, "checkpointer", None) is None:
+        return False
+    return bool(app.get_state(config).values)
+
+
+def invoke_graph(app: Any, state: Dict[str, Any], *, config: Optional[Dict[str, Any]] = None, resume: bool = False) -> Dict[str, Any]:
+    """Invoke ``app``, continuing from the last checkpoint when ``resume`` is set.
+
+    Falls back to a fresh run from ``state`` when the graph has no
+    checkpointer or no checkpoint exists yet for ``config``.
+    """
+
+    if config is None or getattr(app, "checkpointer", None) is None:
+        return app.invoke(state)
+    if resume:
+        snapshot = app.get_state(config)
+        if snapshot.values:
+            if not snapshot.next:
+                logger.info("graph_resume_already_complete thread_id=%s", config["configurable"]["thread_id"])
+                return dict(snapshot.values)
+            logger.info(
+                "graph_resume thread_id=%s next=%s",
+                config["configurable"]["thread_id"],
+                ",".join(snapshot.next),
+            )
+            return app.invoke(None, config)
+    return app.invoke(state, config)
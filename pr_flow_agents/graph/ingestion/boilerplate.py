@@ -0,0 +1,248 @@
+"""Boilerplate stripping for ingestion prompts.
+
+Press releases end with forward-looking-statement disclaimers, "About
+<Company>" blurbs, media/investor contacts and social links. None of it
+yields events, so it is removed before the release body goes into the
+extractor, validator and expert prompts.
+
+Two rules decide what is boilerplate:
+
+- Pattern rules: a section whose heading matches ``SECTION_HEADING_PATTERNS``
+  is dropped whole. A paragraph that matches ``PARAGRAPH_PATTERNS`` is
+  dropped on its own.
+- Learned rule: a paragraph that appears verbatim (after normalization) in
+  at least ``LEARNED_MIN_DOCS`` other releases of the same company is
+  dropped. Per-paragraph document frequencies come from
+  ``BoilerplateStore``.
+
+The stripped text is a concatenation of untouched slices of the original.
+``StrippedContent.segments`` maps it back to original offsets, so evidence
+spans quoted from it are still verbatim in the original release.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from pr_flow_agents.graph.ingestion.chunking import section_bounds
+from pr_flow_agents.graph.ingestion.text_index import normalize_text
+
+# Section headings (first line of a section, markdown markers stripped).
+SECTION_HEADING_PATTERNS: Tuple[str, ...] = (
+    r"^(cautionary (note|statement)s?( regarding| concerning| about)?\s*)?forward[- ]looking (statements?|information)",
+    r"^safe harbou?r",
+    # "About Acme" blurbs, but not "About the Phase 3 trial" background sections.
+    r"^about\s+(?!(the\s+)?(phase|trial|study|studies|program|transaction|agreement|acquisition)\b)\S",
+    r"^(media|press|investor|investors|ir)?\s*(relations\s*)?contacts?\b",
+    r"^(media|press|investor|investors)\s+(inquiries|enquiries|relations)\b",
+    r"^(follow|connect with)\s+us\b",
+    r"^(social media|additional information and where to find it)\b",
+)
+
+# Stand-alone paragraphs inside otherwise useful sections.
+PARAGRAPH_PATTERNS: Tuple[str, ...] = (
+    r"^(this|the) (press|news) release (contains|includes|may contain)\b.{0,80}forward[- ]looking",
+    r"^(certain )?statements (contained |made )?in this (press|news) release\b.{0,120}forward[- ]looking",
+    r"^source:\s",
+    r"^(follow|connect with) (us|\S+) on\b",
+    r"^view (original|source) content\b",
+    r"^(media|investor|press) contacts?:",
+)
+
+# A paragraph needs this many other releases of the same company containing
+# it before it is considered learned boilerplate.
+LEARNED_MIN_DOCS = 3
+# Shorter paragraphs (headings, one-word lines) are never fingerprinted.
+LEARNED_MIN_CHARS = 80
+# Rough chars-per-token ratio used for savings estimates.
+CHARS_PER_TOKEN = 4.0
+
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n")
+_HEADING_MARKUP_RE = re.compile(r"^[#>*_\s]+|[*_\s:]+$")
+# A paragraph made only of markdown links/images and separators (social bars).
+_LINK_ONLY_RE = re.compile(r"^(?:\s*(?:!?\[[^\]]*\]\([^)]*\)|[|•·,-])\s*)+$")
+
+
+def _compile(patterns: Iterable[str]) -> List[Pattern[str]]:
+    return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+
+_DEFAULT_HEADING_RES = _compile(SECTION_HEADING_PATTERNS)
+_DEFAULT_PARAGRAPH_RES = _compile(PARAGRAPH_PATTERNS)
+
+
+@dataclass
+class StrippedContent:
+    text: str
+    original_chars: int
+    # (stripped_start, original_start, length) for every kept slice, in order.
+    segments: List[Tuple[int, int, int]] = field(default_factory=list)
+    # {"start", "end", "reason", "preview"} in original offsets.
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def removed_chars(self) -> int:
+        return self.original_chars - len(self.text)
+
+    @property
+    def saved_tokens_est(self) -> int:
+        return int(round(self.removed_chars / CHARS_PER_TOKEN))
+
+    def to_original(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """Map a stripped [start, end) range to the original text.
+
+        Returns None when the range spans a removed section, i.e. it is not a
+        contiguous substring of the original.
+        """
+
+        if not self.segments or end < start:
+            return None
+        starts = [seg[0] for seg in self.segments]
+        i = max(0, bisect_right(starts, start) - 1)
+        s_start, o_start, length = self.segments[i]
+        if start < s_start or end > s_start + length:
+            return None
+        return o_start + (start - s_start), o_start + (end - s_start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "original_chars": self.original_chars,
+            "segments": [list(seg) for seg in self.segments],
+            "removed": list(self.removed),
+        }
+
+    @classmethod
+    def from_dict(cls, text: str, data: Dict[str, Any]) -> "StrippedContent":
+        return cls(
+            text=text,
+            original_chars=int(data.get("original_chars") or len(text)),
+            segments=[tuple(seg) for seg in data.get("segments") or []],  # type: ignore[misc]
+            removed=list(data.get("removed") or []),
+        )
+
+
+def _heading_text(section: str) -> str:
+    first = section.split("\n", 1)[0]
+    return _HEADING_MARKUP_RE.sub("", first).strip()
+
+
+def _paragraph_bounds(text: str, start: int, end: int) -> List[Tuple[int, int]]:
+    """Paragraph [start, end) offsets within text[start:end], keeping trailing breaks."""
+
+    out: List[Tuple[int, int]] = []
+    last = start
+    for m in _PARAGRAPH_BREAK_RE.finditer(text, start, end):
+        out.append((last, m.end()))
+        last = m.end()
+    if last < end:
+        out.append((last, end))
+    return out
+
+
+def paragraph_fingerprint(paragraph: str) -> Optional[str]:
+    """Stable fingerprint of a paragraph, or None if too short to learn from."""
+
+    norm = normalize_text(paragraph)
+    if len(norm) < LEARNED_MIN_CHARS:
+        return None
+    return hashlib.sha1(norm.encode("utf-8")).hexdigest()[:20]
+
+
+def paragraph_fingerprints(content: str) -> List[str]:
+    """Fingerprints of every learnable paragraph outside the lead section."""
+
+    text = content or ""
+    out: List[str] = []
+    for idx, (s_start, s_end) in enumerate(section_bounds(text)):
+        if idx == 0:
+            continue
+        for p_start, p_end in _paragraph_bounds(text, s_start, s_end):
+            fp = paragraph_fingerprint(text[p_start:p_end])
+            if fp and fp not in out:
+                out.append(fp)
+    return out
+
+
+def strip_boilerplate(
+    content: str,
+    *,
+    doc_counts: Optional[Dict[str, int]] = None,
+    heading_patterns: Optional[Sequence[str]] = None,
+    paragraph_patterns: Optional[Sequence[str]] = None,
+    min_docs: int = LEARNED_MIN_DOCS,
+) -> StrippedContent:
+    """Remove boilerplate sections/paragraphs from release markdown.
+
+    ``doc_counts`` maps paragraph fingerprints to the number of other releases
+    of the same company containing them. The lead section (everything before
+    the first heading) is never removed by section or learned rules. If only
+    whitespace would remain, the original text is returned unchanged.
+    """
+
+    text = content or ""
+    heading_res = _compile(heading_patterns) if heading_patterns is not None else _DEFAULT_HEADING_RES
+    paragraph_res = _compile(paragraph_patterns) if paragraph_patterns is not None else _DEFAULT_PARAGRAPH_RES
+    counts = doc_counts or {}
+
+    removed: List[Dict[str, Any]] = []
+    kept: List[Tuple[int, int]] = []
+    for idx, (s_start, s_end) in enumerate(section_bounds(text)):
+        section = text[s_start:s_end]
+        heading = _heading_text(section)
+        if idx > 0 and heading and any(r.search(heading) for r in heading_res):
+            removed.append({"start": s_start, "end": s_end, "reason": "section_pattern", "preview": heading[:80]})
+            continue
+        for p_start, p_end in _paragraph_bounds(text, s_start, s_end):
+            paragraph = text[p_start:p_end]
+            stripped = paragraph.strip()
+            reason = None
+            if stripped and (any(r.search(stripped) for r in paragraph_res) or _LINK_ONLY_RE.match(stripped)):
+                reason = "paragraph_pattern"
+            elif idx > 0:
+                fp = paragraph_fingerprint(paragraph)
+                if fp and counts.get(fp, 0) >= min_docs:
+                    reason = "learned_frequency"
+            if reason:
+                removed.append({"start": p_start, "end": p_end, "reason": reason, "preview": stripped[:80]})
+            else:
+                kept.append((p_start, p_end))
+
+    if not kept or not text[kept[0][0]:kept[-1][1]].strip():
+        return StrippedContent(text=text, original_chars=len(text), segments=[(0, 0, len(text))] if text else [])
+
+    # Merge adjacent kept slices so the offset map stays short.
+    merged: List[Tuple[int, int]] = []
+    for start, end in kept:
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    parts: List[str] = []
+    segments: List[Tuple[int, int, int]] = []
+    pos = 0
+    for start, end in merged:
+        segments.append((pos, start, end - start))
+        parts.append(text[start:end])
+        pos += end - start
+    return StrippedContent(text="".join(parts), original_chars=len(text), segments=segments, removed=removed)
+
+
+def main() -> None:
+    """Print boilerplate token savings per sector."""
+
+    import json
+
+    from pr_flow_agents.logging_utils import configure_logging
+    from pr_flow_agents.storage.boilerplate_store import BoilerplateStore
+
+    configure_logging()
+    print(json.dumps(BoilerplateStore().savings_by_sector(chars_per_token=CHARS_PER_TOKEN), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Markdown chunking and partial-event merge for long press releases.
+
+Long releases (earnings, 10-Q style wrap-ups) are split on markdown section
+boundaries so the extractor and validator can run per chunk. Consecutive
+chunks share a small overlap so events straddling a boundary are still seen
+whole by at least one call; the resulting duplicates are removed by
+``merge_chunk_events``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Tuple
+
+CHUNK_THRESHOLD_CHARS = 24000
+CHUNK_MAX_CHARS = 12000
+CHUNK_OVERLAP_CHARS = 800
+
+# A section starts at an ATX heading ("## Results") or a bold-only line
+# ("**About Acme**"), which is how crawl4ai renders most release headings.
+_SECTION_START_RE = re.compile(r"^(?:#{1,6}\s+\S|\*\*[^*\n]+\*\*[ \t]*$)", re.MULTILINE)
+_BLANK_LINE_RE = re.compile(r"\n[ \t]*\n")
+_WS_RE = re.compile(r"\s+")
+
+
+def should_chunk(content: str, threshold_chars: int = CHUNK_THRESHOLD_CHARS) -> bool:
+    return len(content or "") > int(threshold_chars)
+
+
+def section_bounds(content: str) -> List[Tuple[int, int]]:
+    """[start, end) offsets of markdown sections that each begin at a heading line."""
+
+    text = content or ""
+    starts = [m.start() for m in _SECTION_START_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts = [0] + starts
+    bounds = starts + [len(text)]
+    return [(bounds[i], bounds[i + 1]) for i in range(len(starts)) if bounds[i + 1] > bounds[i]]
+
+
+def split_sections(content: str) -> List[str]:
+    """Split markdown into sections that each begin at a heading line."""
+
+    text = content or ""
+    return [text[start:end] for start, end in section_bounds(text)]
+
+
+def _split_oversized(section: str, max_chars: int) -> List[str]:
+    """Split one section on paragraph breaks, hard-cutting only as a last resort."""
+
+    if len(section) <= max_chars:
+        return [section]
+
+    pieces: List[str] = []
+    last = 0
+    for m in _BLANK_LINE_RE.finditer(section):
+        pieces.append(section[last:m.end()])
+        last = m.end()
+    pieces.append(section[last:])
+
+    out: List[str] = []
+    buf = ""
+    for piece in pieces:
+        while len(piece) > max_chars:
+            if buf:
+                out.append(buf)
+                buf = ""
+            out.append(piece[:max_chars])
+            piece = piece[max_chars:]
+        if len(buf) + len(piece) > max_chars and buf:
+            out.append(buf)
+            buf = ""
+        buf += piece
+    if buf:
+        out.append(buf)
+    return out
+
+
+def _overlap_tail(text: str, overlap_chars: int) -> str:
+    """Tail of ``text`` of roughly ``overlap_chars``, aligned to a line start."""
+
+    if overlap_chars <= 0 or not text:
+        return ""
+    tail = text[-overlap_chars:]
+    if len(tail) < len(text):
+        nl = tail.find("\n")
+        if 0 <= nl < len(tail) - 1:
+            tail = tail[nl + 1:]
+    return tail
+
+
+def chunk_markdown(
+    content: str,
+    max_chars: int = CHUNK_MAX_CHARS,
+    overlap_chars: int = CHUNK_OVERLAP_CHARS,
+) -> List[str]:
+    """Pack markdown sections into chunks of at most ~``max_chars``.
+
+    Each chunk after the first is prefixed with the tail of the previous one.
+    Chunks never split a section unless that section alone exceeds
+    ``max_chars``.
+    """
+
+    max_chars = max(1, int(max_chars))
+    overlap_chars = max(0, min(int(overlap_chars), max_chars // 2))
+    units: List[str] = []
+    for section in split_sections(content):
+        units.extend(_split_oversized(section, max_chars))
+
+    packed: List[str] = []
+    buf = ""
+    for unit in units:
+        if buf and len(buf) + len(unit) > max_chars:
+            packed.append(buf)
+            buf = ""
+        buf += unit
+    if buf:
+        packed.append(buf)
+
+    chunks: List[str] = []
+    for idx, body in enumerate(packed):
+        prefix = _overlap_tail(packed[idx - 1], overlap_chars) if idx > 0 else ""
+        chunks.append(prefix + body)
+    return chunks
+
+
+def _norm(value: Any) -> str:
+    return _WS_RE.sub(" ", str(value or "")).strip().lower()
+
+
+def event_dedup_keys(event: Dict[str, Any]) -> Tuple[str, Tuple[str, Tuple[str, ...]]]:
+    """Return (evidence key, claim+numbers key) used to detect chunk overlap duplicates."""
+
+    numbers = tuple(sorted(_norm(x) for x in (event.get("numbers") or []) if _norm(x)))
+    return _norm(event.get("evidence_span")), (_norm(event.get("claim")), numbers)
+
+
+def merge_chunk_events(partials: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge per-chunk event lists in chunk order, dropping overlap duplicates.
+
+    Two events are duplicates when their normalized evidence spans match, or
+    when both claim and numbers match. The first occurrence wins, so the
+    output only depends on chunk order.
+    """
+
+    seen_spans: set[str] = set()
+    seen_claims: set[Tuple[str, Tuple[str, ...]]] = set()
+    merged: List[Dict[str, Any]] = []
+    for events in partials:
+        for ev in events or []:
+            if not isinstance(ev, dict):
+                continue
+            span_key, claim_key = event_dedup_keys(ev)
+            if (span_key and span_key in seen_spans) or (claim_key[0] and claim_key in seen_claims):
+                continue
+            if span_key:
+                seen_spans.add(span_key)
+            if claim_key[0]:
+                seen_claims.add(claim_key)
+            merged.append(ev)
+    return merged
@@ -8,7 +8,7 @@ from pr_flow_agents.graph.ingestion import nodes
 from pr_flow_agents.graph.ingestion.state import IngestionState
 
 
-def build_graph():
+def build_graph(checkpointer=None):
     builder = StateGraph(IngestionState)
 
     builder.add_node("load_press_release", nodes.load_press_release)
@@ -18,6 +18,8 @@ def build_graph():
     builder.add_node("configure_experts", nodes.configure_experts)
     builder.add_node("configure_unsupported", nodes.configure_unsupported)
 
+    builder.add_node("strip_release_boilerplate", nodes.strip_release_boilerplate)
+    builder.add_node("check_memo", nodes.check_memo)
     builder.add_node("run_extractor", nodes.run_extractor)
     builder.add_node("validate_events", nodes.validate_events)
     builder.add_node("run_expert_review", nodes.run_expert_review)
@@ -37,6 +39,9 @@ def build_graph():
             return "configure_aviation_agent"
         return "configure_unsupported"
 
+    def _route_after_memo(state: IngestionState) -> str:
+        return "finalize_output" if state.get("memo_hit") else "run_extractor"
+
     def _route_after_review(state: IngestionState) -> str:
         status = state.get("loop_status")
         if status in {"ACCEPT", "NO_CHANGE", "MAX_HOPS", "ERROR"}:
@@ -64,7 +69,19 @@ def build_graph():
 
     builder.add_edge("configure_biotech_agent", "configure_experts")
     builder.add_edge("configure_aviation_agent", "configure_experts")
-    builder.add_edge("configure_experts", "run_extractor")
+    # Stripping runs before the memo check: the learned boilerplate rule
+    # depends on the ticker's other releases, so the memo key covers the
+    # stripped prompt text rather than the rules alone.
+    builder.add_edge("configure_experts", "strip_release_boilerplate")
+    builder.add_edge("strip_release_boilerplate", "check_memo")
+    builder.add_conditional_edges(
+        "check_memo",
+        _route_after_memo,
+        {
+            "run_extractor": "run_extractor",
+            "finalize_output": "finalize_output",
+        },
+    )
 
     builder.add_edge("run_extractor", "validate_events")
     builder.add_edge("validate_events", "run_expert_review")
@@ -83,4 +100,4 @@ def build_graph():
     builder.add_edge("configure_unsupported", "finalize_output")
     builder.add_edge("finalize_output", END)
 
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
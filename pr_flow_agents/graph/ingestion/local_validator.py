@@ -0,0 +1,161 @@
+"""Deterministic local validation pass run before the LLM validator.
+
+Applies the mechanical rules of VALIDATOR_PROMPT_TEMPLATE without a model
+call: verbatim evidence spans, numbers contained in the span, allowed event
+types, date formats and confidence labels. Events are repaired when the fix
+is unambiguous and dropped otherwise.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+import re
+from typing import Any, Dict, List, Optional
+
+from pr_flow_agents.graph.ingestion.text_index import TextIndex, normalize_text
+
+ALLOWED_EVENT_TYPES = (
+    "FINANCIAL",
+    "REGULATORY",
+    "CLINICAL_TRIAL",
+    "OPERATIONAL",
+    "PRODUCT_LAUNCH",
+    "PARTNERSHIP",
+    "M_AND_A",
+    "LEADERSHIP",
+    "LEGAL",
+    "STRATEGIC",
+    "OTHER",
+)
+ALLOWED_CONFIDENCE = ("HIGH", "MEDIUM")
+
+EVENT_TYPE_ALIASES: Dict[str, str] = {
+    "M&A": "M_AND_A",
+    "MNA": "M_AND_A",
+    "M_A": "M_AND_A",
+    "MERGER": "M_AND_A",
+    "ACQUISITION": "M_AND_A",
+    "CLINICAL": "CLINICAL_TRIAL",
+    "PRODUCT": "PRODUCT_LAUNCH",
+    "PARTNERSHIPS": "PARTNERSHIP",
+}
+
+_DAY_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_QUARTER_RE = re.compile(r"^\d{4}-Q[1-4]$")
+_YEAR_RE = re.compile(r"^\d{4}$")
+_QUARTER_LOOSE_RE = re.compile(r"^(?:(\d{4})\s*[- ]?\s*Q([1-4])|Q([1-4])\s*[- ]?\s*(?:FY)?\s*(\d{4}))$", re.IGNORECASE)
+
+
+@dataclass
+class LocalValidationResult:
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    drops: List[Dict[str, Any]] = field(default_factory=list)
+    repairs: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        """True when every candidate passed without a drop or repair."""
+        return not self.drops and not self.repairs
+
+
+def normalize_event_type(value: Any) -> Optional[str]:
+    raw = str(value or "").strip().upper()
+    if raw in ALLOWED_EVENT_TYPES:
+        return raw
+    key = re.sub(r"[\s/-]+", "_", raw)
+    if key in ALLOWED_EVENT_TYPES:
+        return key
+    return EVENT_TYPE_ALIASES.get(raw) or EVENT_TYPE_ALIASES.get(key)
+
+
+def is_valid_event_date(value: Any) -> bool:
+    if value is None:
+        return True
+    raw = str(value)
+    m = _DAY_RE.match(raw)
+    if m:
+        try:
+            date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            return True
+        except ValueError:
+            return False
+    return bool(_QUARTER_RE.match(raw) or _YEAR_RE.match(raw))
+
+
+def normalize_event_date(value: Any) -> Optional[str]:
+    """Best-effort repair to YYYY-MM-DD / YYYY-QN / YYYY; None when unparseable."""
+
+    if value is None:
+        return None
+    raw = str(value).strip()
+    if is_valid_event_date(raw):
+        return raw
+    m = _QUARTER_LOOSE_RE.match(raw)
+    if m:
+        year = m.group(1) or m.group(4)
+        quarter = m.group(2) or m.group(3)
+        return f"{year}-Q{quarter}"
+    if len(raw) >= 10 and is_valid_event_date(raw[:10]) and raw[10:11] in {"T", " "}:
+        return raw[:10]
+    return None
+
+
+def validate_locally(
+    candidates: List[Dict[str, Any]],
+    index: TextIndex,
+    *,
+    start_index: int = 0,
+) -> LocalValidationResult:
+    """Validate candidates against the release text held by ``index``.
+
+    ``start_index`` offsets the reported ``event_index`` so callers validating
+    chunks can keep indices aligned with the merged candidate list.
+    """
+
+    result = LocalValidationResult()
+    for offset, ev in enumerate(candidates):
+        idx = start_index + offset
+        if not isinstance(ev, dict):
+            result.drops.append({"event_index": idx, "reason": "not_an_object"})
+            continue
+        event = dict(ev)
+
+        event_type = normalize_event_type(event.get("event_type"))
+        if not event_type:
+            result.drops.append({"event_index": idx, "reason": "invalid_event_type"})
+            continue
+        if event_type != event.get("event_type"):
+            result.repairs.append({"event_index": idx, "field": "event_type", "reason": "normalized_event_type"})
+            event["event_type"] = event_type
+
+        confidence = str(event.get("confidence") or "").strip().upper()
+        if confidence not in ALLOWED_CONFIDENCE:
+            result.drops.append({"event_index": idx, "reason": "low_or_missing_confidence"})
+            continue
+        if confidence != event.get("confidence"):
+            result.repairs.append({"event_index": idx, "field": "confidence", "reason": "normalized_confidence"})
+            event["confidence"] = confidence
+
+        if not is_valid_event_date(event.get("event_date")):
+            event["event_date"] = normalize_event_date(event.get("event_date"))
+            result.repairs.append({"event_index": idx, "field": "event_date", "reason": "invalid_event_date_format"})
+
+        span = str(event.get("evidence_span") or "")
+        resolved = index.resolve(span)
+        if not resolved:
+            result.drops.append({"event_index": idx, "reason": "evidence_span_not_found"})
+            continue
+        if resolved != span:
+            result.repairs.append({"event_index": idx, "field": "evidence_span", "reason": "span_repaired_to_verbatim"})
+            event["evidence_span"] = resolved
+
+        numbers = [str(x) for x in (event.get("numbers") or []) if str(x).strip()]
+        span_norm = normalize_text(resolved)
+        kept = [n for n in numbers if n in resolved or normalize_text(n) in span_norm]
+        if len(kept) != len(numbers) or not isinstance(event.get("numbers"), list):
+            result.repairs.append({"event_index": idx, "field": "numbers", "reason": "numbers_not_in_span_removed"})
+        event["numbers"] = kept
+
+        result.events.append(event)
+    return result
@@ -0,0 +1,69 @@
+"""Content-hash memo keys for ingestion graph output.
+
+A memo key covers everything that determines the graph result: the release
+body, the sector route, the prompt templates and the model used per stage.
+Editing any prompt template or model routing therefore invalidates old memos
+without a manual version bump.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any, Dict
+
+from pr_flow_agents.graph.ingestion import prompts
+
+# Bump when node logic changes in a way that should invalidate stored output.
+MEMO_SCHEMA_VERSION = 1
+
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def normalize_content(content: str) -> str:
+    """Normalize line endings and trailing whitespace only.
+
+    Evidence spans must stay verbatim substrings of every release that shares
+    a memo, so in-line text (quotes, inner whitespace) is left untouched.
+    """
+
+    text = (content or "").replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    return _BLANK_RUN_RE.sub("\n\n", text).strip()
+
+
+def content_hash(content: str) -> str:
+    return _sha256(normalize_content(content))
+
+
+def prompt_versions() -> Dict[str, str]:
+    """Short digest of every prompt template defined in the prompts module."""
+
+    return {
+        name: _sha256(value)[:12]
+        for name, value in sorted(vars(prompts).items())
+        if name.isupper() and isinstance(value, str)
+    }
+
+
+def memo_key(
+    *,
+    content: str,
+    route: str,
+    model_routing: Dict[str, str],
+    extra: Dict[str, Any] | None = None,
+) -> str:
+    payload = {
+        "schema": MEMO_SCHEMA_VERSION,
+        "content": content_hash(content),
+        "route": route,
+        "prompts": prompt_versions(),
+        "models": dict(sorted(model_routing.items())),
+        "extra": extra or {},
+    }
+    return _sha256(json.dumps(payload, sort_keys=True, ensure_ascii=True))
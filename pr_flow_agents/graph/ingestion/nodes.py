@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import json
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from pr_flow_agents.graph.checkpointing import checkpointer_mode, new_run_id
+from pr_flow_agents.graph.ingestion.boilerplate import (
+    StrippedContent,
+    paragraph_fingerprints,
+    strip_boilerplate,
+)
+from pr_flow_agents.graph.ingestion.chunking import (
+    CHUNK_MAX_CHARS,
+    CHUNK_OVERLAP_CHARS,
+    CHUNK_THRESHOLD_CHARS,
+    chunk_markdown,
+    merge_chunk_events,
+    should_chunk,
+)
+from pr_flow_agents.graph.ingestion.local_validator import validate_locally
+from pr_flow_agents.graph.ingestion.memo import content_hash, memo_key, prompt_versions
+from pr_flow_agents.graph.ingestion.packing import PACK_MAX_DOC_CHARS, ExtractionPacker
 from pr_flow_agents.graph.ingestion.prompts import (
     AVIATION_SYSTEM_PROMPT,
     BIOTECH_SYSTEM_PROMPT,
@@ -19,15 +40,52 @@ from pr_flow_agents.graph.ingestion.prompts import (
     REGULATORY_EXPERT_PROMPT,
     VALIDATOR_PROMPT_TEMPLATE,
 )
+from pr_flow_agents.graph.ingestion.revision import apply_patch, build_patch_prompt, plan_revision
+from pr_flow_agents.graph.ingestion.review_trace import diff_by_expert, diff_events, merge_expert_feedback
+from pr_flow_agents.graph.ingestion.severity import apply_advisories, classify_feedback
 from pr_flow_agents.graph.ingestion.state import IngestionState
-from pr_flow_agents.llm import generate_json
+from pr_flow_agents.graph.ingestion.text_index import TextIndex, locate_evidence
+from pr_flow_agents.llm import DEFAULT_MODEL, generate_json
 from pr_flow_agents.logging_utils import get_logger
+from pr_flow_agents.storage.boilerplate_store import BoilerplateStore
 from pr_flow_agents.storage.company_store import CompanyStore
+from pr_flow_agents.storage.ingestion_memo_store import IngestionMemoStore
+from pr_flow_agents.storage.models import BoilerplateSavingsDocument, IngestionMemoDocument
 from pr_flow_agents.storage.mongo_store import MongoStore
+from pr_flow_agents.storage.run_blob_store import RunBlobStore, digest_of
 
 logger = get_logger(__name__)
 
 MAX_HOPS_DEFAULT = 2
+# Upper bound on concurrent LLM calls issued by a single node.
+MAX_PARALLEL_LLM_CALLS = 4
+# When True, the LLM validator is skipped if every candidate passes the local
+# validator untouched. Overridable per run via state["local_validator_strict"].
+LOCAL_VALIDATOR_STRICT_DEFAULT = False
+# Strip disclaimers/about/contact boilerplate before prompting. Overridable per
+# run via state["strip_boilerplate"].
+STRIP_BOILERPLATE_DEFAULT = True
+# Pack short first-hop extractions from concurrent runs into one call. Off for
+# single runs (there is nothing to pack with); batch runs opt in via
+# state["pack_short_releases"].
+PACK_SHORT_RELEASES_DEFAULT = False
+# Finish the loop instead of re-extracting when expert feedback is advisory
+# only (see severity.py). Overridable per run via state["severity_gate"].
+SEVERITY_GATE_DEFAULT = True
+# How a REVISE hop re-runs the extractor: "patch" sends only the events the
+# feedback refers to and merges the returned edits (see revision.py); "full"
+# re-extracts the whole list. Overridable per run via state["revision_mode"].
+REVISION_MODES = ("patch", "full")
+REVISION_MODE_DEFAULT = "patch"
+
+# Model used per LLM stage. Part of the memo key, so changing a model here
+# invalidates memoized ingestion output.
+MODEL_ROUTING: Dict[str, str] = {
+    "extractor": DEFAULT_MODEL,
+    "validator": DEFAULT_MODEL,
+    "expert_review": DEFAULT_MODEL,
+}
+MEMOIZABLE_LOOP_STATUSES = {"ACCEPT", "NO_CHANGE", "MAX_HOPS"}
 
 SECTOR_NORMALIZATION: Dict[str, str] = {
     "biotech": "biotech",
@@ -94,17 +152,140 @@ def _stable_json(value: Any) -> str:
     return json.dumps(value, sort_keys=True, ensure_ascii=True)
 
 
+def _digest(value: Any) -> str:
+    return hashlib.sha256(_stable_json(value).encode("utf-8")).hexdigest()
+
+
 def _mlflow_enabled() -> bool:
     return mlflow is not None and mlflow.active_run() is not None
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _parallel_map(fn: Callable[[_T], _R], items: List[_T], max_workers: int = MAX_PARALLEL_LLM_CALLS) -> List[_R]:
+    """Map ``fn`` over ``items`` on a bounded thread pool, preserving input order."""
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        return list(pool.map(fn, items))
+
+
+@lru_cache(maxsize=8)
+def _content_chunks(content: str) -> tuple[str, ...]:
+    """Chunks for long releases (empty for single-shot extraction).
+
+    Chunking is a pure function of the content, so state only records
+    ``chunk_count`` and nodes re-derive the chunks instead of checkpointing
+    another full copy of the release.
+    """
+    if not should_chunk(content, CHUNK_THRESHOLD_CHARS):
+        return ()
+    chunks = chunk_markdown(content, max_chars=CHUNK_MAX_CHARS, overlap_chars=CHUNK_OVERLAP_CHARS)
+    return tuple(chunks) if len(chunks) >= 2 else ()
+
+
+@lru_cache(maxsize=1)
+def _blob_store() -> RunBlobStore:
+    # Blobs must outlive the process only when a checkpoint may be resumed.
+    return RunBlobStore(durable=checkpointer_mode() != "off")
+
+
+def _put_blob(state: IngestionState, value: Any) -> str:
+    return _blob_store().put(value, run_id=str(state.get("run_id") or ""))
+
+
+def release_run_blobs(run_id: str) -> None:
+    """Drop the in-process payloads of a finished, failed or cancelled run.
+
+    Callers invoke this after the graph returns or raises, so payloads never
+    outlive their run in long-lived processes.
+    """
+    _blob_store().release(str(run_id or ""))
+
+
+def _content(state: IngestionState) -> str:
+    return str(_blob_store().get(state.get("content_ref"), "") or "")
+
+
+def _prompt_content(state: IngestionState) -> str:
+    """Release body as sent to prompts (boilerplate stripped when enabled)."""
+    if state.get("prompt_content_ref"):
+        return str(_blob_store().get(state.get("prompt_content_ref"), "") or "")
+    return _content(state)
+
+
+def _stripped(state: IngestionState) -> Optional[StrippedContent]:
+    """Offset map from the prompt text back to the release, if boilerplate was stripped."""
+    if not state.get("prompt_content_ref") or not state.get("boilerplate_ref"):
+        return None
+    return StrippedContent.from_dict(_prompt_content(state), _blob_store().get(state.get("boilerplate_ref"), {}) or {})
+
+
+def _events(state: IngestionState, key: str) -> List[Any]:
+    return list(_blob_store().get(state.get(key), []) or [])  # type: ignore[arg-type]
+
+
+def _materialize_trace(trace: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Replace the validated_events_ref snapshot handle with the event list it points to.
+
+    Later hops stay as ``validated_diff`` entries; see ``review_trace``.
+    """
+    out: List[Dict[str, Any]] = []
+    for entry in trace:
+        if "validated_events_ref" in entry:
+            entry = dict(entry)
+            entry["validated_events"] = list(_blob_store().get(entry.pop("validated_events_ref"), []) or [])
+        out.append(entry)
+    return out
+
+
+def _slim_trace(state: IngestionState, trace: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Inverse of ``_materialize_trace`` for a trace loaded from the memo store."""
+    out: List[Dict[str, Any]] = []
+    for entry in trace:
+        if isinstance(entry.get("validated_events"), list):
+            entry = dict(entry)
+            ref = _put_blob(state, entry.pop("validated_events"))
+            entry["validated_events_ref"] = ref
+            entry.setdefault("validated_digest", digest_of(ref))
+        out.append(entry)
+    return out
+
+
+def _log_llm_usage(
+    stage: str,
+    hop: int,
+    prompt_chars: int,
+    started: float,
+    calls: int = 1,
+    output_chars: Optional[int] = None,
+) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    logger.info(
+        "%s_llm_usage hop=%s calls=%s prompt_chars=%s output_chars=%s elapsed_ms=%.1f",
+        stage,
+        hop,
+        calls,
+        prompt_chars,
+        output_chars,
+        elapsed_ms,
+    )
+    if _mlflow_enabled():
+        mlflow.log_metric(f"{stage}_prompt_chars", float(prompt_chars), step=hop)
+        mlflow.log_metric(f"{stage}_llm_calls", float(calls), step=hop)
+        mlflow.log_metric(f"{stage}_latency_ms", elapsed_ms, step=hop)
+        if output_chars is not None:
+            mlflow.log_metric(f"{stage}_output_chars", float(output_chars), step=hop)
+
+
 @_trace(span_type="CHAIN", name="load_press_release")
 def load_press_release(state: IngestionState) -> IngestionState:
     press_release_id = (state.get("press_release_id") or "").strip()
     if not press_release_id:
         logger.warning("load_press_release_missing_id")
         return {
-            **state,
             "route": "unsupported",
             "error": "press_release_id is required",
             "loop_status": "ERROR",
@@ -122,7 +303,6 @@ def load_press_release(state: IngestionState) -> IngestionState:
     if not doc:
         logger.warning("load_press_release_not_found id=%s", press_release_id)
         return {
-            **state,
             "route": "unsupported",
             "error": f"press_release_id not found: {press_release_id}",
             "loop_status": "ERROR",
@@ -133,12 +313,14 @@ def load_press_release(state: IngestionState) -> IngestionState:
     content = str(raw.get("markdown_content") or "")
     ts = doc.get("press_release_timestamp")
     ts_iso = ts.isoformat() if isinstance(ts, datetime) else str(ts or "")
+    # The body lives in the run blob store and state only carries its handle;
+    # the mapped doc refers to crawl_results by _id instead of carrying a
+    # second copy through every state snapshot and checkpoint.
     mapped_doc = {
         "_id": str(doc.get("_id") or press_release_id),
         "ticker": ticker,
         "title": str(doc.get("title") or ""),
         "press_release_timestamp": ts_iso,
-        "raw_result": {"markdown_content": content},
     }
 
     logger.info("load_press_release_done id=%s ticker=%s content_chars=%s", press_release_id, ticker, len(content))
@@ -148,12 +330,14 @@ def load_press_release(state: IngestionState) -> IngestionState:
         mlflow.log_param("title", str(doc.get("title") or ""))
         mlflow.log_param("press_release_timestamp", ts_iso)
         mlflow.log_metric("press_release_chars", float(len(content)))
+    run_id = str(state.get("run_id") or "") or new_run_id()
     return {
-        **state,
+        "run_id": run_id,
         "press_release": mapped_doc,
         "ticker": ticker,
         "press_release_timestamp": ts_iso,
-        "press_release_content": content,
+        "content_ref": _blob_store().put(content, run_id=run_id),
+        "content_chars": len(content),
         "error": None,
         "loop_status": "PENDING",
     }
@@ -164,7 +348,7 @@ def route_sector(state: IngestionState) -> IngestionState:
     ticker = (state.get("ticker") or "").strip().upper()
     if not ticker:
         logger.warning("route_sector_missing_ticker")
-        return {**state, "route": "unsupported", "error": "ticker is required", "loop_status": "ERROR"}
+        return {"route": "unsupported", "error": "ticker is required", "loop_status": "ERROR"}
 
     company = CompanyStore().get(ticker) or {}
     raw_sector = str(company.get("sector") or "").strip().lower()
@@ -173,7 +357,6 @@ def route_sector(state: IngestionState) -> IngestionState:
     if not canonical:
         logger.warning("route_sector_unsupported ticker=%s raw_sector=%s", ticker, raw_sector)
         return {
-            **state,
             "sector": raw_sector or None,
             "route": "unsupported",
             "error": f"Unsupported or missing sector for ticker {ticker}",
@@ -184,13 +367,12 @@ def route_sector(state: IngestionState) -> IngestionState:
     if _mlflow_enabled():
         mlflow.log_param("sector_raw", raw_sector)
         mlflow.log_param("sector_route", canonical)
-    return {**state, "ticker": ticker, "sector": raw_sector, "route": canonical, "error": None, "loop_status": "PENDING"}
+    return {"ticker": ticker, "sector": raw_sector, "route": canonical, "error": None, "loop_status": "PENDING"}
 
 
 @_trace(span_type="CHAIN", name="configure_biotech_agent")
 def configure_biotech_agent(state: IngestionState) -> IngestionState:
     return {
-        **state,
         "agent_name": "sector_event_extractor",
         "system_prompt": BIOTECH_SYSTEM_PROMPT,
         "agent_config": {"sector": "biotech"},
@@ -200,7 +382,6 @@ def configure_biotech_agent(state: IngestionState) -> IngestionState:
 @_trace(span_type="CHAIN", name="configure_aviation_agent")
 def configure_aviation_agent(state: IngestionState) -> IngestionState:
     return {
-        **state,
         "agent_name": "sector_event_extractor",
         "system_prompt": AVIATION_SYSTEM_PROMPT,
         "agent_config": {"sector": "aviation"},
@@ -210,122 +391,583 @@ def configure_aviation_agent(state: IngestionState) -> IngestionState:
 @_trace(span_type="CHAIN", name="configure_unsupported")
 def configure_unsupported(state: IngestionState) -> IngestionState:
     return {
-        **state,
         "agent_name": "unsupported",
         "system_prompt": "",
         "agent_config": {"sector": "unsupported"},
         "experts": [],
-        "candidate_events": [],
-        "validated_events": [],
         "final_events": [],
     }
 
 
 @_trace(span_type="CHAIN", name="configure_experts")
 def configure_experts(state: IngestionState) -> IngestionState:
+    logger.info("configure_experts_done content_chars=%s", state.get("content_chars"))
     if _mlflow_enabled():
         mlflow.log_param("max_hops", int(state.get("max_hops") or MAX_HOPS_DEFAULT))
         mlflow.log_param("experts", ",".join(EXPERTS))
     return {
-        **state,
         "experts": list(EXPERTS),
         "hop_count": 0,
         "max_hops": int(state.get("max_hops") or MAX_HOPS_DEFAULT),
-        "candidate_events": state.get("candidate_events", []),
         "expert_feedback": state.get("expert_feedback", {}),
-        "validated_events": state.get("validated_events", []),
         "review_trace": state.get("review_trace", []),
         "loop_status": "PENDING",
-        "final_events": state.get("final_events", []),
     }
 
 
-@_trace(span_type="CHAIN", name="run_extractor")
-def run_extractor(state: IngestionState) -> IngestionState:
-    hop_count = int(state.get("hop_count") or 0) + 1
-    max_hops = int(state.get("max_hops") or MAX_HOPS_DEFAULT)
-    content = state.get("press_release_content") or ""
+def _memo_key_for(state: IngestionState) -> str:
+    return memo_key(
+        content=_content(state),
+        route=str(state.get("route") or ""),
+        model_routing=MODEL_ROUTING,
+        extra={
+            "max_hops": int(state.get("max_hops") or MAX_HOPS_DEFAULT),
+            "local_validator_strict": bool(state.get("local_validator_strict", LOCAL_VALIDATOR_STRICT_DEFAULT)),
+            "revision_mode": str(state.get("revision_mode") or REVISION_MODE_DEFAULT),
+            "severity_gate": bool(state.get("severity_gate", SEVERITY_GATE_DEFAULT)),
+            # The stripped text, not just the rules: learned boilerplate
+            # depends on how many other releases of the ticker share a
+            # paragraph, so the same release can strip differently over time.
+            "prompt_content": content_hash(_prompt_content(state)) if state.get("prompt_content_ref") else None,
+            "pack_short_releases": bool(
+                PACK_SHORT_RELEASES_DEFAULT
+                if state.get("pack_short_releases") is None
+                else state.get("pack_short_releases")
+            ),
+        },
+    )
+
+
+@_trace(span_type="CHAIN", name="check_memo")
+def check_memo(state: IngestionState) -> IngestionState:
+    key = _memo_key_for(state)
+    if state.get("force"):
+        logger.info("check_memo_forced press_release_id=%s memo_key=%s", state.get("press_release_id"), key)
+        return {"memo_key": key, "memo_hit": False}
+
+    try:
+        memo = IngestionMemoStore().get(key)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("check_memo_lookup_failed memo_key=%s error=%s", key, exc)
+        memo = None
+    if not memo:
+        logger.info("check_memo_miss press_release_id=%s memo_key=%s", state.get("press_release_id"), key)
+        return {"memo_key": key, "memo_hit": False}
+
+    final_events = list(memo.get("final_events") or [])
+    logger.info(
+        "check_memo_hit press_release_id=%s memo_key=%s source_press_release_id=%s events=%s",
+        state.get("press_release_id"),
+        key,
+        memo.get("source_press_release_id"),
+        len(final_events),
+    )
+    if _mlflow_enabled():
+        mlflow.log_param("memo_hit", True)
+        mlflow.log_param("memo_source_press_release_id", str(memo.get("source_press_release_id") or ""))
+    return {
+        "memo_key": key,
+        "memo_hit": True,
+        "hop_count": int(memo.get("hop_count") or 0),
+        "loop_status": str(memo.get("loop_status") or "ACCEPT"),  # type: ignore[typeddict-item]
+        "validated_events_ref": _put_blob(state, final_events),
+        "review_trace": _slim_trace(state, list(memo.get("review_trace") or [])),
+        "error": None,
+    }
+
+
+def _store_memo(
+    state: IngestionState, final_events: List[Dict[str, Any]], review_trace: List[Dict[str, Any]]
+) -> None:
+    key = state.get("memo_key")
+    loop_status = str(state.get("loop_status") or "")
+    if not key or state.get("memo_hit") or state.get("error") or loop_status not in MEMOIZABLE_LOOP_STATUSES:
+        return
+    content = _content(state)
+    try:
+        IngestionMemoStore().put(
+            IngestionMemoDocument(
+                memo_key=key,
+                content_hash=content_hash(content),
+                route=str(state.get("route") or ""),
+                prompt_versions=prompt_versions(),
+                model_routing=dict(MODEL_ROUTING),
+                source_press_release_id=str(state.get("press_release_id") or ""),
+                loop_status=loop_status,
+                hop_count=int(state.get("hop_count") or 0),
+                final_events=list(final_events),
+                review_trace=review_trace,
+            )
+        )
+        logger.info("store_memo_done memo_key=%s press_release_id=%s", key, state.get("press_release_id"))
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("store_memo_failed memo_key=%s error=%s", key, exc)
+
+
+@_trace(span_type="CHAIN", name="strip_release_boilerplate")
+def strip_release_boilerplate(state: IngestionState) -> IngestionState:
+    content = _content(state)
+    if not state.get("strip_boilerplate", STRIP_BOILERPLATE_DEFAULT):
+        chunks = _content_chunks(content)
+        return {"chunk_count": len(chunks)}
+
+    press_release_id = str(state.get("press_release_id") or "")
+    ticker = str(state.get("ticker") or "")
+    route = str(state.get("route") or "")
+    fingerprints = paragraph_fingerprints(content)
+    store: Optional[BoilerplateStore] = None
+    doc_counts: Dict[str, int] = {}
+    try:
+        store = BoilerplateStore()
+        doc_counts = store.doc_counts(scope=ticker, fingerprints=fingerprints, exclude_release_id=press_release_id)
+    except Exception as exc:  # noqa: BLE001
+        # Pattern rules still apply without learned frequencies.
+        logger.warning("strip_boilerplate_stats_unavailable ticker=%s error=%s", ticker, exc)
+        store = None
+
+    stripped = strip_boilerplate(content, doc_counts=doc_counts)
+    by_reason: Dict[str, int] = {}
+    for section in stripped.removed:
+        by_reason[section["reason"]] = by_reason.get(section["reason"], 0) + int(section["end"]) - int(section["start"])
+
+    if store is not None:
+        try:
+            store.record(scope=ticker, fingerprints=fingerprints, press_release_id=press_release_id)
+            store.record_savings(
+                BoilerplateSavingsDocument(
+                    press_release_id=press_release_id,
+                    ticker=ticker,
+                    sector=route,
+                    original_chars=stripped.original_chars,
+                    stripped_chars=len(stripped.text),
+                    removed_sections=len(stripped.removed),
+                    removed_by_reason=by_reason,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("strip_boilerplate_record_failed press_release_id=%s error=%s", press_release_id, exc)
+
+    chunks = _content_chunks(stripped.text)
+    logger.info(
+        "strip_boilerplate_done press_release_id=%s sector=%s original_chars=%s stripped_chars=%s removed=%s saved_tokens_est=%s chunks=%s",
+        press_release_id,
+        route,
+        stripped.original_chars,
+        len(stripped.text),
+        len(stripped.removed),
+        stripped.saved_tokens_est,
+        len(chunks),
+    )
+    if _mlflow_enabled():
+        mlflow.log_param("chunk_mode", bool(chunks))
+        mlflow.log_metric("content_chunks", float(len(chunks)))
+        mlflow.log_metric("boilerplate_removed_chars", float(stripped.removed_chars))
+        mlflow.log_metric("boilerplate_saved_tokens_est", float(stripped.saved_tokens_est))
+        for reason, chars in by_reason.items():
+            mlflow.log_metric(f"boilerplate_removed_chars_{reason}", float(chars))
+    return {
+        "chunk_count": len(chunks),
+        "prompt_content_ref": _put_blob(state, stripped.text),
+        "boilerplate_ref": _put_blob(state, stripped.to_dict()),
+        "boilerplate_removed_chars": stripped.removed_chars,
+    }
+
+
+def _extract_candidates(prompt: str) -> List[Dict[str, Any]]:
+    raw_out = generate_json(prompt, model=MODEL_ROUTING["extractor"])
+    return [ev for ev in raw_out if isinstance(ev, dict)] if isinstance(raw_out, list) else []
+
+
+@lru_cache(maxsize=1)
+def _packer() -> ExtractionPacker:
+    # Process-wide so that concurrent graph runs share packs.
+    return ExtractionPacker(lambda prompt: generate_json(prompt, model=MODEL_ROUTING["extractor"]))
+
+
+def _should_pack(state: IngestionState, hop_count: int, content: str, chunked: bool) -> bool:
+    enabled = state.get("pack_short_releases")
+    if enabled is None:
+        enabled = PACK_SHORT_RELEASES_DEFAULT
+    return bool(enabled) and hop_count == 1 and not chunked and len(content) <= PACK_MAX_DOC_CHARS
+
+
+def _validate_candidates(prompt: str) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    try:
+        raw_out = generate_json(prompt, model=MODEL_ROUTING["validator"])
+        out = raw_out if isinstance(raw_out, dict) else {}
+        validated_raw = out.get("validated_events", [])
+        drops_raw = out.get("drops", [])
+        validated = [ev for ev in validated_raw if isinstance(ev, dict)] if isinstance(validated_raw, list) else []
+        drops = [ev for ev in drops_raw if isinstance(ev, dict)] if isinstance(drops_raw, list) else []
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("validate_events_call_failed")
+        validated = []
+        drops = [{"reason": f"validator_failed: {exc}"}]
+    return validated, drops
+
+
+def _revise_with_patch(state: IngestionState, hop_count: int, max_hops: int, content: str) -> Optional[List[Dict[str, Any]]]:
+    """Patch-mode revise hop; None means fall back to full re-extraction."""
+
+    previous = _events(state, "validated_events_ref")
+    feedback = state.get("expert_feedback") or {}
+    plan = plan_revision(previous, feedback, EXPERT_PRIMARY_TYPES) if previous else None
+    if plan is None:
+        logger.info("run_extractor_patch_skipped hop=%s previous=%s", hop_count, len(previous))
+        return None
 
-    prompt = EXTRACTOR_PROMPT_TEMPLATE.format(
-        system_prompt=state.get("system_prompt", ""),
+    prompt = build_patch_prompt(
+        plan,
+        system_prompt=str(state.get("system_prompt", "")),
         hop_count=hop_count,
         max_hops=max_hops,
-        experts=state.get("experts", []),
-        expert_feedback=state.get("expert_feedback", {}),
+        expert_feedback=feedback,
         content=content,
     )
+    started = time.perf_counter()
+    try:
+        raw = generate_json(prompt, model=MODEL_ROUTING["extractor"])
+    except Exception:  # noqa: BLE001
+        logger.exception("run_extractor_patch_failed hop=%s", hop_count)
+        return None
+    _log_llm_usage("extractor", hop_count, len(prompt), started, output_chars=len(json.dumps(raw, ensure_ascii=True)))
+    result = apply_patch(plan, raw)
+    if result is None:
+        logger.warning("run_extractor_patch_malformed hop=%s", hop_count)
+        return None
+    logger.info(
+        "run_extractor_patch_done hop=%s previous=%s targets=%s updated=%s removed=%s added=%s ignored_ids=%s",
+        hop_count,
+        len(previous),
+        len(plan.targets),
+        len(result.updated),
+        len(result.removed),
+        result.added,
+        len(result.ignored_ids),
+    )
+    if _mlflow_enabled():
+        mlflow.log_metric("extractor_patch_targets", float(len(plan.targets)), step=hop_count)
+        mlflow.log_metric("extractor_patch_untouched", float(len(previous) - len(plan.targets)), step=hop_count)
+    return result.events
+
+
+@_trace(span_type="CHAIN", name="run_extractor")
+def run_extractor(state: IngestionState) -> IngestionState:
+    hop_count = int(state.get("hop_count") or 0) + 1
+    max_hops = int(state.get("max_hops") or MAX_HOPS_DEFAULT)
+    content = _prompt_content(state)
+    chunks = list(_content_chunks(content)) if state.get("chunk_count") else []
+
+    revision_mode = str(state.get("revision_mode") or REVISION_MODE_DEFAULT)
+    if hop_count > 1 and revision_mode == "patch" and not chunks:
+        patched = _revise_with_patch(state, hop_count, max_hops, content)
+        if patched is not None:
+            return {
+                "hop_count": hop_count,
+                "candidate_events_ref": _put_blob(state, patched),
+                "chunk_candidates_ref": _put_blob(state, []),
+                "loop_status": "PENDING",
+                "error": None,
+            }
 
+    prompts = [
+        EXTRACTOR_PROMPT_TEMPLATE.format(
+            system_prompt=state.get("system_prompt", ""),
+            hop_count=hop_count,
+            max_hops=max_hops,
+            experts=state.get("experts", []),
+            expert_feedback=state.get("expert_feedback", {}),
+            content=part,
+        )
+        for part in (chunks or [content])
+    ]
+
+    started = time.perf_counter()
+    packed: Optional[List[Dict[str, Any]]] = None
     try:
-        raw_out = generate_json(prompt)
-        candidate_events = raw_out if isinstance(raw_out, list) else []
-        logger.info("run_extractor_done hop=%s candidates=%s", hop_count, len(candidate_events))
+        if chunks:
+            # Map: one extractor call per chunk. A failed chunk only loses its
+            # own events; the hop errors out only when every chunk failed.
+            def _safe_extract(prompt: str) -> Optional[List[Dict[str, Any]]]:
+                try:
+                    return _extract_candidates(prompt)
+                except Exception:  # noqa: BLE001
+                    logger.exception("run_extractor_chunk_failed hop=%s", hop_count)
+                    return None
+
+            results = _parallel_map(_safe_extract, prompts)
+            if all(r is None for r in results):
+                raise RuntimeError("all extractor chunks failed")
+            chunk_candidates = [r or [] for r in results]
+            candidate_events = merge_chunk_events(chunk_candidates)
+        else:
+            chunk_candidates = []
+            if _should_pack(state, hop_count, content, bool(chunks)):
+                # Usage of the packed call is logged once by the packer.
+                packed = _packer().submit(
+                    group_key=str(state.get("route") or ""),
+                    doc_id=str(state.get("press_release_id") or ""),
+                    content=content,
+                    system_prompt=str(state.get("system_prompt", "")),
+                )
+                if _mlflow_enabled():
+                    mlflow.log_metric("extractor_packed", 1.0 if packed is not None else 0.0, step=hop_count)
+                if packed is None:
+                    logger.info("run_extractor_pack_fallback press_release_id=%s", state.get("press_release_id"))
+            if packed is not None:
+                candidate_events = packed
+            else:
+                candidate_events = _extract_candidates(prompts[0])
+        if packed is None:
+            _log_llm_usage(
+                "extractor",
+                hop_count,
+                sum(len(p) for p in prompts),
+                started,
+                calls=len(prompts),
+                output_chars=len(json.dumps(candidate_events, ensure_ascii=True)),
+            )
+        logger.info(
+            "run_extractor_done hop=%s candidates=%s chunks=%s packed=%s",
+            hop_count,
+            len(candidate_events),
+            len(chunks),
+            packed is not None,
+        )
         return {
-            **state,
             "hop_count": hop_count,
-            "candidate_events": candidate_events,
+            "candidate_events_ref": _put_blob(state, candidate_events),
+            "chunk_candidates_ref": _put_blob(state, chunk_candidates),
             "loop_status": "PENDING",
             "error": None,
         }
     except Exception as exc:  # noqa: BLE001
         logger.exception("run_extractor_failed hop=%s", hop_count)
         return {
-            **state,
             "hop_count": hop_count,
-            "candidate_events": [],
+            "candidate_events_ref": _put_blob(state, []),
+            "chunk_candidates_ref": _put_blob(state, []),
             "error": f"extractor_failed: {exc}",
             "loop_status": "ERROR",
         }
 
 
+def _candidate_drop(drop: Dict[str, Any], kept: List[int]) -> Dict[str, Any]:
+    """Rewrite an LLM drop's survivor position as a candidate index.
+
+    Positions the validator cannot have been given are kept under
+    ``llm_event_index`` instead of pointing at the wrong candidate.
+    """
+    out = dict(drop)
+    pos = out.pop("event_index", None)
+    if pos is None:
+        return out
+    try:
+        position = int(pos)
+    except (TypeError, ValueError):
+        position = -1
+    if 0 <= position < len(kept):
+        out["event_index"] = kept[position]
+    else:
+        out["llm_event_index"] = pos
+    return out
+
+
+@lru_cache(maxsize=8)
+def _text_index(content: str) -> TextIndex:
+    return TextIndex(content)
+
+
 @_trace(span_type="CHAIN", name="validate_events")
 def validate_events(state: IngestionState) -> IngestionState:
-    content = state.get("press_release_content") or ""
-    candidates = state.get("candidate_events", []) or []
-    prompt = VALIDATOR_PROMPT_TEMPLATE.format(
-        candidate_events=json.dumps(candidates, ensure_ascii=True),
-        content=content,
+    hop_count = int(state.get("hop_count") or 0)
+    content = _prompt_content(state)
+    candidates = _events(state, "candidate_events_ref")
+    chunks = list(_content_chunks(content)) if state.get("chunk_count") else []
+    chunk_candidates = _events(state, "chunk_candidates_ref")
+    strict = bool(state.get("local_validator_strict", LOCAL_VALIDATOR_STRICT_DEFAULT))
+
+    if chunks and len(chunk_candidates) == len(chunks):
+        # Each chunk's candidates are validated against the chunk they came
+        # from, then the validated lists are merged with the same dedup rules.
+        groups = [(i, chunks[i], evs) for i, evs in enumerate(chunk_candidates) if evs]
+    else:
+        groups = [(None, content, candidates)]
+
+    # Deterministic pass first: the LLM only sees candidates that survive it.
+    # Spans are checked against the text the extractor saw (the chunk, or the
+    # stripped body), then mapped back through the strip offset map: a span
+    # that bridges a removed section is not verbatim in the release.
+    stripped = _stripped(state)
+    prompt_index = _text_index(content)
+    drops: List[Dict[str, Any]] = []
+    repairs: List[Dict[str, Any]] = []
+    survivors_by_group: List[List[Dict[str, Any]]] = []
+    # Candidate index of each survivor, per group; the LLM validator reports
+    # drops by position in the survivor list it was given.
+    kept_by_group: List[List[int]] = []
+    for chunk_index, part, evs in groups:
+        local = validate_locally(evs, _text_index(part))
+        tag = {} if chunk_index is None else {"chunk_index": chunk_index}
+        dropped = {d["event_index"] for d in local.drops}
+        kept_indices = [i for i in range(len(evs)) if i not in dropped]
+        events: List[Dict[str, Any]] = []
+        kept: List[int] = []
+        for idx, ev in zip(kept_indices, local.events):
+            loc = prompt_index.find(str(ev.get("evidence_span") or "")) if stripped else None
+            if stripped and (loc is None or stripped.to_original(*loc) is None):
+                local.drops.append({"event_index": idx, "reason": "evidence_span_not_in_release"})
+                continue
+            events.append(ev)
+            kept.append(idx)
+        drops.extend({**d, **tag, "stage": "local"} for d in local.drops)
+        repairs.extend({**r, **tag} for r in local.repairs)
+        survivors_by_group.append(events)
+        kept_by_group.append(kept)
+    survivors = [ev for group in survivors_by_group for ev in group]
+    locally_clean = not drops and not repairs and len(merge_chunk_events([survivors])) == len(survivors)
+    skip_llm = not survivors or (strict and locally_clean)
+
+    llm_groups = [
+        (chunk_index, part, evs, kept)
+        for (chunk_index, part, _), evs, kept in zip(groups, survivors_by_group, kept_by_group)
+        if evs or chunk_index is None
+    ]
+    prompts = (
+        []
+        if skip_llm
+        else [
+            VALIDATOR_PROMPT_TEMPLATE.format(
+                candidate_events=json.dumps(evs, ensure_ascii=True),
+                content=part,
+            )
+            for _, part, evs, _ in llm_groups
+        ]
     )
+    saved_chars = len(json.dumps(candidates, ensure_ascii=True)) - len(json.dumps(survivors, ensure_ascii=True))
+    if skip_llm:
+        saved_chars = sum(
+            len(VALIDATOR_PROMPT_TEMPLATE) + len(part) + len(json.dumps(evs, ensure_ascii=True))
+            for _, part, evs in groups
+        )
 
-    try:
-        raw_out = generate_json(prompt)
-        out = raw_out if isinstance(raw_out, dict) else {}
-        validated_raw = out.get("validated_events", [])
-        drops_raw = out.get("drops", [])
-        validated = [ev for ev in validated_raw if isinstance(ev, dict)] if isinstance(validated_raw, list) else []
-        drops = [ev for ev in drops_raw if isinstance(ev, dict)] if isinstance(drops_raw, list) else []
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("validate_events_failed hop=%s", state.get("hop_count"))
-        validated = []
-        drops = [{"reason": f"validator_failed: {exc}"}]
+    started = time.perf_counter()
+    results = _parallel_map(_validate_candidates, prompts)
+    _log_llm_usage("validator", hop_count, sum(len(p) for p in prompts), started, calls=len(prompts))
+    if skip_llm:
+        validated = merge_chunk_events([survivors])
+    elif len(results) > 1:
+        validated = merge_chunk_events([v for v, _ in results])
+    else:
+        validated = results[0][0] if results else []
+    for (chunk_index, _, _, kept), (_, llm_drops) in zip(llm_groups, results):
+        tag = {} if chunk_index is None else {"chunk_index": chunk_index}
+        drops.extend({**_candidate_drop(d, kept), **tag, "stage": "llm"} for d in llm_drops)
+
+    logger.info(
+        "validate_events_local hop=%s candidates=%s survivors=%s local_drops=%s repairs=%s llm_skipped=%s saved_prompt_chars=%s",
+        hop_count,
+        len(candidates),
+        len(survivors),
+        sum(1 for d in drops if d.get("stage") == "local"),
+        len(repairs),
+        skip_llm,
+        saved_chars,
+    )
+    if _mlflow_enabled():
+        mlflow.log_metric("validator_local_drops", float(sum(1 for d in drops if d.get("stage") == "local")), step=hop_count)
+        mlflow.log_metric("validator_local_repairs", float(len(repairs)), step=hop_count)
+        mlflow.log_metric("validator_llm_skipped", 1.0 if skip_llm else 0.0, step=hop_count)
+        mlflow.log_metric("validator_saved_prompt_chars", float(max(0, saved_chars)), step=hop_count)
 
+    # The first hop snapshots the validated list as a blob handle; later hops
+    # store a diff against the previous hop (see review_trace).
+    validated_ref = _put_blob(state, validated)
+    entry: Dict[str, Any] = {
+        "hop": hop_count,
+        "candidate_count": len(candidates),
+        "validated_count": len(validated),
+        "dropped_count": len(drops),
+        "validated_digest": digest_of(validated_ref),
+        "drops": drops,
+        "repairs": repairs,
+        "llm_validator_skipped": skip_llm,
+    }
+    if state.get("validated_events_ref"):
+        entry["validated_diff"] = diff_events(_events(state, "validated_events_ref"), validated)
+    else:
+        entry["validated_events_ref"] = validated_ref
     trace = list(state.get("review_trace", []))
-    trace.append(
-        {
-            "hop": int(state.get("hop_count") or 0),
-            "candidate_count": len(candidates),
-            "validated_count": len(validated),
-            "dropped_count": len(drops),
-            "validated_events": validated,
-            "drops": drops,
+    trace.append(entry)
+
+    logger.info("validate_events_done hop=%s validated=%s dropped=%s", hop_count, len(validated), len(drops))
+    return {"validated_events_ref": validated_ref, "review_trace": trace}
+
+
+def _call_expert(expert_name: str, prompt: str) -> Dict[str, Any]:
+    try:
+        raw = generate_json(prompt, model=MODEL_ROUTING["expert_review"])
+        return raw if isinstance(raw, dict) else {}
+    except Exception as exc:  # noqa: BLE001
+        return {
+            "decision": "REVISE",
+            "summary": f"{expert_name} review failed: {exc}",
+            "issues": [f"{expert_name}: expert_review_failed"],
+            "suggestions": [],
+            "failed": True,
         }
-    )
 
-    logger.info("validate_events_done hop=%s validated=%s dropped=%s", state.get("hop_count"), len(validated), len(drops))
-    return {**state, "validated_events": validated, "review_trace": trace}
+
+def _fan_out_expert_reviews(
+    prompts: Dict[str, str],
+    *,
+    final_hop: bool,
+    severity_gate: bool = SEVERITY_GATE_DEFAULT,
+) -> tuple[Dict[str, Dict[str, Any]], set[str]]:
+    """Run expert reviews concurrently on a bounded pool.
+
+    On the final hop the loop ends in MAX_HOPS as soon as any expert asks for
+    a blocking revision, so reviews that have not started yet are cancelled.
+    With the severity gate on, an advisory-only REVISE does not cancel: the
+    hop can still finish by applying it, which needs every review.
+    Returns (feedback by expert, cancelled expert names).
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    cancelled: set[str] = set()
+    if not prompts:
+        return results, cancelled
+    if len(prompts) == 1:
+        name, prompt = next(iter(prompts.items()))
+        return {name: _call_expert(name, prompt)}, cancelled
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_LLM_CALLS, len(prompts))) as pool:
+        futures = {pool.submit(_call_expert, name, prompt): name for name, prompt in prompts.items()}
+        for fut in as_completed(futures):
+            if fut.cancelled():
+                continue
+            name = futures[fut]
+            feedback = fut.result()
+            results[name] = feedback
+            if final_hop and str(feedback.get("decision") or "REVISE").upper() != "ACCEPT" and (
+                not severity_gate or classify_feedback({name: feedback}).has_blocking
+            ):
+                for other, other_name in futures.items():
+                    if other_name not in results and other.cancel():
+                        cancelled.add(other_name)
+                if cancelled:
+                    logger.info("run_expert_review_cancelled experts=%s", ",".join(sorted(cancelled)))
+    return results, cancelled
 
 
 @_trace(span_type="CHAIN", name="run_expert_review")
 def run_expert_review(state: IngestionState) -> IngestionState:
     max_hops = int(state.get("max_hops") or MAX_HOPS_DEFAULT)
     hop_count = int(state.get("hop_count") or 0)
-    validated = state.get("validated_events", []) or []
+    validated = _events(state, "validated_events_ref")
 
-    content = state.get("press_release_content") or ""
+    content = _prompt_content(state)
     experts = state.get("experts", []) or []
     by_expert: Dict[str, Dict[str, Any]] = {}
-    issues: List[str] = []
-    suggestions: List[Dict[str, Any]] = []
-    any_revise = False
 
     # Route each event to its owning expert only.
     event_buckets: Dict[str, List[Dict[str, Any]]] = {}
@@ -345,6 +987,17 @@ def run_expert_review(state: IngestionState) -> IngestionState:
         # Keep one lightweight guard pass when no events are available.
         selected_experts = ["General"]
 
+    # Feedback from the previous review is reused for experts whose bucket is
+    # byte-for-byte unchanged since then.
+    trace = state.get("review_trace", []) or []
+    prev_review = next((t for t in reversed(trace) if "review_decision" in t), None) or {}
+    prev_digests = prev_review.get("expert_digests") or {}
+    prev_by_expert = (state.get("expert_feedback") or {}).get("by_expert") or {}
+    expert_digests: Dict[str, str] = {}
+    reused: Dict[str, Dict[str, Any]] = {}
+
+    # Build every expert call up front; the calls themselves are independent.
+    prompts: Dict[str, str] = {}
     for expert_name in selected_experts:
         template = EXPERT_PROMPT_BY_NAME.get(expert_name)
         if not template:
@@ -360,52 +1013,101 @@ def run_expert_review(state: IngestionState) -> IngestionState:
             }
             continue
 
+        digest = _digest(in_scope)
+        expert_digests[expert_name] = digest
+        prev_feedback = prev_by_expert.get(expert_name)
+        if (
+            prev_digests.get(expert_name) == digest
+            and isinstance(prev_feedback, dict)
+            and str(prev_feedback.get("decision") or "").upper() != "CANCELLED"
+            and not prev_feedback.get("failed")
+        ):
+            reused[expert_name] = prev_feedback
+            continue
+
         events_payload = json.dumps(
             {"in_scope": in_scope, "out_of_scope_for_miscategorization_check": []},
             ensure_ascii=True,
         )
-
-        prompt = template.format(
+        prompts[expert_name] = template.format(
             events=events_payload,
             content=content,
         )
-        try:
-            raw = generate_json(prompt)
-            feedback = raw if isinstance(raw, dict) else {}
-        except Exception as exc:  # noqa: BLE001
-            feedback = {
-                "decision": "REVISE",
-                "summary": f"{expert_name} review failed: {exc}",
-                "issues": [f"{expert_name}: expert_review_failed"],
+
+    started = time.perf_counter()
+    gate = bool(state.get("severity_gate", SEVERITY_GATE_DEFAULT))
+    results, cancelled = _fan_out_expert_reviews(prompts, final_hop=hop_count >= max_hops, severity_gate=gate)
+    results.update(reused)
+    if reused:
+        logger.info("run_expert_review_reused hop=%s experts=%s", hop_count, ",".join(sorted(reused)))
+    if _mlflow_enabled():
+        mlflow.log_metric("expert_review_reused", float(len(reused)), step=hop_count)
+    _log_llm_usage(
+        "expert_review",
+        hop_count,
+        sum(len(p) for name, p in prompts.items() if name not in cancelled),
+        started,
+        calls=len(prompts) - len(cancelled),
+    )
+
+    # Merge in the deterministic expert order regardless of completion order.
+    for expert_name in selected_experts:
+        if expert_name in cancelled:
+            by_expert[expert_name] = {
+                "decision": "CANCELLED",
+                "summary": "Skipped: hop budget reached and another expert already requested revision",
+                "issues": [],
                 "suggestions": [],
             }
-        by_expert[expert_name] = feedback
-        decision = str(feedback.get("decision") or "REVISE").upper()
-        if decision != "ACCEPT":
-            any_revise = True
-        for issue in feedback.get("issues", []) or []:
-            issues.append(f"{expert_name}: {issue}")
-        for suggestion in feedback.get("suggestions", []) or []:
-            if isinstance(suggestion, dict):
-                suggestions.append({"expert": expert_name, **suggestion})
-
-    feedback = {
-        "decision": "REVISE" if any_revise else "ACCEPT",
-        "summary": "Merged specialist feedback",
-        "issues": issues,
-        "suggestions": suggestions,
-        "by_expert": by_expert,
-    }
+            continue
+        if expert_name not in results:
+            continue
+        by_expert[expert_name] = results[expert_name]
+
+    feedback = merge_expert_feedback(by_expert)
     decision = feedback["decision"]
 
-    no_change = False
-    trace = state.get("review_trace", []) or []
-    if len(trace) >= 2:
-        prev = trace[-2].get("validated_events", [])
-        curr = trace[-1].get("validated_events", [])
-        no_change = _stable_json(prev) == _stable_json(curr)
+    # Compare this hop's validated events with the previous hop's by digest.
+    digests = [t["validated_digest"] for t in trace if t.get("validated_digest")]
+    no_change = len(digests) >= 2 and digests[-2] == digests[-1]
 
-    if decision == "ACCEPT":
+    # REVISE backed only by advisory suggestions: apply them here and finish
+    # instead of spending another extractor hop. Not used when experts were
+    # cancelled, since their review never happened.
+    severity = classify_feedback(by_expert)
+    advisory_exit = gate and decision != "ACCEPT" and not severity.has_blocking and not cancelled
+    applied: List[Dict[str, Any]] = []
+    unapplied: List[Dict[str, Any]] = []
+    update: Dict[str, Any] = {}
+    gate_entry: Dict[str, Any] = {}
+    if advisory_exit:
+        revised, applied, unapplied = apply_advisories(validated, severity.advisory)
+        # A suggestion that could not be applied leaves its problem in the
+        # events, so fall through to the usual hop decision.
+        advisory_exit = not unapplied
+        if advisory_exit and applied:
+            revised_ref = _put_blob(state, revised)
+            update["validated_events_ref"] = revised_ref
+            gate_entry = {
+                "validated_diff": diff_events(validated, revised),
+                "validated_digest": digest_of(revised_ref),
+            }
+    logger.info(
+        "run_expert_review_severity hop=%s blocking=%s advisory=%s advisory_exit=%s applied=%s unapplied=%s",
+        hop_count,
+        len(severity.blocking),
+        len(severity.advisory),
+        advisory_exit,
+        len(applied),
+        len(unapplied),
+    )
+    if _mlflow_enabled():
+        mlflow.log_metric("expert_blocking_suggestions", float(len(severity.blocking)), step=hop_count)
+        mlflow.log_metric("expert_advisory_suggestions", float(len(severity.advisory)), step=hop_count)
+        mlflow.log_metric("expert_advisory_applied", float(len(applied)), step=hop_count)
+        mlflow.log_metric("expert_advisory_exit", 1.0 if advisory_exit else 0.0, step=hop_count)
+
+    if decision == "ACCEPT" or advisory_exit:
         loop_status = "ACCEPT"
     elif no_change:
         loop_status = "NO_CHANGE"
@@ -421,13 +1123,21 @@ def run_expert_review(state: IngestionState) -> IngestionState:
             "review_decision": decision,
             "no_change": no_change,
             "loop_status": loop_status,
-            "feedback": feedback,
+            "cancelled_experts": sorted(cancelled),
+            "skipped_experts": [name for name in selected_experts if name in reused],
+            "expert_digests": expert_digests,
+            "feedback_diff": diff_by_expert(prev_by_expert, by_expert),
+            "blocking_experts": severity.blocking_experts,
+            "advisory_exit": advisory_exit,
+            "advisory_applied": applied,
+            "advisory_unapplied": unapplied,
+            **gate_entry,
         }
     )
 
     logger.info("run_expert_review_done hop=%s decision=%s loop_status=%s", hop_count, decision, loop_status)
     return {
-        **state,
+        **update,
         "expert_feedback": feedback,
         "loop_status": loop_status,
         "review_trace": trace,
@@ -437,18 +1147,27 @@ def run_expert_review(state: IngestionState) -> IngestionState:
 @_trace(span_type="CHAIN", name="revise_extraction")
 def revise_extraction(state: IngestionState) -> IngestionState:
     logger.info("revise_extraction hop=%s", state.get("hop_count"))
-    return {**state, "loop_status": "PENDING"}
+    return {"loop_status": "PENDING"}
 
 
 @_trace(span_type="CHAIN", name="finalize_output")
 def finalize_output(state: IngestionState) -> IngestionState:
-    logger.info("finalize_output loop_status=%s final_count=%s", state.get("loop_status"), len(state.get("validated_events", [])))
+    # Offsets are into the original release body, not the stripped prompt text.
+    final_events = locate_evidence(_events(state, "validated_events_ref"), _text_index(_content(state)))
+    logger.info(
+        "finalize_output loop_status=%s hops=%s final_count=%s",
+        state.get("loop_status"),
+        state.get("hop_count"),
+        len(final_events),
+    )
+    # Inline the first-hop snapshot: the blob behind its handle is released
+    # with the run, and the diffs in later entries are replayed against it.
+    review_trace = _materialize_trace(list(state.get("review_trace", [])))
+    _store_memo(state, final_events, review_trace)
     if _mlflow_enabled():
         mlflow.log_param("final_loop_status", str(state.get("loop_status") or ""))
-        mlflow.log_metric("final_events_count", float(len(state.get("validated_events", []))))
+        mlflow.log_metric("final_hop_count", float(state.get("hop_count") or 0))
+        mlflow.log_metric("final_events_count", float(len(final_events)))
         if state.get("error"):
             mlflow.log_param("error", str(state.get("error")))
-    return {
-        **state,
-        "final_events": list(state.get("validated_events", [])),
-    }
+    return {"final_events": final_events, "review_trace": review_trace}
@@ -0,0 +1,256 @@
+"""Pack several short releases into one first-hop extractor call.
+
+During batch runs many releases are a few paragraphs long, so the fixed
+extractor instructions dominate the prompt. ``ExtractionPacker`` collects
+concurrent first-hop extraction requests that share a sector route and sends
+them as one ``PACKED_EXTRACTOR_PROMPT_TEMPLATE`` call. Each release is
+wrapped in ``[[DOC id=<press_release_id>]]`` delimiters, and the model
+returns one ``{"doc_id", "events"}`` entry per release.
+
+The packed output is split back per release and checked before use. A
+release gets ``None`` when its entry is missing or malformed, or when one of
+its evidence spans is only found in another release of the pack. The caller
+then falls back to a normal single-release extractor call, so a bad split
+never costs more than that one extra call. Releases whose ids match, raw or
+after delimiter sanitizing, are never put in the same pack.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pr_flow_agents.graph.ingestion.prompts import PACKED_EXTRACTOR_PROMPT_TEMPLATE
+from pr_flow_agents.graph.ingestion.text_index import TextIndex
+from pr_flow_agents.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Only releases whose prompt body is at most this long are packed.
+PACK_MAX_DOC_CHARS = 2_000
+# Upper bounds for one packed call.
+PACK_MAX_DOCS = 6
+PACK_MAX_TOTAL_CHARS = 10_000
+# How long the first request of a pack waits for others to join.
+PACK_WINDOW_SECONDS = 0.25
+
+_DOC_ID_SAFE_RE = re.compile(r"[^A-Za-z0-9_.:-]")
+
+
+def _safe_id(doc_id: str) -> str:
+    return _DOC_ID_SAFE_RE.sub("_", doc_id)
+
+
+def doc_delimiters(doc_id: str) -> Tuple[str, str]:
+    safe = _safe_id(doc_id)
+    return f"[[DOC id={safe}]]", f"[[END DOC id={safe}]]"
+
+
+def build_packed_prompt(system_prompt: str, docs: Sequence[Tuple[str, str]]) -> str:
+    """Packed extractor prompt for ``docs`` given as (doc_id, content) pairs."""
+
+    blocks = []
+    for doc_id, content in docs:
+        start, end = doc_delimiters(doc_id)
+        blocks.append(f"{start}\n{content.strip()}\n{end}")
+    return PACKED_EXTRACTOR_PROMPT_TEMPLATE.format(
+        system_prompt=system_prompt,
+        doc_count=len(docs),
+        documents="\n\n".join(blocks),
+    )
+
+
+def split_packed_output(
+    raw: Any,
+    docs: Sequence[Tuple[str, str]],
+) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """Split a packed extractor response back into per-document events.
+
+    Returns ``{doc_id: events}``. A document maps to None when its output
+    cannot be trusted: no entry or a malformed entry, a duplicate entry, an
+    id that another document of the pack shares (raw or sanitized), or an
+    evidence span that only occurs in another document of the pack.
+    """
+
+    doc_ids = [doc_id for doc_id, _ in docs]
+    out: Dict[str, Optional[List[Dict[str, Any]]]] = {doc_id: None for doc_id in doc_ids}
+    entries = raw.get("documents") if isinstance(raw, dict) else None
+    if not isinstance(entries, list):
+        return out
+
+    # The delimiters carry a sanitized id; accept it as well as the raw one.
+    # An alias naming more than one document cannot be attributed.
+    owners: Dict[str, set[str]] = {}
+    for doc_id in doc_ids:
+        for alias in (doc_id, _safe_id(doc_id)):
+            owners.setdefault(alias, set()).add(doc_id)
+    ambiguous = {doc_id for ids in owners.values() if len(ids) > 1 for doc_id in ids}
+    if len(set(doc_ids)) < len(doc_ids):
+        ambiguous.update(d for d in doc_ids if doc_ids.count(d) > 1)
+    by_alias = {alias: next(iter(ids)) for alias, ids in owners.items() if not ids & ambiguous}
+    seen: Dict[str, Any] = {}
+    duplicates = set()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        doc_id = by_alias.get(str(entry.get("doc_id") or entry.get("press_release_id") or "").strip())
+        if doc_id is None:
+            continue
+        if doc_id in seen:
+            duplicates.add(doc_id)
+        seen[doc_id] = entry.get("events")
+
+    indexes = {doc_id: TextIndex(content) for doc_id, content in docs}
+    for doc_id in doc_ids:
+        events = seen.get(doc_id)
+        if doc_id in duplicates or doc_id in ambiguous or not isinstance(events, list):
+            continue
+        events = [ev for ev in events if isinstance(ev, dict)]
+        leaked = False
+        for ev in events:
+            span = str(ev.get("evidence_span") or "")
+            if not span or indexes[doc_id].resolve(span):
+                continue
+            if any(indexes[other].resolve(span) for other in doc_ids if other != doc_id):
+                leaked = True
+                break
+        if not leaked:
+            out[doc_id] = events
+    return out
+
+
+@dataclass(eq=False)
+class _PackRequest:
+    doc_id: str
+    content: str
+    system_prompt: str
+    future: Future = field(default_factory=Future)
+
+
+class ExtractionPacker:
+    """Micro-batches concurrent first-hop extraction requests.
+
+    ``submit`` blocks the calling worker thread. The first request of a
+    group waits up to ``window_seconds`` for others with the same
+    ``group_key`` to arrive, then issues one call for the whole pack. Every
+    request receives its own events, or None when the caller should run a
+    single-release extraction instead (pack of one, failed call or failed
+    split).
+    """
+
+    def __init__(
+        self,
+        extract_fn: Callable[[str], Any],
+        *,
+        max_docs: int = PACK_MAX_DOCS,
+        max_chars: int = PACK_MAX_TOTAL_CHARS,
+        window_seconds: float = PACK_WINDOW_SECONDS,
+    ) -> None:
+        self._extract_fn = extract_fn
+        self._max_docs = max(1, int(max_docs))
+        self._max_chars = max(1, int(max_chars))
+        self._window = max(0.0, float(window_seconds))
+        self._cond = threading.Condition()
+        self._pending: Dict[str, List[_PackRequest]] = {}
+        self._leading: set[str] = set()
+
+    def _full(self, group: List[_PackRequest]) -> bool:
+        return len(group) >= self._max_docs or sum(len(r.content) for r in group) >= self._max_chars
+
+    def _take(self, group_key: str) -> List[_PackRequest]:
+        """Next pack of ``group_key``, in arrival order.
+
+        A request whose raw or sanitized id matches one already in the pack
+        is left queued for a later pack, since the split keys by doc id.
+        """
+        group = self._pending.get(group_key) or []
+        batch: List[_PackRequest] = []
+        ids: set[str] = set()
+        chars = 0
+        rest: List[_PackRequest] = []
+        for i, req in enumerate(group):
+            if len(batch) >= self._max_docs or (batch and chars + len(req.content) > self._max_chars):
+                rest.extend(group[i:])
+                break
+            aliases = {req.doc_id, _safe_id(req.doc_id)}
+            if ids & aliases:
+                rest.append(req)
+                continue
+            ids |= aliases
+            chars += len(req.content)
+            batch.append(req)
+        if rest:
+            self._pending[group_key] = rest
+        else:
+            self._pending.pop(group_key, None)
+        return batch
+
+    def submit(
+        self,
+        *,
+        group_key: str,
+        doc_id: str,
+        content: str,
+        system_prompt: str,
+    ) -> Optional[List[Dict[str, Any]]]:
+        req = _PackRequest(doc_id=doc_id, content=content, system_prompt=system_prompt)
+        with self._cond:
+            self._pending.setdefault(group_key, []).append(req)
+            self._cond.notify_all()
+
+        while not req.future.done():
+            batch: List[_PackRequest] = []
+            with self._cond:
+                if group_key not in self._leading and req in self._pending.get(group_key, []):
+                    # Lead the next pack of this group.
+                    self._leading.add(group_key)
+                    deadline = time.monotonic() + self._window
+                    while not self._full(self._pending.get(group_key, [])):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    batch = self._take(group_key)
+                    self._leading.discard(group_key)
+                    self._cond.notify_all()
+                elif not req.future.done():
+                    self._cond.wait(self._window or 0.05)
+            if batch:
+                self._run(group_key, batch)
+        return req.future.result()
+
+    def _run(self, group_key: str, batch: List[_PackRequest]) -> None:
+        try:
+            if len(batch) == 1:
+                batch[0].future.set_result(None)
+                return
+            docs = [(r.doc_id, r.content) for r in batch]
+            prompt = build_packed_prompt(batch[0].system_prompt, docs)
+            started = time.perf_counter()
+            try:
+                raw = self._extract_fn(prompt)
+            except Exception:  # noqa: BLE001
+                logger.exception("packed_extract_failed group=%s docs=%s", group_key, len(batch))
+                raw = None
+            split = split_packed_output(raw, docs)
+            failed = [doc_id for doc_id, events in split.items() if events is None]
+            logger.info(
+                "packed_extract_done group=%s docs=%s prompt_chars=%s failed_splits=%s duration_ms=%s",
+                group_key,
+                len(batch),
+                len(prompt),
+                len(failed),
+                round((time.perf_counter() - started) * 1000.0, 2),
+            )
+            for r in batch:
+                r.future.set_result(split.get(r.doc_id))
+        finally:
+            for r in batch:
+                if not r.future.done():
+                    r.future.set_result(None)
+            with self._cond:
+                self._cond.notify_all()
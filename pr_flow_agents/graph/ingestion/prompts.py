@@ -62,21 +62,9 @@ ANTI-HALLUCINATION RULES:
 # Extractor prompt
 # ---------------------------------------------------------------------------
 
-EXTRACTOR_PROMPT_TEMPLATE = """\
-EXTRACT_EVENTS_JSON
-{system_prompt}
-
---- ITERATION CONTEXT ---
-Hop: {hop_count}/{max_hops}
-Experts available: {experts}
-Previous expert feedback (empty on first hop):
-{expert_feedback}
-
---- TASK ---
-Read the press release below and extract a JSON array of discrete, material
-events. Each event must be independently verifiable against the source text.
-
---- OUTPUT SCHEMA (return ONLY a JSON array, no wrapper object) ---
+# Per-event schema and rules shared by the single-document and packed
+# extractor prompts.
+EXTRACTOR_EVENT_SPEC = """\
 Each element must be an object with ALL of the following fields:
 
   "event_type"     : One of the allowed categories below.
@@ -134,11 +122,108 @@ ALLOWED EVENT CATEGORIES:
    remove unsupported claims. Do NOT simply repeat the prior output.
 6. COMPLETENESS: Cover all material events. Missing a clearly stated event
    is as bad as hallucinating one.
+"""
 
+EXTRACTOR_PROMPT_TEMPLATE = (
+    """\
+EXTRACT_EVENTS_JSON
+{system_prompt}
+
+--- ITERATION CONTEXT ---
+Hop: {hop_count}/{max_hops}
+Experts available: {experts}
+Previous expert feedback (empty on first hop):
+{expert_feedback}
+
+--- TASK ---
+Read the press release below and extract a JSON array of discrete, material
+events. Each event must be independently verifiable against the source text.
+
+--- OUTPUT SCHEMA (return ONLY a JSON array, no wrapper object) ---
+"""
+    + EXTRACTOR_EVENT_SPEC
+    + """
 --- PRESS RELEASE ---
 {content}
-""".strip()
+"""
+).strip()
 
+# First-hop extraction for several short releases in one call. Each release
+# is wrapped in [[DOC id=...]] / [[END DOC id=...]] delimiters.
+PACKED_EXTRACTOR_PROMPT_TEMPLATE = (
+    """\
+EXTRACT_EVENTS_JSON_PACKED
+{system_prompt}
+
+--- TASK ---
+The input below contains {doc_count} separate press releases, each wrapped in
+[[DOC id=<id>]] ... [[END DOC id=<id>]] delimiters. Extract events from EACH
+document independently, exactly as if it were the only press release. Never
+merge, copy or move events between documents. Every evidence_span must be a
+verbatim substring of the document the event is listed under.
+
+--- OUTPUT SCHEMA (return ONLY a JSON object) ---
+{{
+  "documents": [
+    {{"doc_id": "<id from the delimiter>", "events": [<event>, ...]}}
+  ]
+}}
+Return exactly one entry per document id, in input order. Use an empty
+"events" array for a document without material events.
+
+--- EVENT SCHEMA (applies to every <event>; "the press release" is the
+document the event is listed under) ---
+"""
+    + EXTRACTOR_EVENT_SPEC
+    + """
+--- DOCUMENTS ---
+{documents}
+"""
+).strip()
+
+
+# Revise hop in patch mode: only events referenced by expert feedback are sent
+# back, and the model returns edits instead of the whole list.
+REVISION_PATCH_PROMPT_TEMPLATE = (
+    """\
+REVISE_EVENTS_PATCH_JSON
+{system_prompt}
+
+--- ITERATION CONTEXT ---
+Hop: {hop_count}/{max_hops}
+Expert feedback on the previous extraction:
+{expert_feedback}
+
+--- TASK ---
+Events were already extracted from the press release below and reviewed by
+domain experts. Return ONLY the changes needed to address the feedback:
+corrections to the events under review, removals of unsupported events, and
+events the experts report as missing. Do not restate events that need no
+change and do not add events the feedback does not ask for.
+
+--- OUTPUT SCHEMA (return ONLY a JSON object) ---
+{{
+  "update": [{{"event_id": "<id of an event under review>", "event": <corrected event>}}],
+  "remove": ["<id of an event under review>"],
+  "add": [<new event>]
+}}
+Use empty arrays when nothing applies. An updated event replaces the old one
+in full, so include every field.
+
+--- EVENT SCHEMA (applies to every event in "update" and "add") ---
+"""
+    + EXTRACTOR_EVENT_SPEC
+    + """
+--- EVENTS UNDER REVIEW ---
+{events}
+
+--- OTHER EVENTS (already accepted; do not change or duplicate them) ---
+{other_events}
+
+--- PRESS RELEASE ---
+{content}
+"""
+).strip()
 
 # ---------------------------------------------------------------------------
 # Validator prompt
@@ -206,7 +291,10 @@ EXPERT_PROMPT_SHARED_SUFFIX = """\
     {{
       "action": "ADD" | "UPDATE" | "REMOVE",
       "target": "event_type or claim fragment identifying which event",
-      "note": "What specifically should change and why"
+      "note": "What specifically should change and why",
+      "severity": "BLOCKING" | "ADVISORY",
+      "field": "For UPDATE: the single field to change (e.g. claim, entities)",
+      "value": "For UPDATE: the full replacement value for that field"
     }}
   ]
 }}
@@ -219,6 +307,15 @@ DECISION GUIDELINES:
   evidence, or miscategorised events.
 - Do NOT flag issues outside your domain — other experts handle those.
 
+SEVERITY GUIDELINES:
+- "BLOCKING": a missing event, an unsupported or incorrect event, a wrong
+  number, date or event type. These require re-extraction.
+- "ADVISORY": wording or naming improvements to an otherwise correct event
+  (clearer claim, canonical entity names). Give "field" and "value" so the
+  change can be applied directly without re-extraction.
+- Every entry in "issues" must be addressed by a suggestion; reuse the
+  issue text as that suggestion's "note".
+
 EVENT STRUCTURE:
 - The events input is a JSON object with two arrays:
   - "in_scope": Events that fall under YOUR domain. Review these in full
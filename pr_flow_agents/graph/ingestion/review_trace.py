@@ -0,0 +1,191 @@
+"""Compact, diff-based review trace.
+
+Hop-to-hop changes are usually small. Storing every hop's validated events
+and merged expert feedback in full makes ``review_trace`` grow with
+``max_hops`` times the release size. The trace therefore keeps:
+
+- a snapshot of the validated events on the first validate entry
+  (``validated_events_ref`` in graph state, ``validated_events`` once
+  materialized for the memo store),
+- a ``validated_diff`` on every later validate entry: added events, removed
+  fingerprints and per-field changes, keyed by ``event_fingerprint``,
+- a ``feedback_diff`` on every review entry: only the per-expert feedback
+  that changed since the previous review. Flattened issues and suggestions
+  are derived from it and not stored.
+
+Every validate entry also keeps ``validated_digest``, so hop-to-hop change
+detection never needs the events. ``reconstruct_trace`` expands a compact
+trace back into full per-hop events and feedback for debugging.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from pr_flow_agents.graph.ingestion.chunking import event_dedup_keys
+
+
+def event_fingerprint(event: Dict[str, Any]) -> str:
+    """Stable key for an event across hops.
+
+    Based on the normalized evidence span (claim and numbers when there is
+    no span), so a re-typed or re-worded event shows up as changed instead
+    of removed and added.
+    """
+
+    span_key, claim_key = event_dedup_keys(event)
+    basis = span_key or json.dumps(claim_key, ensure_ascii=True)
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
+
+
+def keyed_events(events: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Fingerprint -> event in list order; repeated fingerprints get a #n suffix."""
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for ev in events:
+        if not isinstance(ev, dict):
+            continue
+        base = event_fingerprint(ev)
+        key, n = base, 1
+        while key in out:
+            n += 1
+            key = f"{base}#{n}"
+        out[key] = ev
+    return out
+
+
+def diff_events(prev: List[Dict[str, Any]], curr: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Structural diff that turns ``prev`` into ``curr`` under ``apply_event_diff``.
+
+    Empty parts are omitted, so an unchanged hop diffs to ``{}``.
+    """
+
+    before = keyed_events(prev)
+    after = keyed_events(curr)
+    diff: Dict[str, Any] = {}
+
+    removed = [fp for fp in before if fp not in after]
+    added = {fp: ev for fp, ev in after.items() if fp not in before}
+    changed: Dict[str, Dict[str, Any]] = {}
+    for fp, ev in after.items():
+        old = before.get(fp)
+        if old is None or old == ev:
+            continue
+        change: Dict[str, Any] = {}
+        set_fields = {k: v for k, v in ev.items() if k not in old or old[k] != v}
+        unset_fields = [k for k in old if k not in ev]
+        if set_fields:
+            change["set"] = set_fields
+        if unset_fields:
+            change["unset"] = unset_fields
+        changed[fp] = change
+
+    if removed:
+        diff["removed"] = removed
+    if added:
+        diff["added"] = added
+    if changed:
+        diff["changed"] = changed
+    # Kept events stay in place and added ones go last; record the order only
+    # when the hop reordered events.
+    natural = [fp for fp in before if fp in after] + list(added)
+    if natural != list(after):
+        diff["order"] = list(after)
+    return diff
+
+
+def apply_event_diff(prev: List[Dict[str, Any]], diff: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Inverse of ``diff_events``."""
+
+    events = keyed_events(prev)
+    for fp in diff.get("removed") or []:
+        events.pop(fp, None)
+    for fp, change in (diff.get("changed") or {}).items():
+        if fp not in events:
+            continue
+        ev = {k: v for k, v in events[fp].items() if k not in set(change.get("unset") or [])}
+        ev.update(change.get("set") or {})
+        events[fp] = ev
+    events.update(diff.get("added") or {})
+    order = diff.get("order") or list(events)
+    return [events[fp] for fp in order if fp in events]
+
+
+def diff_by_expert(prev: Dict[str, Any], curr: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-expert feedback that changed between two reviews.
+
+    ``order`` is always kept because merged issues follow expert order.
+    """
+
+    diff: Dict[str, Any] = {"order": list(curr)}
+    changed = {name: fb for name, fb in curr.items() if prev.get(name) != fb}
+    if changed:
+        diff["changed"] = changed
+    return diff
+
+
+def apply_by_expert_diff(prev: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    changed = diff.get("changed") or {}
+    return {name: changed[name] if name in changed else prev.get(name, {}) for name in diff.get("order") or []}
+
+
+def merge_expert_feedback(by_expert: Dict[str, Any]) -> Dict[str, Any]:
+    """Merged feedback handed to the extractor, derived from per-expert feedback."""
+
+    any_revise = False
+    issues: List[str] = []
+    suggestions: List[Dict[str, Any]] = []
+    for expert_name, feedback in by_expert.items():
+        decision = str(feedback.get("decision") or "REVISE").upper()
+        if decision == "CANCELLED":
+            continue
+        if decision != "ACCEPT":
+            any_revise = True
+        for issue in feedback.get("issues", []) or []:
+            issues.append(f"{expert_name}: {issue}")
+        for suggestion in feedback.get("suggestions", []) or []:
+            if isinstance(suggestion, dict):
+                suggestions.append({"expert": expert_name, **suggestion})
+    return {
+        "decision": "REVISE" if any_revise else "ACCEPT",
+        "summary": "Merged specialist feedback",
+        "issues": issues,
+        "suggestions": suggestions,
+        "by_expert": by_expert,
+    }
+
+
+def reconstruct_trace(
+    trace: List[Dict[str, Any]],
+    resolve: Optional[Callable[[str], Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Expand a compact trace into full per-hop ``validated_events`` and ``feedback``.
+
+    ``resolve`` maps a ``validated_events_ref`` blob handle to its event
+    list; it is only needed for traces read from a mid-run checkpoint.
+    ``finalize_output`` already inlines the snapshot.
+    Entries that already hold full events or feedback (older memos) are
+    taken as they are.
+    """
+
+    out: List[Dict[str, Any]] = []
+    events: List[Dict[str, Any]] = []
+    by_expert: Dict[str, Any] = {}
+    for entry in trace:
+        entry = dict(entry)
+        if "validated_events_ref" in entry and resolve is not None:
+            entry["validated_events"] = list(resolve(entry.pop("validated_events_ref")) or [])
+        if isinstance(entry.get("validated_events"), list):
+            events = list(entry["validated_events"])
+        elif "validated_diff" in entry:
+            events = apply_event_diff(events, entry.pop("validated_diff") or {})
+            entry["validated_events"] = events
+        if isinstance(entry.get("feedback"), dict):
+            by_expert = dict(entry["feedback"].get("by_expert") or {})
+        elif "feedback_diff" in entry:
+            by_expert = apply_by_expert_diff(by_expert, entry.pop("feedback_diff") or {})
+            entry["feedback"] = merge_expert_feedback(by_expert)
+        out.append(entry)
+    return out
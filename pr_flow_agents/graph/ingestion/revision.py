@@ -0,0 +1,185 @@
+"""Targeted patch revision for REVISE hops.
+
+A full re-extraction regenerates every event to fix a few. That re-spends
+output tokens on events nobody objected to, and accepted events can drift.
+In patch mode the revise hop instead:
+
+1. picks the previous validated events that the feedback refers to
+   (``plan_revision``),
+2. asks the model for edits to those events plus any missing events
+   (``REVISION_PATCH_PROMPT_TEMPLATE``),
+3. merges the returned patch into the previous list deterministically
+   (``apply_patch``).
+
+Events are addressed by ``event_fingerprint`` ids. The patch may only
+update or remove events that were under review, and ids outside that set
+are ignored. The merged list then goes through normal validation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+from pr_flow_agents.graph.ingestion.prompts import REVISION_PATCH_PROMPT_TEMPLATE
+from pr_flow_agents.graph.ingestion.review_trace import keyed_events
+from pr_flow_agents.graph.ingestion.text_index import normalize_text
+
+
+@dataclass
+class RevisionPlan:
+    # Fingerprint id -> event for every previous validated event, in order.
+    events: Dict[str, Dict[str, Any]]
+    # Ids of the events sent back for revision.
+    targets: List[str]
+    # The feedback asks for new events.
+    wants_additions: bool
+
+
+@dataclass
+class PatchResult:
+    events: List[Dict[str, Any]]
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    added: int = 0
+    # Ids in the patch that were not under review.
+    ignored_ids: List[str] = field(default_factory=list)
+
+
+def _referenced(events: Dict[str, Dict[str, Any]], target: str) -> List[str]:
+    needle = normalize_text(target)
+    if not needle:
+        return []
+    return [
+        event_id
+        for event_id, ev in events.items()
+        if normalize_text(str(ev.get("event_type") or "")) == needle
+        or needle in normalize_text(str(ev.get("claim") or ""))
+        or needle in normalize_text(str(ev.get("evidence_span") or ""))
+    ]
+
+
+def plan_revision(
+    events: List[Dict[str, Any]],
+    feedback: Dict[str, Any],
+    expert_types: Mapping[str, Set[str]],
+) -> Optional[RevisionPlan]:
+    """Select the events the feedback refers to; None if a patch cannot help.
+
+    UPDATE/REMOVE suggestions select the events their ``target`` matches.
+    A revising expert whose issues cannot be tied to a specific event
+    selects every event of its own event types instead.
+    """
+
+    keyed = keyed_events(events)
+    targets: Set[str] = set()
+    wants_additions = False
+    for expert_name, expert_feedback in (feedback.get("by_expert") or {}).items():
+        decision = str(expert_feedback.get("decision") or "REVISE").upper()
+        if decision in {"ACCEPT", "CANCELLED"}:
+            continue
+        resolved = False
+        for suggestion in expert_feedback.get("suggestions") or []:
+            if not isinstance(suggestion, dict):
+                continue
+            action = str(suggestion.get("action") or "").strip().upper()
+            if action == "ADD":
+                wants_additions = True
+                resolved = True
+                continue
+            matched = _referenced(keyed, str(suggestion.get("target") or ""))
+            if matched:
+                targets.update(matched)
+                resolved = True
+        if not resolved:
+            owned = expert_types.get(expert_name) or set()
+            in_scope = [
+                event_id
+                for event_id, ev in keyed.items()
+                if str(ev.get("event_type") or "").strip().upper() in owned
+            ]
+            targets.update(in_scope)
+            # No event of its types to fix: the expert is reporting a gap.
+            wants_additions = wants_additions or not in_scope
+    if not targets and not wants_additions:
+        return None
+    return RevisionPlan(
+        events=keyed,
+        targets=[event_id for event_id in keyed if event_id in targets],
+        wants_additions=wants_additions,
+    )
+
+
+def build_patch_prompt(
+    plan: RevisionPlan,
+    *,
+    system_prompt: str,
+    hop_count: int,
+    max_hops: int,
+    expert_feedback: Dict[str, Any],
+    content: str,
+) -> str:
+    targets = set(plan.targets)
+    under_review = [{"event_id": event_id, **plan.events[event_id]} for event_id in plan.targets]
+    others = [
+        {"event_type": ev.get("event_type"), "claim": ev.get("claim")}
+        for event_id, ev in plan.events.items()
+        if event_id not in targets
+    ]
+    # by_expert repeats the merged issues/suggestions; send the merged form.
+    merged = {k: v for k, v in expert_feedback.items() if k != "by_expert"}
+    return REVISION_PATCH_PROMPT_TEMPLATE.format(
+        system_prompt=system_prompt,
+        hop_count=hop_count,
+        max_hops=max_hops,
+        expert_feedback=json.dumps(merged, ensure_ascii=True),
+        events=json.dumps(under_review, ensure_ascii=True),
+        other_events=json.dumps(others, ensure_ascii=True),
+        content=content,
+    )
+
+
+def apply_patch(plan: RevisionPlan, raw: Any) -> Optional[PatchResult]:
+    """Merge a patch response into the previous events; None if malformed.
+
+    Updated events keep their position, removed events are dropped and
+    added events are appended in the order given.
+    """
+
+    if not isinstance(raw, dict):
+        return None
+    updates = raw.get("update") or []
+    removes = raw.get("remove") or []
+    adds = raw.get("add") or []
+    if not all(isinstance(x, list) for x in (updates, removes, adds)):
+        return None
+
+    allowed = set(plan.targets)
+    result = PatchResult(events=[])
+    replacements: Dict[str, Dict[str, Any]] = {}
+    for item in updates:
+        event_id = str(item.get("event_id") or "") if isinstance(item, dict) else ""
+        event = item.get("event") if isinstance(item, dict) else None
+        if event_id not in allowed or not isinstance(event, dict):
+            result.ignored_ids.append(event_id)
+            continue
+        replacements[event_id] = {k: v for k, v in event.items() if k != "event_id"}
+        result.updated.append(event_id)
+    dropped: Set[str] = set()
+    for event_id in (str(x) for x in removes):
+        if event_id not in allowed:
+            result.ignored_ids.append(event_id)
+            continue
+        dropped.add(event_id)
+        result.removed.append(event_id)
+
+    for event_id, ev in plan.events.items():
+        if event_id in dropped:
+            continue
+        result.events.append(replacements.get(event_id, ev))
+    for ev in adds:
+        if isinstance(ev, dict):
+            result.events.append({k: v for k, v in ev.items() if k != "event_id"})
+            result.added += 1
+    return result
@@ -11,7 +11,10 @@ import argparse
 import json
 import os
 
+from pr_flow_agents.graph.checkpointing import new_run_id
 from pr_flow_agents.graph.ingestion.graph import build_graph
+from pr_flow_agents.graph.ingestion.nodes import release_run_blobs
+from pr_flow_agents.graph.ingestion.review_trace import reconstruct_trace
 from pr_flow_agents.graph.ingestion.state import IngestionState
 from pr_flow_agents.logging_utils import configure_logging, get_logger
 
@@ -26,6 +29,36 @@ def _parse_args() -> argparse.Namespace:
         required=True,
         help="MongoDB _id from crawl_results",
     )
+    p.add_argument(
+        "--strict-local-validation",
+        action="store_true",
+        help="Skip the LLM validator when every candidate passes local validation untouched",
+    )
+    p.add_argument(
+        "--keep-boilerplate",
+        action="store_true",
+        help="Send the full release body to prompts instead of stripping disclaimers/about/contact sections",
+    )
+    p.add_argument(
+        "--revise-on-advisory",
+        action="store_true",
+        help="Re-extract on any expert REVISE instead of applying advisory-only feedback locally",
+    )
+    p.add_argument(
+        "--full-revision",
+        action="store_true",
+        help="Re-extract every event on a REVISE hop instead of patching only the events under review",
+    )
+    p.add_argument(
+        "--review-trace",
+        action="store_true",
+        help="Include the per-hop review trace (full validated events and expert feedback) in the output",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore memoized output for identical content and re-run every LLM hop",
+    )
     return p.parse_args()
 
 
@@ -55,26 +88,40 @@ def main() -> None:
 
     state: IngestionState = {
         "press_release_id": args.press_release_id,
+        "run_id": new_run_id(),
     }
+    if args.strict_local_validation:
+        state["local_validator_strict"] = True
+    if args.keep_boilerplate:
+        state["strip_boilerplate"] = False
+    if args.revise_on_advisory:
+        state["severity_gate"] = False
+    if args.full_revision:
+        state["revision_mode"] = "full"
+    if args.force:
+        state["force"] = True
 
     logger.info("ingestion_graph_start press_release_id=%s", args.press_release_id)
     app = build_graph()
 
-    if mlflow is not None:
-        with mlflow.start_run(run_name=f"ingestion_{args.press_release_id}"):
-            with mlflow.start_span(name="ingestion_graph") as span:
-                span.set_inputs(state)
-                out = app.invoke(state)
-                span.set_outputs({
-                    "route": out.get("route"),
-                    "sector": out.get("sector"),
-                    "loop_status": out.get("loop_status"),
-                    "hop_count": out.get("hop_count"),
-                    "final_events_count": len(out.get("final_events", []) or []),
-                    "error": out.get("error"),
-                })
-    else:
-        out = app.invoke(state)
+    try:
+        if mlflow is not None:
+            with mlflow.start_run(run_name=f"ingestion_{args.press_release_id}"):
+                with mlflow.start_span(name="ingestion_graph") as span:
+                    span.set_inputs(state)
+                    out = app.invoke(state)
+                    span.set_outputs({
+                        "route": out.get("route"),
+                        "sector": out.get("sector"),
+                        "loop_status": out.get("loop_status"),
+                        "hop_count": out.get("hop_count"),
+                        "final_events_count": len(out.get("final_events", []) or []),
+                        "error": out.get("error"),
+                    })
+        else:
+            out = app.invoke(state)
+    finally:
+        release_run_blobs(state["run_id"])
 
     logger.info("ingestion_graph_done route=%s", out.get("route"))
     compact = {
@@ -86,10 +133,14 @@ def main() -> None:
         "loop_status": out.get("loop_status"),
         "hop_count": out.get("hop_count"),
         "max_hops": out.get("max_hops"),
+        "memo_hit": bool(out.get("memo_hit")),
+        "boilerplate_removed_chars": out.get("boilerplate_removed_chars"),
         "final_events_count": len(out.get("final_events", []) or []),
         "final_events": out.get("final_events", []),
         "error": out.get("error"),
     }
+    if args.review_trace:
+        compact["review_trace"] = reconstruct_trace(list(out.get("review_trace") or []))
     print(json.dumps(compact, indent=2))
 
 
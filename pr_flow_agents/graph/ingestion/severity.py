@@ -0,0 +1,167 @@
+"""Blocking vs advisory severity for expert review feedback.
+
+A REVISE from one expert used to force a full re-extraction hop, even for a
+wording nit. Each suggestion is now classified:
+
+- BLOCKING: it needs the extractor. Missing events (ADD), unsupported or
+  incorrect events (REMOVE), and updates to fact fields (type, date,
+  numbers, evidence span).
+- ADVISORY: wording or naming changes to an otherwise correct event
+  (claim text, entity names). When the expert supplies ``field`` and
+  ``value``, the change is applied locally to the validated events.
+
+The model's own ``severity`` label is honoured only when it does not
+contradict the policy. ADD/REMOVE and fact-field updates stay blocking
+whatever the label says. An expert that asks for REVISE with issues but no
+structured suggestions counts as blocking, and so does one with an issue
+that none of its advisory suggestions covers (an issue is covered when it
+and the suggestion's ``note`` contain one another after normalization).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from pr_flow_agents.graph.ingestion.text_index import normalize_text
+
+BLOCKING = "BLOCKING"
+ADVISORY = "ADVISORY"
+
+# Suggestion actions that always need re-extraction.
+BLOCKING_ACTIONS: FrozenSet[str] = frozenset({"ADD", "REMOVE"})
+# Event fields an advisory UPDATE may change locally.
+ADVISORY_FIELDS: FrozenSet[str] = frozenset({"claim", "entities"})
+
+
+@dataclass
+class SeverityReport:
+    blocking: List[Dict[str, Any]] = field(default_factory=list)
+    advisory: List[Dict[str, Any]] = field(default_factory=list)
+    # Experts whose REVISE decision is backed by blocking feedback.
+    blocking_experts: List[str] = field(default_factory=list)
+
+    @property
+    def has_blocking(self) -> bool:
+        return bool(self.blocking_experts)
+
+
+def classify_suggestion(
+    suggestion: Dict[str, Any],
+    *,
+    blocking_actions: FrozenSet[str] = BLOCKING_ACTIONS,
+    advisory_fields: FrozenSet[str] = ADVISORY_FIELDS,
+) -> str:
+    action = str(suggestion.get("action") or "").strip().upper()
+    if action in blocking_actions:
+        return BLOCKING
+    target_field = str(suggestion.get("field") or "").strip().lower()
+    if target_field and target_field not in advisory_fields:
+        return BLOCKING
+    label = str(suggestion.get("severity") or "").strip().upper()
+    if label == ADVISORY and action == "UPDATE":
+        return ADVISORY
+    return BLOCKING
+
+
+def _issue_covered(issue: Any, advisories: List[Dict[str, Any]]) -> bool:
+    text = normalize_text(str(issue or ""))
+    if not text:
+        return True
+    for suggestion in advisories:
+        note = normalize_text(str(suggestion.get("note") or ""))
+        if note and (note in text or text in note):
+            return True
+    return False
+
+
+def classify_feedback(by_expert: Dict[str, Any]) -> SeverityReport:
+    """Split every expert's suggestions into blocking and advisory."""
+
+    report = SeverityReport()
+    for expert_name, feedback in by_expert.items():
+        decision = str(feedback.get("decision") or "REVISE").upper()
+        if decision in {"ACCEPT", "CANCELLED"}:
+            continue
+        suggestions = [s for s in (feedback.get("suggestions") or []) if isinstance(s, dict)]
+        expert_blocking = False
+        expert_advisory: List[Dict[str, Any]] = []
+        for suggestion in suggestions:
+            tagged = {"expert": expert_name, **suggestion}
+            if classify_suggestion(suggestion) == BLOCKING:
+                report.blocking.append(tagged)
+                expert_blocking = True
+            else:
+                report.advisory.append(tagged)
+                expert_advisory.append(suggestion)
+        if not suggestions:
+            # REVISE without actionable suggestions: cannot be applied locally.
+            expert_blocking = True
+        issues = feedback.get("issues") or []
+        if not isinstance(issues, list):
+            issues = [issues]
+        if any(not _issue_covered(issue, expert_advisory) for issue in issues):
+            # A problem reported only in free text may be a wrong fact.
+            expert_blocking = True
+        if expert_blocking:
+            report.blocking_experts.append(expert_name)
+    return report
+
+
+def _match_event(events: List[Dict[str, Any]], target: str) -> Optional[int]:
+    """Index of the single event ``target`` refers to, or None if ambiguous."""
+
+    needle = normalize_text(target)
+    if not needle:
+        return None
+    by_type = [i for i, ev in enumerate(events) if normalize_text(str(ev.get("event_type") or "")) == needle]
+    if len(by_type) == 1:
+        return by_type[0]
+    by_text = [
+        i
+        for i, ev in enumerate(events)
+        if needle in normalize_text(str(ev.get("claim") or ""))
+        or needle in normalize_text(str(ev.get("evidence_span") or ""))
+    ]
+    return by_text[0] if len(by_text) == 1 else None
+
+
+def _coerce_value(target_field: str, value: Any) -> Optional[Any]:
+    if target_field == "claim":
+        text = str(value or "").strip() if not isinstance(value, (list, dict)) else ""
+        return text or None
+    if target_field == "entities":
+        if not isinstance(value, list):
+            return None
+        items = [str(x).strip() for x in value if str(x).strip()]
+        return items or None
+    return None
+
+
+def apply_advisories(
+    events: List[Dict[str, Any]],
+    advisories: List[Dict[str, Any]],
+    *,
+    advisory_fields: FrozenSet[str] = ADVISORY_FIELDS,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Apply advisory UPDATEs to ``events``.
+
+    Returns (events, applied, unapplied). An advisory is applied only when
+    it names an advisory field, carries a usable value and its target
+    matches exactly one event. Anything else is reported as unapplied and
+    otherwise ignored.
+    """
+
+    out = [dict(ev) for ev in events]
+    applied: List[Dict[str, Any]] = []
+    unapplied: List[Dict[str, Any]] = []
+    for suggestion in advisories:
+        target_field = str(suggestion.get("field") or "").strip().lower()
+        value = _coerce_value(target_field, suggestion.get("value")) if target_field in advisory_fields else None
+        idx = _match_event(out, str(suggestion.get("target") or "")) if value is not None else None
+        if idx is None:
+            unapplied.append(suggestion)
+            continue
+        out[idx][target_field] = value
+        applied.append({**suggestion, "event_index": idx})
+    return out, applied, unapplied
@@ -23,14 +23,19 @@ class PressReleaseDocument(TypedDict, total=False):
 
 
 class IngestionState(TypedDict, total=False):
+    """Graph state. Large payloads live in the run blob store; ``*_ref``
+    fields hold ``blob:<sha256>`` handles to them."""
+
     # Input payload
     press_release_id: str
+    run_id: str
 
     # Loaded from crawl_results
     press_release: PressReleaseDocument
     ticker: str
     press_release_timestamp: str
-    press_release_content: str
+    content_ref: str
+    content_chars: int
 
     # Routing outputs
     sector: Optional[str]
@@ -42,12 +47,34 @@ class IngestionState(TypedDict, total=False):
     agent_config: Dict[str, Any]
     experts: List[str]
 
+    # Memoization
+    force: bool
+    memo_key: str
+    memo_hit: bool
+
+    # Boilerplate stripping; prompt_content_ref is the stripped body and
+    # boilerplate_ref its offset map back to the original.
+    strip_boilerplate: bool
+    prompt_content_ref: str
+    boilerplate_ref: str
+    boilerplate_removed_chars: int
+
+    # Chunking (long releases only; 0 means single-shot extraction)
+    chunk_count: int
+    chunk_candidates_ref: str
+
+    # First-hop extraction shared with other short releases of a batch run
+    pack_short_releases: bool
+
     # Stage 2 loop fields
     hop_count: int
     max_hops: int
-    candidate_events: List[Dict[str, Any]]
+    local_validator_strict: bool
+    severity_gate: bool
+    revision_mode: Literal["patch", "full"]
+    candidate_events_ref: str
     expert_feedback: Dict[str, Any]
-    validated_events: List[Dict[str, Any]]
+    validated_events_ref: str
     loop_status: LoopStatus
     review_trace: List[Dict[str, Any]]
 
@@ -0,0 +1,256 @@
+"""Normalized view of release text with an offset map back to the original.
+
+Model-copied evidence spans rarely differ from the source in substance, but
+they often differ in whitespace, curly vs straight quotes, dashes and
+markdown escapes. ``TextIndex`` normalizes the release once so such spans can
+be located quickly and repaired to the exact original substring.
+
+``TextIndex.locate`` also returns original character offsets and a match
+score, which are stored on persisted events for the UI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import unicodedata
+
+_CHAR_MAP = {
+    "‘": "'",
+    "’": "'",
+    "‚": "'",
+    "‛": "'",
+    "′": "'",
+    "“": '"',
+    "”": '"',
+    "„": '"',
+    "‟": '"',
+    "″": '"',
+    "‐": "-",
+    "‑": "-",
+    "‒": "-",
+    "–": "-",
+    "—": "-",
+    "―": "-",
+    "−": "-",
+}
+
+# Markdown emphasis markers carry no meaning for span matching.
+_DROP_CHARS = {"*"}
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """Return (normalized text, original index of every normalized char).
+
+    Normalization: NFKC, casefold, quote/dash folding, markdown escape and
+    emphasis removal, and whitespace runs collapsed to a single space.
+    """
+
+    out: List[str] = []
+    offsets: List[int] = []
+    pending_space = -1
+    n = len(text)
+    i = 0
+    while i < n:
+        ch = text[i]
+        if ch == "\\" and i + 1 < n and not text[i + 1].isalnum() and not text[i + 1].isspace():
+            # Markdown escape such as "\$" or "\_" -> keep the escaped char only.
+            i += 1
+            continue
+        if ch.isspace():
+            if pending_space < 0:
+                pending_space = i
+            i += 1
+            continue
+        if ch in _DROP_CHARS:
+            i += 1
+            continue
+        folded = unicodedata.normalize("NFKC", _CHAR_MAP.get(ch, ch)).casefold()
+        folded = "".join(_CHAR_MAP.get(c, c) for c in folded)
+        if folded.isspace():
+            if pending_space < 0:
+                pending_space = i
+            i += 1
+            continue
+        if pending_space >= 0:
+            if out:
+                out.append(" ")
+                offsets.append(pending_space)
+            pending_space = -1
+        for c in folded:
+            out.append(c)
+            offsets.append(i)
+        i += 1
+    return "".join(out), offsets
+
+
+def normalize_text(text: str) -> str:
+    return normalize_with_offsets(text or "")[0]
+
+
+@dataclass(frozen=True)
+class SpanMatch:
+    """Original [start, end) offsets of a located span and how well it matched."""
+
+    start: int
+    end: int
+    score: float
+
+
+# Match scores: verbatim, equal after normalization, and the ceiling for
+# approximate matches (scaled by the share of n-gram seeds that agree).
+EXACT_MATCH_SCORE = 1.0
+NORMALIZED_MATCH_SCORE = 0.95
+FUZZY_MATCH_MAX_SCORE = 0.9
+# Approximate matches below this score are treated as not found.
+FUZZY_MIN_SCORE = 0.5
+
+# Character n-gram length of the normalized-text index.
+NGRAM_CHARS = 8
+# N-grams more frequent than this are too common to anchor a lookup.
+NGRAM_MAX_POSTINGS = 64
+
+
+class TextIndex:
+    """Original text plus its normalized form, built once per release.
+
+    Lookups go through a character n-gram index over the normalized text.
+    A span is anchored on one of its rarer n-grams and verified in place, so
+    resolving many spans costs roughly their total length instead of one
+    scan of the release per span.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text or ""
+        self.normalized, self._offsets = normalize_with_offsets(self.text)
+        self._ngrams: Optional[Dict[str, List[int]]] = None
+
+    def _postings(self) -> Dict[str, List[int]]:
+        # Sampled index: only n-grams starting at multiples of NGRAM_CHARS are
+        # stored; lookups probe the needle at every offset instead.
+        if self._ngrams is None:
+            ngrams: Dict[str, List[int]] = {}
+            norm = self.normalized
+            for pos in range(0, len(norm) - NGRAM_CHARS + 1, NGRAM_CHARS):
+                ngrams.setdefault(norm[pos:pos + NGRAM_CHARS], []).append(pos)
+            self._ngrams = ngrams
+        return self._ngrams
+
+    def to_original(self, norm_start: int, norm_end: int) -> Tuple[int, int]:
+        """Map a normalized [start, end) range to an original [start, end) range."""
+
+        if norm_end <= norm_start:
+            pos = self._offsets[norm_start] if norm_start < len(self._offsets) else len(self.text)
+            return pos, pos
+        return self._offsets[norm_start], self._offsets[norm_end - 1] + 1
+
+    def _find_normalized(self, needle: str) -> int:
+        if len(needle) < 2 * NGRAM_CHARS - 1:
+            return self.normalized.find(needle)
+        # Any occurrence covers one indexed n-gram within its first
+        # NGRAM_CHARS characters, so probing those offsets finds it.
+        postings = self._postings()
+        found = -1
+        for offset in range(NGRAM_CHARS):
+            for pos in postings.get(needle[offset:offset + NGRAM_CHARS], ()):
+                start = pos - offset
+                if start >= 0 and (found < 0 or start < found) and self.normalized.startswith(needle, start):
+                    found = start
+        return found
+
+    def _find_fuzzy(self, needle: str) -> Optional[Tuple[int, int, float]]:
+        """Best approximate location of ``needle`` by n-gram seed voting.
+
+        Every indexed n-gram that also occurs in the needle votes for the
+        position where the needle would start. Votes within one n-gram
+        length of each other are pooled so that small insertions or
+        deletions in the copied span still agree. The score is the share of
+        the indexed n-grams the needle should cover that voted.
+        """
+
+        if len(needle) < NGRAM_CHARS * 2:
+            return None
+        postings = self._postings()
+        starts: List[int] = []
+        for offset in range(len(needle) - NGRAM_CHARS + 1):
+            hits = postings.get(needle[offset:offset + NGRAM_CHARS]) or ()
+            if len(hits) <= NGRAM_MAX_POSTINGS:
+                starts.extend(pos - offset for pos in hits)
+        if not starts:
+            return None
+        starts.sort()
+        best_count, best_lo, lo = 0, 0, 0
+        for hi, start in enumerate(starts):
+            while start - starts[lo] > NGRAM_CHARS:
+                lo += 1
+            if hi - lo + 1 > best_count:
+                best_count, best_lo = hi - lo + 1, lo
+        expected = (len(needle) - NGRAM_CHARS) // NGRAM_CHARS + 1
+        score = round(min(1.0, best_count / expected) * FUZZY_MATCH_MAX_SCORE, 3)
+        if score < FUZZY_MIN_SCORE:
+            return None
+        start = max(0, starts[best_lo])
+        end = min(len(self.normalized), start + len(needle))
+        return start, end, score
+
+    def locate(self, span: str, *, min_score: float = FUZZY_MIN_SCORE) -> Optional[SpanMatch]:
+        """Locate ``span`` in the original text and score the match.
+
+        Tries a verbatim match, then a match after normalization, then (when
+        ``min_score`` allows it) an approximate match.
+        """
+
+        if not span:
+            return None
+        pos = self.text.find(span)
+        if pos >= 0:
+            return SpanMatch(pos, pos + len(span), EXACT_MATCH_SCORE)
+        needle = normalize_text(span)
+        if not needle:
+            return None
+        npos = self._find_normalized(needle)
+        if npos >= 0:
+            start, end = self.to_original(npos, npos + len(needle))
+            return SpanMatch(start, end, NORMALIZED_MATCH_SCORE)
+        if min_score >= NORMALIZED_MATCH_SCORE:
+            return None
+        fuzzy = self._find_fuzzy(needle)
+        if fuzzy is None or fuzzy[2] < min_score:
+            return None
+        start, end = self.to_original(fuzzy[0], fuzzy[1])
+        return SpanMatch(start, end, fuzzy[2])
+
+    def find(self, span: str) -> Optional[Tuple[int, int]]:
+        """Locate ``span`` in the original text, exactly or after normalization."""
+
+        match = self.locate(span, min_score=NORMALIZED_MATCH_SCORE)
+        return (match.start, match.end) if match else None
+
+    def resolve(self, span: str) -> Optional[str]:
+        """Return the exact original substring matching ``span``, if any."""
+
+        loc = self.find(span)
+        return self.text[loc[0]:loc[1]] if loc else None
+
+
+def locate_evidence(events: List[Dict[str, Any]], index: TextIndex) -> List[Dict[str, Any]]:
+    """Copy of ``events`` with ``evidence_start``/``evidence_end``/``evidence_match_score``.
+
+    Offsets are into ``index.text``; all three are None when the span cannot
+    be located.
+    """
+
+    out: List[Dict[str, Any]] = []
+    for ev in events:
+        if not isinstance(ev, dict):
+            continue
+        match = index.locate(str(ev.get("evidence_span") or ""))
+        out.append(
+            {
+                **ev,
+                "evidence_start": match.start if match else None,
+                "evidence_end": match.end if match else None,
+                "evidence_match_score": match.score if match else None,
+            }
+        )
+    return out
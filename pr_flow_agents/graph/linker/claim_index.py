@@ -0,0 +1,302 @@
+"""Per-ticker vector index over linked-event claims for candidate retrieval.
+
+``LinkedEventStore.list_candidate_pool`` filters with a +/-120 day window
+around the event's date range. Related events outside the window are
+missed, and the pool fills with whatever is newest in the window.
+This index instead keeps one hashed TF-IDF vector per linked event, built
+from ``canonical_claim`` plus entities, in a memory-mapped file per ticker:
+
+    <PR_FLOW_CLAIM_INDEX_DIR>/<TICKER>/vectors.f32   float32, HASH_DIM x capacity
+    <PR_FLOW_CLAIM_INDEX_DIR>/<TICKER>/log.jsonl     append-only add/status log
+
+Vectors hold sublinear term frequencies and are L2-normalized. IDF comes
+from the index's own document frequencies and weights the query side only,
+so rows never need re-encoding as the corpus grows. The file is stored
+bucket-major, with one contiguous column per event. A query touches only its
+own 20-40 non-zero buckets, so an exact search reads those rows of the
+memmap instead of the whole matrix. At up to 1M events per ticker that is
+fast enough that an approximate structure is not needed. Cosine
+scores are multiplied by a date prior that decays with the distance
+between event dates but never drops below ``DATE_PRIOR_FLOOR``. Old events
+are down-weighted rather than excluded.
+
+The linker updates the index incrementally when it creates, supersedes or
+retracts linked events. A ticker without an index directory is backfilled
+from ``linked_events`` on first use. Unset ``PR_FLOW_CLAIM_INDEX_DIR`` to
+keep the Mongo date-window query.
+
+Index rows are written as the linker decides, before its Mongo writes are
+flushed. The linker drops the ticker's index when a flush fails, so a
+rolled-back run leaves no rows behind. A crash between the two can still
+leave rows for events that were never written. Search results are resolved
+against ``linked_events``, so such a row only costs a candidate slot.
+
+Each ticker directory has a single writer. A process takes an exclusive
+``flock`` on ``writer.lock`` when it opens the ticker. A second process gets
+``RuntimeError`` instead, and the linker falls back to the Mongo query for
+that ticker. Locking needs ``fcntl``, so on Windows only one process may use
+the directory.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import threading
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from pr_flow_agents.graph.linker.ranking import claim_tokens, date_ordinal
+
+CLAIM_INDEX_DIR_ENV = "PR_FLOW_CLAIM_INDEX_DIR"
+HASH_DIM = 512
+ENTITY_WEIGHT = 2.0
+INITIAL_CAPACITY = 1024
+BLOCK_ROWS = 65536
+DATE_PRIOR_DAYS = 365.0
+DATE_PRIOR_FLOOR = 0.5
+
+
+def _bucket(token: str, dim: int) -> int:
+    return zlib.crc32(token.encode("utf-8")) % dim
+
+
+def embed(claim: str, entities: Iterable[Any] = (), *, dim: int = HASH_DIM) -> np.ndarray:
+    """Hashed sublinear-TF vector of claim unigrams/bigrams and entities, L2-normalized."""
+    tokens = sorted(claim_tokens(claim))
+    words = [t for t in str(claim or "").lower().split() if t]
+    counts: Counter[int] = Counter(_bucket(t, dim) for t in tokens)
+    counts.update(_bucket(f"{a} {b}", dim) for a, b in zip(words, words[1:]))
+    vec = np.zeros(dim, dtype=np.float32)
+    for bucket, n in counts.items():
+        vec[bucket] += 1.0 + math.log(n)
+    for entity in entities or []:
+        name = str(entity or "").strip().lower()
+        if name:
+            vec[_bucket(f"e:{name}", dim)] += ENTITY_WEIGHT
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
+
+class TickerClaimIndex:
+    """Claim vectors and row metadata for one ticker."""
+
+    def __init__(self, path: Path, *, dim: int = HASH_DIM) -> None:
+        self._path = Path(path)
+        self._dim = dim
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # Per-row status codes and event-date ordinals (NaN if unknown),
+        # kept as arrays so search can mask and weight rows without Python loops.
+        self._status_codes: Dict[str, int] = {}
+        self._statuses = np.zeros(0, dtype=np.int16)
+        self._days = np.zeros(0, dtype=np.float64)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._lock_file = (self._path / "writer.lock").open("a+")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                self._lock_file.close()
+                raise RuntimeError(f"claim index {self._path} is held by another process") from None
+        self._log_path = self._path / "log.jsonl"
+        self._vec_path = self._path / "vectors.f32"
+        self._load()
+
+    def close(self) -> None:
+        """Release the writer lock; the instance must not be used afterwards."""
+        with self._lock:
+            if not self._lock_file.closed:
+                self._lock_file.close()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _open_vectors(self, capacity: int, path: Optional[Path] = None) -> np.memmap:
+        path = path or self._vec_path
+        mode = "r+" if path.exists() else "w+"
+        return np.memmap(path, dtype=np.float32, mode=mode, shape=(self._dim, capacity))
+
+    def _code(self, status: str) -> int:
+        return self._status_codes.setdefault(status, len(self._status_codes))
+
+    def _load(self) -> None:
+        statuses: List[int] = []
+        days: List[float] = []
+        if self._log_path.exists():
+            with self._log_path.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn final line after a crash
+                    if rec.get("op") == "add" and int(rec["row"]) == len(self._ids):
+                        self._rows[rec["id"]] = len(self._ids)
+                        self._ids.append(rec["id"])
+                        statuses.append(self._code(str(rec.get("status") or "ACTIVE")))
+                        days.append(float("nan") if rec.get("day") is None else float(rec["day"]))
+                    elif rec.get("op") == "status" and rec.get("id") in self._rows:
+                        statuses[self._rows[rec["id"]]] = self._code(str(rec.get("status") or ""))
+        self._statuses = np.array(statuses, dtype=np.int16)
+        self._days = np.array(days, dtype=np.float64)
+        size = self._vec_path.stat().st_size if self._vec_path.exists() else 0
+        capacity = max(INITIAL_CAPACITY, size // (4 * self._dim), len(self._ids))
+        self._vectors = self._open_vectors(capacity)
+        self._df = (np.asarray(self._vectors[:, : len(self._ids)]) != 0).sum(axis=1).astype(np.float64)
+
+    def _append_log(self, records: Sequence[Dict[str, Any]]) -> None:
+        with self._log_path.open("a", encoding="utf-8") as fh:
+            fh.write("".join(json.dumps(r, ensure_ascii=True) + "\n" for r in records))
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = self._vectors.shape[1]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        # Bucket-major layout: a larger capacity moves every column, so copy
+        # into a new file and swap it in.
+        tmp_path = self._vec_path.with_suffix(".tmp")
+        tmp_path.unlink(missing_ok=True)
+        grown = self._open_vectors(capacity, tmp_path)
+        n = len(self._ids)
+        for start in range(0, n, BLOCK_ROWS):
+            end = min(n, start + BLOCK_ROWS)
+            grown[:, start:end] = self._vectors[:, start:end]
+        grown.flush()
+        del grown
+        del self._vectors
+        os.replace(tmp_path, self._vec_path)
+        self._vectors = self._open_vectors(capacity)
+
+    def add_many(self, docs: Iterable[Dict[str, Any]]) -> int:
+        """Index linked-event docs not indexed yet; returns how many were added."""
+        with self._lock:
+            fresh = []
+            for doc in docs:
+                linked_event_id = str(doc.get("linked_event_id") or "")
+                if linked_event_id and linked_event_id not in self._rows:
+                    fresh.append(doc)
+            if not fresh:
+                # Still create the log so an empty ticker counts as built.
+                self._log_path.touch()
+                return 0
+            start = len(self._ids)
+            self._ensure_capacity(start + len(fresh))
+            block = np.stack([embed(str(d.get("canonical_claim") or ""), d.get("entities") or [], dim=self._dim) for d in fresh])
+            self._vectors[:, start : start + len(fresh)] = block.T
+            self._vectors.flush()
+            self._df += (block != 0).sum(axis=0)
+            records = []
+            codes: List[int] = []
+            days: List[float] = []
+            for offset, doc in enumerate(fresh):
+                linked_event_id = str(doc["linked_event_id"])
+                day = date_ordinal(doc.get("event_date"))
+                status = str(doc.get("status") or "ACTIVE")
+                self._rows[linked_event_id] = start + offset
+                self._ids.append(linked_event_id)
+                codes.append(self._code(status))
+                days.append(float("nan") if day is None else day)
+                records.append({"op": "add", "row": start + offset, "id": linked_event_id, "day": day, "status": status})
+            self._statuses = np.concatenate([self._statuses, np.array(codes, dtype=np.int16)])
+            self._days = np.concatenate([self._days, np.array(days, dtype=np.float64)])
+            # Vectors are flushed before the log names their rows, so a crash
+            # in between only leaves an unreferenced row to be overwritten.
+            self._append_log(records)
+            return len(fresh)
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        self.add_many([doc])
+
+    def set_status(self, linked_event_id: str, status: str) -> None:
+        with self._lock:
+            row = self._rows.get(linked_event_id)
+            code = self._code(status)
+            if row is None or self._statuses[row] == code:
+                return
+            self._statuses[row] = code
+            self._append_log([{"op": "status", "id": linked_event_id, "status": status}])
+
+    def search(
+        self,
+        *,
+        claim: str,
+        entities: Iterable[Any] = (),
+        event_date: Optional[str] = None,
+        k: int = 200,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Top ``k`` (linked_event_id, score) by prior-weighted cosine similarity."""
+        with self._lock:
+            n = len(self._ids)
+            if n == 0 or k <= 0:
+                return []
+            idf = np.log((1.0 + n) / (1.0 + self._df)) + 1.0
+            query = (embed(claim, entities, dim=self._dim) * idf).astype(np.float32)
+            buckets = np.flatnonzero(query)
+            if buckets.size == 0:
+                return []
+            weights = query[buckets]
+            scores = np.empty(n, dtype=np.float32)
+            for start in range(0, n, BLOCK_ROWS):
+                end = min(n, start + BLOCK_ROWS)
+                scores[start:end] = weights @ self._vectors[buckets, start:end]
+            day = date_ordinal(event_date)
+            if day is not None:
+                prior = np.nan_to_num(np.exp(-np.abs(self._days - day) / DATE_PRIOR_DAYS), nan=0.0)
+                scores *= (DATE_PRIOR_FLOOR + (1.0 - DATE_PRIOR_FLOOR) * prior).astype(np.float32)
+            if statuses:
+                allowed = [self._status_codes[s] for s in statuses if s in self._status_codes]
+                scores[~np.isin(self._statuses, allowed)] = -np.inf
+            k = min(int(k), n)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(self._ids[i], float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+
+class ClaimIndex:
+    """Registry of per-ticker indexes under one root directory."""
+
+    def __init__(self, root: str | os.PathLike[str], *, dim: int = HASH_DIM) -> None:
+        self._root = Path(root)
+        self._dim = dim
+        self._lock = threading.Lock()
+        self._tickers: Dict[str, TickerClaimIndex] = {}
+
+    def exists(self, ticker: str) -> bool:
+        key = ticker.upper()
+        return key in self._tickers or (self._root / key / "log.jsonl").exists()
+
+    def drop(self, ticker: str) -> None:
+        """Delete a ticker's index; the next use backfills it from ``linked_events``."""
+        key = ticker.upper()
+        with self._lock:
+            index = self._tickers.pop(key, None)
+            if index is not None:
+                index.close()
+            shutil.rmtree(self._root / key, ignore_errors=True)
+
+    def for_ticker(self, ticker: str) -> TickerClaimIndex:
+        key = ticker.upper()
+        with self._lock:
+            if key not in self._tickers:
+                self._tickers[key] = TickerClaimIndex(self._root / key, dim=self._dim)
+            return self._tickers[key]
+
+
+def claim_index_from_env() -> Optional[ClaimIndex]:
+    root = str(os.getenv(CLAIM_INDEX_DIR_ENV, "")).strip()
+    return ClaimIndex(root) if root else None
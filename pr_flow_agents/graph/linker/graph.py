@@ -8,11 +8,13 @@ from pr_flow_agents.graph.linker import nodes
 from pr_flow_agents.graph.linker.state import LinkerState
 
 
-def build_graph():
+def build_graph(checkpointer=None):
     builder = StateGraph(LinkerState)
 
     builder.add_node("load_silver_events", nodes.load_silver_events)
+    builder.add_node("assign_threads", nodes.assign_threads)
     builder.add_node("prepare_current_event", nodes.prepare_current_event)
+    builder.add_node("check_near_duplicate", nodes.check_near_duplicate)
     builder.add_node("retrieve_candidates", nodes.retrieve_candidates)
     builder.add_node("decide_action", nodes.decide_action)
     builder.add_node("refine_decision", nodes.refine_decision)
@@ -27,29 +29,41 @@ def build_graph():
         status = state.get("status")
         if status in {"SKIPPED", "NO_SILVER_EVENTS", "ERROR"}:
             return "finalize_output"
-        return "prepare_current_event"
+        return "assign_threads"
 
     def _after_prepare(state: LinkerState) -> str:
         cursor = int(state.get("cursor") or 0)
         total = len(state.get("silver_events") or [])
-        return "refresh_scratchpads" if cursor >= total else "retrieve_candidates"
+        return "refresh_scratchpads" if cursor >= total else "check_near_duplicate"
+
+    def _after_near_duplicate(state: LinkerState) -> str:
+        return "apply_decision" if (state.get("decision") or {}).get("short_circuit") else "retrieve_candidates"
 
     builder.add_conditional_edges(
         "load_silver_events",
         _after_load,
         {
-            "prepare_current_event": "prepare_current_event",
+            "assign_threads": "assign_threads",
             "finalize_output": "finalize_output",
         },
     )
+    builder.add_edge("assign_threads", "prepare_current_event")
     builder.add_conditional_edges(
         "prepare_current_event",
         _after_prepare,
         {
-            "retrieve_candidates": "retrieve_candidates",
+            "check_near_duplicate": "check_near_duplicate",
             "refresh_scratchpads": "refresh_scratchpads",
         },
     )
+    builder.add_conditional_edges(
+        "check_near_duplicate",
+        _after_near_duplicate,
+        {
+            "apply_decision": "apply_decision",
+            "retrieve_candidates": "retrieve_candidates",
+        },
+    )
 
     builder.add_edge("retrieve_candidates", "decide_action")
     builder.add_edge("decide_action", "refine_decision")
@@ -59,4 +73,4 @@ def build_graph():
     builder.add_edge("refresh_scratchpads", "finalize_output")
     builder.add_edge("finalize_output", END)
 
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
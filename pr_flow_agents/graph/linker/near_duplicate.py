@@ -0,0 +1,106 @@
+"""MinHash/LSH near-duplicate detection for silver events against linked events.
+
+Reprocessed releases and syndicated copies produce silver events whose claims
+match existing linked events exactly or nearly. Each linked event stores a
+MinHash signature over its normalized claim word shingles, entities and
+numbers, and the LSH band keys of that signature (``minhash`` /
+``lsh_bands``). ``linked_events`` has a multikey index on ``lsh_bands``.
+
+A silver event whose best match has an estimated Jaccard similarity of at
+least ``AUTO_DUPLICATE_THRESHOLD`` is linked as DUPLICATE without an LLM
+call, provided the event type and event date (both possibly empty) match.
+Matches between ``BORDERLINE_THRESHOLD`` and the auto threshold are only
+logged and go to the model as usual.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pr_flow_agents.graph.linker.ranking import number_tokens
+
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_WORDS = 3
+AUTO_DUPLICATE_THRESHOLD = 0.9
+BORDERLINE_THRESHOLD = 0.6
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_rng = np.random.default_rng(0x5EED)
+# Multiply-add hashes mod 2**32; odd multipliers keep each one a bijection.
+_A = (_rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64) | np.uint64(1))
+_B = _rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+_WORD_RE = re.compile(r"[a-z0-9]+(?:[.\-][a-z0-9]+)*")
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    linked_event_id: str
+    score: float
+    exact: bool
+
+
+def normalize_claim(text: str) -> str:
+    return " ".join(_WORD_RE.findall(str(text or "").lower()))
+
+
+def shingles(claim: str, entities: Iterable[Any] = (), numbers: Iterable[Any] = ()) -> set[str]:
+    words = normalize_claim(claim).split()
+    out = {" ".join(words[i : i + SHINGLE_WORDS]) for i in range(max(1, len(words) - SHINGLE_WORDS + 1))}
+    out.discard("")
+    out.update(f"e:{str(x).strip().lower()}" for x in entities or [] if str(x).strip())
+    out.update(f"n:{x}" for x in number_tokens(numbers or []))
+    return out
+
+
+def minhash(features: set[str]) -> List[int]:
+    if not features:
+        return []
+    x = np.array([zlib.crc32(f.encode("utf-8")) for f in features], dtype=np.uint64)
+    hashed = (np.outer(_A, x) + _B[:, None]) & _MASK32
+    return [int(v) for v in hashed.min(axis=1)]
+
+
+def lsh_bands(signature: List[int]) -> List[str]:
+    if len(signature) != NUM_PERM:
+        return []
+    return [
+        f"{band}:{zlib.crc32(np.asarray(signature[band * LSH_ROWS : (band + 1) * LSH_ROWS], dtype=np.uint32).tobytes()):08x}"
+        for band in range(LSH_BANDS)
+    ]
+
+
+def event_signature(event: Dict[str, Any], *, claim_key: str = "claim") -> Tuple[List[int], List[str]]:
+    """(minhash, lsh_bands) for a silver payload or a linked event (``claim_key="canonical_claim"``)."""
+    signature = minhash(shingles(str(event.get(claim_key) or ""), event.get("entities") or [], event.get("numbers") or []))
+    return signature, lsh_bands(signature)
+
+
+def similarity(a: List[int], b: List[int]) -> float:
+    if len(a) != NUM_PERM or len(b) != NUM_PERM:
+        return 0.0
+    return float(np.mean(np.asarray(a) == np.asarray(b)))
+
+
+def best_match(event: Dict[str, Any], signature: List[int], candidates: List[Dict[str, Any]]) -> Optional[DuplicateMatch]:
+    """Highest-similarity candidate with the same event type and event date."""
+    claim = normalize_claim(str(event.get("claim") or ""))
+    event_type = str(event.get("event_type") or "").strip().upper()
+    event_date = str(event.get("event_date") or "").strip()
+    best: Optional[DuplicateMatch] = None
+    for cand in candidates:
+        if str(cand.get("event_type") or "").strip().upper() != event_type:
+            continue
+        if str(cand.get("event_date") or "").strip() != event_date:
+            continue
+        exact = bool(claim) and claim == normalize_claim(str(cand.get("canonical_claim") or ""))
+        score = 1.0 if exact else similarity(signature, list(cand.get("minhash") or []))
+        if best is None or score > best.score:
+            best = DuplicateMatch(str(cand.get("linked_event_id") or ""), score, exact)
+    return best
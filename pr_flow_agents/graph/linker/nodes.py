@@ -4,30 +4,72 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from pr_flow_agents.graph.checkpointing import get_checkpointer
+from pr_flow_agents.graph.linker.claim_index import TickerClaimIndex, claim_index_from_env
+from pr_flow_agents.graph.linker.near_duplicate import (
+    AUTO_DUPLICATE_THRESHOLD,
+    BORDERLINE_THRESHOLD,
+    best_match,
+    event_signature,
+)
 from pr_flow_agents.graph.linker.prompts import (
     LINKER_DECISION_PROMPT_TEMPLATE,
     LINKER_DECISION_REFINER_PROMPT_TEMPLATE,
+    LINKER_THREAD_BATCH_PROMPT_TEMPLATE,
     LINKER_THREAD_PROMPT_TEMPLATE,
 )
+from pr_flow_agents.graph.linker.ranking import rank_candidates, rank_threads, score_candidates
 from pr_flow_agents.graph.linker.state import LinkerState
+from pr_flow_agents.graph.linker.working_set import LinkerWorkingSet
 from pr_flow_agents.llm import generate_json
 from pr_flow_agents.logging_utils import get_logger
+from pr_flow_agents.storage.event_dates import event_date_fields
 from pr_flow_agents.storage.extracted_event_store import ExtractedEventStore
 from pr_flow_agents.storage.linked_event_store import LinkedEventStore
 from pr_flow_agents.storage.models import LinkedEventDocument
 from pr_flow_agents.storage.thread_scratchpad_store import ThreadScratchpadStore
+from pr_flow_agents.storage.ticker_lock_store import TickerLease, TickerLockStore
+from pr_flow_agents.storage.unit_of_work import UnitOfWork
 
 logger = get_logger(__name__)
 
 TOP_K = 10
+CANDIDATE_POOL_LIMIT = 200
+CANDIDATE_DAYS_WINDOW = 120
 ACTIVE_STATUSES = ("ACTIVE", "SUPERSEDED")
+# Events per batched thread-assignment call; larger releases are split.
+THREAD_BATCH_MAX_EVENTS = 25
+# Existing threads (from thread_scratchpads) offered for reuse per batch,
+# picked from the whole catalog by relevance to the batch (rank_threads).
+THREAD_CATALOG_LIMIT = 100
+# Run refine_decision only when the first decision needs it (see
+# _refine_reason). Overridable per run via state["refine_gate"].
+REFINE_GATE_DEFAULT = True
+# How the working set sends queued writes: "bulk" flushes them through a
+# UnitOfWork as bulk_write batches (in a transaction when supported),
+# "sequential" replays them call by call. Overridable via state["apply_mode"].
+APPLY_MODES = ("bulk", "sequential")
+APPLY_MODE_DEFAULT = "bulk"
+# Tickers whose pre-existing linked events got minhash/lsh_bands this process.
+_signatures_backfilled: set[str] = set()
 
 _silver_store = ExtractedEventStore()
 _linked_store = LinkedEventStore()
 _scratchpad_store = ThreadScratchpadStore()
+# Optional vector index over linked-event claims (PR_FLOW_CLAIM_INDEX_DIR).
+_claim_index = claim_index_from_env()
+# Working sets of in-flight runs, keyed by state["working_set_key"].
+_working_sets: Dict[str, LinkerWorkingSet] = {}
+# Single writer per ticker: a run holds its ticker's lease from working-set
+# load to flush, so concurrent runs (API, batch, replay) cannot overwrite
+# each other's decisions. Keyed like _working_sets.
+_lock_store = TickerLockStore()
+_leases: Dict[str, TickerLease] = {}
 
 try:
     import mlflow
@@ -133,15 +175,105 @@ def _guess_thread_for_event(
     return thread_id, thread_name
 
 
+def _format_thread_catalog(threads: List[Dict[str, Any]]) -> str:
+    lines = []
+    for doc in threads:
+        thread_id = str(doc.get("thread_id") or "").strip()
+        if not thread_id:
+            continue
+        line = f"- {thread_id}: {str(doc.get('thread_name') or '').strip() or 'General'}"
+        claims = [str(x).strip() for x in (doc.get("latest_claims") or []) if str(x).strip()]
+        if claims:
+            line += f" (latest: {claims[0][:160]})"
+        lines.append(line)
+    return "\n".join(lines) if lines else "(none yet)"
+
+
+def _assign_threads_batch(
+    *,
+    ticker: str,
+    sector: Optional[str],
+    events: List[Dict[str, Any]],
+    existing_threads: str,
+) -> Dict[int, Dict[str, str]]:
+    """One LLM call for a batch of events; event index -> thread id/name."""
+    prompt = LINKER_THREAD_BATCH_PROMPT_TEMPLATE.format(
+        ticker=str(ticker or "").upper(),
+        sector=str(sector or "").strip() or "unknown",
+        existing_threads=existing_threads,
+        events=json.dumps(
+            [
+                {
+                    "event_index": idx,
+                    "event_type": ev.get("event_type"),
+                    "event_date": ev.get("event_date"),
+                    "claim": ev.get("claim"),
+                    "entities": ev.get("entities") or [],
+                }
+                for idx, ev in enumerate(events)
+            ],
+            ensure_ascii=True,
+        ),
+    )
+    raw = generate_json(prompt)
+    items = (raw or {}).get("assignments") if isinstance(raw, dict) else raw
+    out: Dict[int, Dict[str, str]] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            idx = int(item.get("event_index"))
+        except (TypeError, ValueError):
+            continue
+        thread_id = str(item.get("thread_id") or "").strip()
+        if 0 <= idx < len(events) and thread_id and idx not in out:
+            out[idx] = {
+                "thread_id": thread_id,
+                "thread_name": str(item.get("thread_name") or "").strip() or "General",
+            }
+    return out
+
+
+def _ticker_index(ticker: str) -> Optional[TickerClaimIndex]:
+    """The ticker's claim index, backfilled from linked_events on first use."""
+    if _claim_index is None or not ticker:
+        return None
+    try:
+        built = _claim_index.exists(ticker)
+        index = _claim_index.for_ticker(ticker)
+        if not built:
+            added = index.add_many(_linked_store.iter_by_ticker(ticker))
+            logger.info("linker_claim_index_backfill_done ticker=%s added=%s", ticker.upper(), added)
+        return index
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("linker_claim_index_unavailable ticker=%s error=%s", ticker, exc)
+        return None
+
+
+def _working_set_index(working_set: LinkerWorkingSet) -> Optional[TickerClaimIndex]:
+    # An in-memory (replay) working set is not reflected in the live index.
+    return None if working_set.complete else _ticker_index(working_set.ticker)
+
+
+def _index_status(working_set: LinkerWorkingSet, linked_event_id: str, status: str) -> None:
+    index = _working_set_index(working_set)
+    if index is None:
+        return
+    try:
+        index.set_status(linked_event_id, status)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("linker_claim_index_status_failed linked_event_id=%s error=%s", linked_event_id, exc)
+
+
 def _score_candidate(
     *,
     new_event: Dict[str, Any],
     candidate: Dict[str, Any],
     provisional_thread_id: str,
 ) -> float:
-    # Kept for backward compatibility; no longer used now that
-    # candidate selection is delegated to the LLM in decide_action.
-    return 0.0
+    # Single-candidate form of ranking.score_candidates; retrieve_candidates
+    # scores the whole pool at once.
+    return float(score_candidates(new_event, [candidate])[0])
 
 
 def _build_scratchpad_text(doc: Optional[Dict[str, Any]]) -> str:
@@ -183,16 +315,24 @@ def _create_linked_event(
     thread_id: str,
     silver_event_id: str,
     silver_event: Dict[str, Any],
+    working_set: LinkerWorkingSet,
     supersedes: Optional[str] = None,
 ) -> str:
     now = datetime.utcnow()
+    signature, bands = event_signature(silver_event)
+    event_date = str(silver_event.get("event_date") or "") or None
     model = LinkedEventDocument(
         linked_event_id=f"le_{uuid4().hex}",
         ticker=ticker.upper(),
         thread_id=thread_id,
         event_type=str(silver_event.get("event_type") or "OTHER"),
-        event_date=str(silver_event.get("event_date") or "") or None,
+        event_date=event_date,
+        **event_date_fields(event_date),
         canonical_claim=str(silver_event.get("claim") or ""),
+        entities=[str(x) for x in (silver_event.get("entities") or []) if str(x).strip()],
+        numbers=[str(x) for x in (silver_event.get("numbers") or []) if str(x).strip()],
+        minhash=signature,
+        lsh_bands=bands,
         status="ACTIVE",
         supporting_silver_event_ids=[silver_event_id],
         supersedes=supersedes,
@@ -200,7 +340,122 @@ def _create_linked_event(
         created_at=now,
         updated_at=now,
     )
-    return _linked_store.create(model)
+    linked_event_id = working_set.create(model)
+    index = _working_set_index(working_set)
+    if index is not None:
+        try:
+            index.add(model.model_dump(mode="json"))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("linker_claim_index_add_failed linked_event_id=%s error=%s", linked_event_id, exc)
+    return linked_event_id
+
+
+def linker_lease_name(ticker: str) -> str:
+    """Lease serializing gold-state writers of ``ticker`` (see storage/ticker_lock_store.py)."""
+    return f"linker:{ticker.upper()}"
+
+
+def _load_working_set(key: str, state: LinkerState) -> LinkerWorkingSet:
+    ticker = str(state.get("ticker") or "")
+    started = time.perf_counter()
+    lease = _lock_store.acquire(linker_lease_name(ticker))
+    logger.info("linker_ticker_lease_acquired ticker=%s wait_ms=%.1f", ticker, (time.perf_counter() - started) * 1000.0)
+    try:
+        working_set = _build_working_set(ticker, state)
+    except Exception:
+        _release_lease(lease)
+        raise
+    _leases[key] = lease
+    _working_sets[key] = working_set
+    return working_set
+
+
+def _release_lease(lease: Optional[TickerLease]) -> None:
+    if lease is None:
+        return
+    try:
+        lease.release()
+    except Exception as exc:  # noqa: BLE001
+        # The lease expires on its own.
+        logger.warning("linker_ticker_lease_release_failed name=%s error=%s", lease.name, exc)
+
+
+def _build_working_set(ticker: str, state: LinkerState) -> LinkerWorkingSet:
+    _backfill_signatures(ticker)
+    payloads = [_extract_event_payload(doc) for doc in state.get("silver_events") or []]
+    apply_mode = str(state.get("apply_mode") or APPLY_MODE_DEFAULT)
+    if apply_mode not in APPLY_MODES:
+        apply_mode = APPLY_MODE_DEFAULT
+    working_set = LinkerWorkingSet(
+        ticker,
+        linked_store=_linked_store,
+        scratchpad_store=_scratchpad_store,
+        # A resumed run cannot replay writes queued in a process that died.
+        write_through=get_checkpointer() is not None,
+        unit_of_work=UnitOfWork() if apply_mode == "bulk" else None,
+    )
+    working_set.load(
+        event_dates=[str(ev.get("event_date") or "") for ev in payloads],
+        lsh_bands=sorted({band for ev in payloads for band in event_signature(ev)[1]}),
+        statuses=ACTIVE_STATUSES,
+        days_window=CANDIDATE_DAYS_WINDOW,
+        pool_limit=CANDIDATE_POOL_LIMIT,
+    )
+    return working_set
+
+
+def _working_set(state: LinkerState) -> LinkerWorkingSet:
+    """The run's working set; reloaded from Mongo when a resumed run starts in a new process."""
+    key = str(state.get("working_set_key") or "")
+    working_set = _working_sets.get(key)
+    if working_set is None:
+        key = key or str(state.get("press_release_id") or uuid4().hex)
+        working_set = _load_working_set(key, state)
+    return working_set
+
+
+def attach_working_set(working_set: LinkerWorkingSet) -> str:
+    """Register a caller-built working set; put the returned key in state["working_set_key"]."""
+    key = uuid4().hex
+    _working_sets[key] = working_set
+    return key
+
+
+def detach_working_set(key: str) -> None:
+    _working_sets.pop(key, None)
+
+
+def _release_working_set(state: LinkerState) -> Optional[LinkerWorkingSet]:
+    key = str(state.get("working_set_key") or "")
+    working_set = _working_sets.pop(key, None)
+    lease = _leases.pop(key, None)
+    if working_set is not None:
+        started = time.perf_counter()
+        try:
+            if lease is not None and lease.expired:
+                # Another run may have loaded the ticker since; flushing now
+                # would overwrite its writes.
+                raise RuntimeError(f"linker lease for {working_set.ticker} expired before flush")
+            sent = working_set.flush()
+        except Exception:
+            # Index rows for this run were written as it decided; without
+            # their Mongo writes they would never be reconciled.
+            if _claim_index is not None and not working_set.complete:
+                _claim_index.drop(working_set.ticker)
+                logger.warning("linker_claim_index_dropped ticker=%s reason=flush_failed", working_set.ticker)
+            raise
+        finally:
+            _release_lease(lease)
+        logger.info(
+            "linker_working_set_flushed ticker=%s apply_mode=%s ops=%s mongo_reads=%s mongo_writes=%s flush_ms=%.1f",
+            working_set.ticker,
+            state.get("apply_mode") or APPLY_MODE_DEFAULT,
+            sent,
+            working_set.reads,
+            working_set.writes,
+            (time.perf_counter() - started) * 1000.0,
+        )
+    return working_set
 
 
 @_trace(span_type="CHAIN", name="load_silver_events")
@@ -221,6 +476,9 @@ def load_silver_events(state: LinkerState) -> LinkerState:
 
     silver = _silver_store.list_by_release(press_release_id)
     status = "PENDING" if silver else "NO_SILVER_EVENTS"
+    working_set_key = uuid4().hex
+    if silver:
+        _load_working_set(working_set_key, {**state, "ticker": ticker, "silver_events": silver})
     logger.info(
         "linker_load_silver_events_done press_release_id=%s ticker=%s silver_count=%s status=%s",
         press_release_id,
@@ -237,6 +495,7 @@ def load_silver_events(state: LinkerState) -> LinkerState:
         **state,
         "ticker": ticker,
         "silver_events": silver,
+        "working_set_key": working_set_key,
         "cursor": 0,
         "decisions": [],
         "impacted_threads": {},
@@ -244,11 +503,75 @@ def load_silver_events(state: LinkerState) -> LinkerState:
         "linked_events_duplicates": 0,
         "linked_events_updated": 0,
         "linked_events_retracted": 0,
+        "refine_calls": 0,
+        "refine_skipped": 0,
+        "near_duplicate_short_circuits": 0,
+        "refine_ms": 0.0,
         "status": status,  # type: ignore[typeddict-item]
         "error": None,
     }
 
 
+@_trace(span_type="CHAIN", name="assign_threads")
+def assign_threads(state: LinkerState) -> LinkerState:
+    """Assign a provisional thread to every silver event up front.
+
+    Replaces one thread-guess call per event with one call per
+    THREAD_BATCH_MAX_EVENTS events, and shows the model the ticker's
+    existing threads so it can reuse them: all of them when they fit in
+    THREAD_CATALOG_LIMIT, else the ones most relevant to the batch. Events
+    the batch call leaves unassigned fall back to the per-event guess in
+    prepare_current_event.
+    """
+    ticker = str(state.get("ticker") or "")
+    silver_events = state.get("silver_events") or []
+    events = [_extract_event_payload(doc) for doc in silver_events]
+    catalog = _working_set(state).scratchpad_catalog()
+
+    assignments: List[Optional[Dict[str, str]]] = [None] * len(events)
+    calls = 0
+    for start in range(0, len(events), THREAD_BATCH_MAX_EVENTS):
+        batch = events[start : start + THREAD_BATCH_MAX_EVENTS]
+        calls += 1
+        try:
+            assigned = _assign_threads_batch(
+                ticker=ticker,
+                sector=state.get("sector"),
+                events=batch,
+                existing_threads=_format_thread_catalog(rank_threads(batch, catalog, k=THREAD_CATALOG_LIMIT)),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "linker_assign_threads_failed ticker=%s batch_start=%s error=%s",
+                ticker,
+                start,
+                exc,
+            )
+            continue
+        for idx, assignment in assigned.items():
+            assignments[start + idx] = assignment
+
+    assigned_count = sum(1 for a in assignments if a)
+    logger.info(
+        "linker_assign_threads_done ticker=%s events=%s assigned=%s calls=%s existing_threads=%s",
+        ticker,
+        len(events),
+        assigned_count,
+        calls,
+        len(catalog),
+    )
+    if _mlflow_enabled():
+        mlflow.log_metric("linker_thread_assign_calls", float(calls))
+        mlflow.log_metric("linker_thread_assign_missing", float(len(events) - assigned_count))
+    return {
+        **state,
+        "thread_assignments": assignments,
+        "existing_thread_ids": sorted(
+            {str(doc.get("thread_id") or "") for doc in catalog if str(doc.get("thread_id") or "").strip()}
+        ),
+    }
+
+
 @_trace(span_type="CHAIN", name="prepare_current_event")
 def prepare_current_event(state: LinkerState) -> LinkerState:
     silver_events = state.get("silver_events") or []
@@ -258,15 +581,18 @@ def prepare_current_event(state: LinkerState) -> LinkerState:
     silver_doc = silver_events[cursor]
     silver_event_id = str(silver_doc.get("_id") or "")
     silver_event = _extract_event_payload(silver_doc)
-    thread_id, thread_name = _guess_thread_for_event(
-        ticker=str(state.get("ticker") or ""),
-        sector=state.get("sector"),
-        event=silver_event,
-    )
-    scratchpad_doc = _scratchpad_store.get(
-        ticker=str(state.get("ticker") or ""),
-        thread_id=thread_id,
-    )
+    assignments = state.get("thread_assignments") or []
+    assignment = assignments[cursor] if cursor < len(assignments) else None
+    if assignment:
+        thread_id = assignment["thread_id"]
+        thread_name = assignment["thread_name"]
+    else:
+        thread_id, thread_name = _guess_thread_for_event(
+            ticker=str(state.get("ticker") or ""),
+            sector=state.get("sector"),
+            event=silver_event,
+        )
+    scratchpad_doc = _working_set(state).scratchpad(thread_id)
     return {
         **state,
         "current_silver_event_id": silver_event_id,
@@ -279,26 +605,103 @@ def prepare_current_event(state: LinkerState) -> LinkerState:
     }
 
 
+def _backfill_signatures(ticker: str) -> None:
+    key = ticker.upper()
+    if key in _signatures_backfilled:
+        return
+    items = []
+    for doc in _linked_store.iter_missing_signatures(ticker):
+        signature, bands = event_signature(doc, claim_key="canonical_claim")
+        items.append((str(doc.get("linked_event_id") or ""), signature, bands))
+    updated = _linked_store.set_signatures(items)
+    _signatures_backfilled.add(key)
+    if items:
+        logger.info("linker_signature_backfill_done ticker=%s updated=%s", key, updated)
+
+
+@_trace(span_type="CHAIN", name="check_near_duplicate")
+def check_near_duplicate(state: LinkerState) -> LinkerState:
+    """Link exact / near-duplicate silver events as DUPLICATE without LLM calls."""
+    silver_event_id = str(state.get("current_silver_event_id") or "")
+    event = state.get("current_silver_event") or {}
+    try:
+        signature, bands = event_signature(event)
+        pool = _working_set(state).find_by_lsh_bands(bands, statuses=ACTIVE_STATUSES)
+        match = best_match(event, signature, pool)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("linker_near_duplicate_failed silver_event_id=%s error=%s", silver_event_id, exc)
+        match = None
+
+    if match is None or match.score < AUTO_DUPLICATE_THRESHOLD:
+        if match is not None and match.score >= BORDERLINE_THRESHOLD:
+            logger.info(
+                "linker_near_duplicate_borderline silver_event_id=%s target=%s score=%.3f",
+                silver_event_id,
+                match.linked_event_id,
+                match.score,
+            )
+        return {**state, "decision": {}}
+
+    target = next(c for c in pool if str(c.get("linked_event_id") or "") == match.linked_event_id)
+    decision = {
+        "action": "DUPLICATE",
+        "new_event_id": silver_event_id,
+        "target_linked_event_id": match.linked_event_id,
+        "thread_id": str(target.get("thread_id") or state.get("provisional_thread_id") or ""),
+        "reason": f"near_duplicate_short_circuit score={match.score:.3f} exact={match.exact}",
+        "short_circuit": True,
+        "similarity": round(match.score, 4),
+    }
+    logger.info(
+        "linker_near_duplicate_short_circuit silver_event_id=%s target=%s score=%.3f exact=%s",
+        silver_event_id,
+        match.linked_event_id,
+        match.score,
+        match.exact,
+    )
+    return {
+        **state,
+        "candidates": [target],
+        "decision": decision,
+        "near_duplicate_short_circuits": int(state.get("near_duplicate_short_circuits") or 0) + 1,
+    }
+
+
 @_trace(span_type="CHAIN", name="retrieve_candidates")
 def retrieve_candidates(state: LinkerState) -> LinkerState:
     ticker = str(state.get("ticker") or "")
     event = state.get("current_silver_event") or {}
-    candidates = _linked_store.list_candidate_pool(
-        ticker=ticker,
-        statuses=ACTIVE_STATUSES,
-        event_date=str(event.get("event_date") or ""),
-        days_window=120,
-        limit=200,
-    )
-    top = list(candidates or [])[:TOP_K]
+    working_set = _working_set(state)
+    index = _working_set_index(working_set)
+    if index is not None:
+        hits = index.search(
+            claim=str(event.get("claim") or ""),
+            entities=event.get("entities") or [],
+            event_date=str(event.get("event_date") or ""),
+            k=CANDIDATE_POOL_LIMIT,
+            statuses=ACTIVE_STATUSES,
+        )
+        candidates = working_set.get_many([i for i, _ in hits], statuses=ACTIVE_STATUSES)
+    else:
+        candidates = working_set.candidate_pool(
+            event_date=str(event.get("event_date") or ""),
+            statuses=ACTIVE_STATUSES,
+            limit=CANDIDATE_POOL_LIMIT,
+        )
+    pool = list(candidates or [])
+    top = rank_candidates(event, pool, k=TOP_K)
     logger.info(
-        "linker_retrieve_candidates_done ticker=%s silver_event_id=%s candidates=%s",
+        "linker_retrieve_candidates_done ticker=%s silver_event_id=%s source=%s pool=%s candidates=%s top_score=%s",
         ticker,
         state.get("current_silver_event_id"),
+        "claim_index" if index is not None else "mongo",
+        len(pool),
         len(top),
+        top[0]["rank_score"] if top else None,
     )
     if _mlflow_enabled():
         mlflow.log_metric("linker_last_candidate_count", float(len(top)))
+        mlflow.log_metric("linker_last_candidate_pool_count", float(len(pool)))
     return {**state, "candidates": top}
 
 
@@ -354,6 +757,21 @@ def decide_action(state: LinkerState) -> LinkerState:
     return {**state, "decision": decision}
 
 
+def _refine_reason(
+    decision: Dict[str, Any], candidates: List[Dict[str, Any]], known_thread_ids: set[str]
+) -> Optional[str]:
+    """Why the first decision needs refine_decision, or None to accept it as is."""
+    action = str(decision.get("action") or "NEW").upper()
+    if candidates and action != "NEW":
+        return "merge_action"
+    if str(decision.get("thread_id") or "").strip() not in known_thread_ids:
+        return "unknown_thread"
+    target_id = decision.get("target_linked_event_id")
+    if target_id and target_id not in {c.get("linked_event_id") for c in candidates}:
+        return "target_not_in_candidates"
+    return None
+
+
 @_trace(span_type="CHAIN", name="refine_decision")
 def refine_decision(state: LinkerState) -> LinkerState:
     silver_event_id = str(state.get("current_silver_event_id") or "")
@@ -377,6 +795,19 @@ def refine_decision(state: LinkerState) -> LinkerState:
             existing_tids.append(tid)
     existing_tids = sorted(set(existing_tids))
 
+    if bool(state.get("refine_gate", REFINE_GATE_DEFAULT)):
+        known = set(existing_tids) | set(state.get("existing_thread_ids") or [])
+        reason = _refine_reason(initial_decision, candidates, known)
+        if reason is None:
+            logger.info(
+                "linker_refine_decision_skipped silver_event_id=%s action=%s thread=%s",
+                silver_event_id,
+                str(initial_decision.get("action") or ""),
+                initial_decision.get("thread_id"),
+            )
+            return {**state, "refine_skipped": int(state.get("refine_skipped") or 0) + 1}
+        logger.info("linker_refine_decision_gate silver_event_id=%s reason=%s", silver_event_id, reason)
+
     prompt = LINKER_DECISION_REFINER_PROMPT_TEMPLATE.format(
         new_event_id=silver_event_id,
         initial_decision=json.dumps(initial_decision, ensure_ascii=True),
@@ -403,8 +834,11 @@ def refine_decision(state: LinkerState) -> LinkerState:
             ensure_ascii=True,
         ),
     )
+    started = time.perf_counter()
+    refine_calls = int(state.get("refine_calls") or 0) + 1
     try:
         raw = generate_json(prompt)
+        refine_ms = float(state.get("refine_ms") or 0.0) + (time.perf_counter() - started) * 1000.0
         refined = _normalize_decision(
             raw=raw,
             new_event_id=silver_event_id,
@@ -422,14 +856,14 @@ def refine_decision(state: LinkerState) -> LinkerState:
             refined.get("thread_id"),
             refined.get("target_linked_event_id"),
         )
-        return {**state, "decision": refined}
+        return {**state, "decision": refined, "refine_calls": refine_calls, "refine_ms": refine_ms}
     except Exception as exc:  # noqa: BLE001
         logger.warning(
             "linker_refine_decision_failed silver_event_id=%s error=%s",
             silver_event_id,
             exc,
         )
-        return state
+        return {**state, "refine_calls": refine_calls}
 
 
 @_trace(span_type="CHAIN", name="apply_decision")
@@ -446,8 +880,9 @@ def apply_decision(state: LinkerState) -> LinkerState:
         or f"{ticker}:General"
     )
     reason = str(decision.get("reason") or "")
+    working_set = _working_set(state)
 
-    target_doc = _linked_store.get(str(target_id)) if target_id else None
+    target_doc = working_set.get(str(target_id)) if target_id else None
     if action in {"DUPLICATE", "UPDATE", "RETRACT"} and not target_doc:
         action = "NEW"
         target_id = None
@@ -468,9 +903,10 @@ def apply_decision(state: LinkerState) -> LinkerState:
             thread_id=thread_id,
             silver_event_id=silver_event_id,
             silver_event=silver_event,
+            working_set=working_set,
         )
     elif action == "DUPLICATE":
-        applied["applied"] = _linked_store.append_supporting_silver(
+        applied["applied"] = working_set.append_supporting_silver(
             str(target_id), silver_event_id
         )
     elif action == "UPDATE":
@@ -480,21 +916,25 @@ def apply_decision(state: LinkerState) -> LinkerState:
             thread_id=target_thread,
             silver_event_id=silver_event_id,
             silver_event=silver_event,
+            working_set=working_set,
             supersedes=str(target_id),
         )
-        _linked_store.mark_superseded(
+        working_set.mark_superseded(
             old_linked_event_id=str(target_id), new_linked_event_id=new_id
         )
+        _index_status(working_set, str(target_id), "SUPERSEDED")
         applied["thread_id"] = target_thread
         applied["created_linked_event_id"] = new_id
     elif action == "RETRACT":
         target_thread = str((target_doc or {}).get("thread_id") or thread_id)
-        _linked_store.mark_retracted(str(target_id))
+        working_set.mark_retracted(str(target_id))
+        _index_status(working_set, str(target_id), "RETRACTED")
         new_id = _create_linked_event(
             ticker=ticker,
             thread_id=target_thread,
             silver_event_id=silver_event_id,
             silver_event=silver_event,
+            working_set=working_set,
             supersedes=str(target_id),
         )
         applied["thread_id"] = target_thread
@@ -550,18 +990,13 @@ def advance_cursor(state: LinkerState) -> LinkerState:
     return {**state, "cursor": int(state.get("cursor") or 0) + 1}
 
 
-@_trace(span_type="CHAIN", name="refresh_scratchpads")
-def refresh_scratchpads(state: LinkerState) -> LinkerState:
-    ticker = str(state.get("ticker") or "")
-    impacted = state.get("impacted_threads") or {}
+def refresh_thread_scratchpads(working_set: LinkerWorkingSet, ticker: str, impacted: Dict[str, str]) -> None:
+    """Rebuild the scratchpads of ``impacted`` threads (thread id -> name) in the working set."""
+    # One lookup for all threads; per status, so ACTIVE-first needs no second query.
+    latest_by_thread = working_set.latest_by_threads(list(impacted), statuses=ACTIVE_STATUSES, limit=10)
     for thread_id, thread_name in impacted.items():
-        latest = _linked_store.list_by_thread(
-            ticker=ticker, thread_id=thread_id, statuses=("ACTIVE",), limit=10
-        )
-        if not latest:
-            latest = _linked_store.list_by_thread(
-                ticker=ticker, thread_id=thread_id, statuses=ACTIVE_STATUSES, limit=10
-            )
+        docs = latest_by_thread.get(thread_id) or []
+        latest = [x for x in docs if x.get("status") == "ACTIVE"][:10] or docs[:10]
         latest_ids = [
             str(x.get("linked_event_id") or "")
             for x in latest
@@ -573,7 +1008,7 @@ def refresh_scratchpads(state: LinkerState) -> LinkerState:
             if str(x.get("canonical_claim") or "").strip()
         ]
         summary = f"claims_cache_count={len(latest_claims)}"
-        _scratchpad_store.upsert(
+        working_set.upsert_scratchpad(
             ticker=ticker,
             thread_id=thread_id,
             thread_name=thread_name or "General",
@@ -581,12 +1016,21 @@ def refresh_scratchpads(state: LinkerState) -> LinkerState:
             latest_linked_event_ids=latest_ids[:10],
             latest_claims=latest_claims[:10],
         )
+
+
+@_trace(span_type="CHAIN", name="refresh_scratchpads")
+def refresh_scratchpads(state: LinkerState) -> LinkerState:
+    ticker = str(state.get("ticker") or "")
+    impacted = state.get("impacted_threads") or {}
+    working_set = _working_set(state)
+    refresh_thread_scratchpads(working_set, ticker, impacted)
     logger.info(
         "linker_refresh_scratchpads_done ticker=%s impacted_threads=%s",
         ticker,
         len(impacted),
     )
-    return state
+    _release_working_set(state)
+    return {**state, "mongo_reads": working_set.reads, "mongo_writes": working_set.writes}
 
 
 @_trace(span_type="CHAIN", name="finalize_output")
@@ -594,6 +1038,8 @@ def finalize_output(state: LinkerState) -> LinkerState:
     status = str(state.get("status") or "DONE")
     if status not in {"NO_SILVER_EVENTS", "SKIPPED", "ERROR"}:
         status = "DONE"
+    # Runs that stopped early never reached refresh_scratchpads.
+    leftover = _release_working_set(state)
     result = {
         "enabled": True,
         "status": status,
@@ -605,6 +1051,18 @@ def finalize_output(state: LinkerState) -> LinkerState:
         "impacted_threads_count": len(state.get("impacted_threads") or {}),
         "decisions": state.get("decisions") or [],
     }
+    refine_calls = int(state.get("refine_calls") or 0)
+    refine_skipped = int(state.get("refine_skipped") or 0)
+    gated = refine_calls + refine_skipped
+    # Skipped refinements are valued at the mean latency of the ones that ran.
+    refine_ms_mean = float(state.get("refine_ms") or 0.0) / refine_calls if refine_calls else 0.0
+    result["near_duplicate_short_circuits"] = int(state.get("near_duplicate_short_circuits") or 0)
+    result["mongo_reads"] = leftover.reads if leftover else int(state.get("mongo_reads") or 0)
+    result["mongo_writes"] = leftover.writes if leftover else int(state.get("mongo_writes") or 0)
+    result["refine_calls"] = refine_calls
+    result["refine_skipped"] = refine_skipped
+    result["refine_skip_rate"] = round(refine_skipped / gated, 4) if gated else 0.0
+    result["refine_ms_saved_est"] = round(refine_skipped * refine_ms_mean, 1)
     logger.info(
         "linker_graph_done press_release_id=%s ticker=%s status=%s silver=%s",
         state.get("press_release_id"),
@@ -612,7 +1070,21 @@ def finalize_output(state: LinkerState) -> LinkerState:
         result["status"],
         result["processed_silver_events_count"],
     )
+    logger.info(
+        "linker_refine_gate_summary press_release_id=%s refine_calls=%s refine_skipped=%s skip_rate=%s ms_saved_est=%s",
+        state.get("press_release_id"),
+        refine_calls,
+        refine_skipped,
+        result["refine_skip_rate"],
+        result["refine_ms_saved_est"],
+    )
     if _mlflow_enabled():
+        mlflow.log_metric("linker_refine_calls", float(refine_calls))
+        mlflow.log_metric("linker_mongo_reads", float(result["mongo_reads"]))
+        mlflow.log_metric("linker_mongo_writes", float(result["mongo_writes"]))
+        mlflow.log_metric("linker_near_duplicate_short_circuits", float(result["near_duplicate_short_circuits"]))
+        mlflow.log_metric("linker_refine_skip_rate", float(result["refine_skip_rate"]))
+        mlflow.log_metric("linker_refine_ms_saved_est", float(result["refine_ms_saved_est"]))
         mlflow.log_param("linker_status", result["status"])
         mlflow.log_metric(
             "linker_processed_silver_events_count",
@@ -44,6 +44,44 @@ EVENT_JSON:
 """.strip()
 
 
+LINKER_THREAD_BATCH_PROMPT_TEMPLATE = """\
+LINK_THREADS_BATCH_JSON
+You are an expert event linker at a systematic investment firm.
+Your job is to assign a stable thread to every event extracted from one
+press release.
+
+GOALS:
+1. Group events about the same underlying topic into the same thread.
+2. Reuse an existing thread for the ticker whenever it tracks the same topic.
+3. Produce thread identifiers that are stable and reusable across press releases.
+4. Keep the output strictly grounded in the provided events, ticker, and sector.
+
+THREAD RULES:
+- Prefer a thread_id from EXISTING THREADS over inventing a variation of it.
+- Events in this list that share a topic must get the same thread_id.
+- Prefer concise, descriptive thread_ids over long sentences.
+- If you are unsure, fall back to a general bucket for the ticker.
+- Return exactly one assignment per event_index.
+
+--- INPUT ---
+TICKER: {ticker}
+SECTOR: {sector}
+
+EXISTING THREADS (most recently updated first):
+{existing_threads}
+
+EVENTS_JSON:
+{events}
+
+--- OUTPUT SCHEMA (return ONLY a JSON object, no wrapper) ---
+{{
+  "assignments": [
+    {{"event_index": 0, "thread_id": "stable_thread_key", "thread_name": "Short human label"}}
+  ]
+}}
+""".strip()
+
+
 LINKER_DECISION_PROMPT_TEMPLATE = """\
 LINK_SILVER_EVENT_JSON
 You are an event linker at a systematic investment firm. Your job is to
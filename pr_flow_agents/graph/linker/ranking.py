@@ -0,0 +1,189 @@
+"""Local similarity ranking of linker candidates.
+
+``LinkedEventStore.list_candidate_pool`` returns up to 200 linked events in
+``updated_at`` order, and only the best ``TOP_K`` go to the LLM. The newest
+ten often miss the true duplicate, so the pool is ranked locally first. The
+score is a weighted sum of:
+
+- entity Jaccard (linked events without stored entities fall back to
+  capitalized / identifier tokens of the canonical claim),
+- event_type match,
+- date proximity, ``exp(-days / DATE_SCALE_DAYS)``, with quarters and
+  years anchored at their midpoint,
+- numeric overlap (Jaccard over normalized number tokens),
+- claim token Jaccard.
+
+Every set feature is a binary matrix over the pool's vocabulary, so each
+Jaccard is one matrix-vector product.
+
+``rank_threads`` applies the claim-token part of the same idea to the
+thread catalog shown to batched thread assignment, so a ticker with more
+threads than the prompt can list still gets offered the relevant ones.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+WEIGHTS: Dict[str, float] = {
+    "entity": 0.30,
+    "type": 0.20,
+    "date": 0.15,
+    "number": 0.15,
+    "claim": 0.20,
+}
+DATE_SCALE_DAYS = 45.0
+# Candidates scoring below this share nothing useful with the new event.
+MIN_SCORE = 0.10
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9\-\.]*[a-z0-9]|[a-z0-9]")
+_NUMBER_RE = re.compile(r"[-+]?\$?\d[\d,]*(?:\.\d+)?%?")
+_NAME_RE = re.compile(r"\b(?:[A-Z][A-Za-z0-9]+|[A-Z0-9]+-\d+[A-Za-z0-9]*)\b")
+_QUARTER_RE = re.compile(r"^(\d{4})-Q([1-4])$")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+
+def claim_tokens(text: str) -> set[str]:
+    return {t for t in _TOKEN_RE.findall(str(text or "").lower()) if t not in _STOPWORDS}
+
+
+def number_tokens(values: Iterable[Any]) -> set[str]:
+    out: set[str] = set()
+    for value in values:
+        for raw in _NUMBER_RE.findall(str(value or "")):
+            token = raw.replace(",", "").replace("$", "").lstrip("+")
+            if token.strip("%-."):
+                out.add(token)
+    return out
+
+
+def _entities(event: Dict[str, Any], claim: str) -> set[str]:
+    entities = event.get("entities")
+    if isinstance(entities, list) and entities:
+        return {str(x).strip().lower() for x in entities if str(x).strip()}
+    return {m.lower() for m in _NAME_RE.findall(claim)}
+
+
+def date_ordinal(value: Any) -> Optional[float]:
+    raw = str(value or "").strip()
+    try:
+        if len(raw) >= 10:
+            return float(date.fromisoformat(raw[:10]).toordinal())
+        match = _QUARTER_RE.match(raw)
+        if match:
+            year, quarter = int(match.group(1)), int(match.group(2))
+            return float(date(year, 3 * quarter - 1, 15).toordinal())
+        if len(raw) == 4 and raw.isdigit():
+            return float(date(int(raw), 7, 1).toordinal())
+    except ValueError:
+        return None
+    return None
+
+
+def _jaccard(query: set[str], rows: Sequence[set[str]]) -> np.ndarray:
+    """Jaccard of ``query`` against every row via a binary incidence matrix."""
+    vocab = {token: i for i, token in enumerate(sorted(query.union(*rows)))}
+    if not query or not vocab:
+        return np.zeros(len(rows))
+    matrix = np.zeros((len(rows), len(vocab)), dtype=np.float32)
+    for r, tokens in enumerate(rows):
+        if tokens:
+            matrix[r, [vocab[t] for t in tokens]] = 1.0
+    q = np.zeros(len(vocab), dtype=np.float32)
+    q[[vocab[t] for t in query]] = 1.0
+    inter = matrix @ q
+    union = matrix.sum(axis=1) + q.sum() - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def score_candidates(event: Dict[str, Any], candidates: List[Dict[str, Any]]) -> np.ndarray:
+    """Similarity of ``event`` (a silver payload) to each linked candidate, in [0, 1]."""
+    if not candidates:
+        return np.zeros(0)
+    claim = str(event.get("claim") or "")
+    cand_claims = [str(c.get("canonical_claim") or "") for c in candidates]
+
+    entity = _jaccard(_entities(event, claim), [_entities(c, t) for c, t in zip(candidates, cand_claims)])
+    claim_sim = _jaccard(claim_tokens(claim), [claim_tokens(t) for t in cand_claims])
+    number = _jaccard(
+        number_tokens(list(event.get("numbers") or []) + [claim]),
+        [number_tokens(list(c.get("numbers") or []) + [t]) for c, t in zip(candidates, cand_claims)],
+    )
+
+    event_type = str(event.get("event_type") or "").strip().upper()
+    type_match = np.array(
+        [1.0 if event_type and str(c.get("event_type") or "").strip().upper() == event_type else 0.0 for c in candidates]
+    )
+
+    day = date_ordinal(event.get("event_date"))
+    cand_days = np.array([date_ordinal(c.get("event_date")) or np.nan for c in candidates], dtype=np.float64)
+    if day is None:
+        date_prox = np.zeros(len(candidates))
+    else:
+        date_prox = np.nan_to_num(np.exp(-np.abs(cand_days - day) / DATE_SCALE_DAYS), nan=0.0)
+
+    return (
+        WEIGHTS["entity"] * entity
+        + WEIGHTS["type"] * type_match
+        + WEIGHTS["date"] * date_prox
+        + WEIGHTS["number"] * number
+        + WEIGHTS["claim"] * claim_sim
+    )
+
+
+def rank_candidates(
+    event: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    *,
+    k: int,
+    min_score: float = MIN_SCORE,
+) -> List[Dict[str, Any]]:
+    """Best ``k`` candidates by local score, each with a ``rank_score`` key.
+
+    Ties keep pool order (newest first); candidates under ``min_score`` are
+    dropped.
+    """
+    scores = score_candidates(event, candidates)
+    order = np.argsort(-scores, kind="stable")[: max(0, int(k))]
+    return [
+        {**candidates[i], "rank_score": round(float(scores[i]), 4)}
+        for i in order
+        if scores[i] >= min_score
+    ]
+
+
+def _thread_tokens(thread: Dict[str, Any]) -> set[str]:
+    text = " ".join(
+        [str(thread.get("thread_id") or "").replace("::", " ").replace("_", " "), str(thread.get("thread_name") or "")]
+        + [str(x) for x in (thread.get("latest_claims") or [])]
+    )
+    return claim_tokens(text)
+
+
+def rank_threads(
+    events: Sequence[Dict[str, Any]],
+    threads: List[Dict[str, Any]],
+    *,
+    k: int,
+) -> List[Dict[str, Any]]:
+    """Best ``k`` scratchpads for a batch of silver events.
+
+    Scored by token Jaccard of the events' claims and entities against each
+    thread's id, name and latest claims. Ties, including threads that share
+    nothing with the batch, keep input order (newest first).
+    """
+    if len(threads) <= k:
+        return list(threads)
+    query: set[str] = set()
+    for event in events:
+        claim = str(event.get("claim") or "")
+        query |= claim_tokens(claim) | _entities(event, claim)
+    scores = _jaccard(query, [_thread_tokens(t) for t in threads])
+    order = np.argsort(-scores, kind="stable")[: max(0, int(k))]
+    return [threads[i] for i in order]
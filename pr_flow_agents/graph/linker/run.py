@@ -19,6 +19,16 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--press-release-id", required=True, help="MongoDB _id from crawl_results")
     p.add_argument("--ticker", required=True, help="Ticker of the release")
     p.add_argument("--sector", default="", help="Sector route used for thread heuristics")
+    p.add_argument(
+        "--always-refine",
+        action="store_true",
+        help="Run refine_decision for every silver event instead of only ambiguous first decisions",
+    )
+    p.add_argument(
+        "--sequential-writes",
+        action="store_true",
+        help="Send linker writes one call at a time instead of as bulk_write batches",
+    )
     return p.parse_args()
 
 
@@ -50,6 +60,10 @@ def main() -> None:
         "ticker": args.ticker.upper(),
         "sector": args.sector or None,
     }
+    if args.always_refine:
+        state["refine_gate"] = False
+    if args.sequential_writes:
+        state["apply_mode"] = "sequential"
     logger.info(
         "linker_graph_start press_release_id=%s ticker=%s sector=%s",
         args.press_release_id,
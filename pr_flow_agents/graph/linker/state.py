@@ -13,9 +13,14 @@ class LinkerState(TypedDict, total=False):
     press_release_id: str
     ticker: str
     sector: Optional[str]
+    refine_gate: bool
+    apply_mode: str
 
     # Loaded silver events
     silver_events: List[Dict[str, Any]]
+    working_set_key: str
+    thread_assignments: List[Optional[Dict[str, str]]]
+    existing_thread_ids: List[str]
     cursor: int
     current_silver_event: Dict[str, Any]
     current_silver_event_id: str
@@ -33,6 +38,12 @@ class LinkerState(TypedDict, total=False):
     linked_events_duplicates: int
     linked_events_updated: int
     linked_events_retracted: int
+    refine_calls: int
+    refine_skipped: int
+    refine_ms: float
+    near_duplicate_short_circuits: int
+    mongo_reads: int
+    mongo_writes: int
 
     # Final summary
     status: LinkerStatus
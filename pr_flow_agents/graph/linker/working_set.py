@@ -0,0 +1,336 @@
+"""In-memory per-ticker working set for one linker run.
+
+Without it, every silver event re-queries Mongo for its candidate pool,
+scratchpad and decision target, and ``refresh_scratchpads`` queries each
+impacted thread twice. ``LinkerWorkingSet.load`` fetches everything the run
+can need in a few queries:
+
+- linked events in the union of the release's candidate date windows,
+- the ticker's newest ``pool_limit`` linked events (pool for undated events),
+- linked events sharing an LSH band with any silver event,
+- every scratchpad of the ticker and the linked events each one lists.
+
+Reads are then served from memory. Decisions update the in-memory docs
+right away and queue their writes, and ``flush`` sends the queued writes
+at the end of the run. Given a ``UnitOfWork`` the queued writes are
+flushed as ordered ``bulk_write`` batches per collection (in a transaction
+when the deployment supports it); otherwise they are replayed call by call.
+With a checkpointer configured the set is write-through instead, because a
+resumed run cannot recover writes queued in a process that died.
+
+When the date-window load hits its cap, candidate pools fall back to
+``list_candidate_pool``. A thread's latest events come from memory when
+every event of the thread is known: it is new, or its scratchpad listed
+fewer than ``SCRATCHPAD_LATEST`` events. Threads whose scratchpad was full
+are answered by one ``LinkedEventStore.latest_by_threads`` aggregation
+for all of them, overlaid with this run's unflushed changes.
+
+``LinkerWorkingSet.in_memory`` builds a set that is the whole gold state
+of a ticker, as used by the history replay. It never reads from or writes
+to Mongo; the caller persists ``linked_events()`` and ``scratchpads()``.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from pr_flow_agents.storage.event_dates import overlaps
+from pr_flow_agents.storage import linked_event_store, thread_scratchpad_store
+from pr_flow_agents.storage.linked_event_store import LinkedEventStore, date_window
+from pr_flow_agents.storage.models import LinkedEventDocument
+from pr_flow_agents.storage.thread_scratchpad_store import ThreadScratchpadStore
+from pr_flow_agents.storage.unit_of_work import UnitOfWork
+
+WORKING_SET_MAX_DOCS = 20000
+LSH_LOAD_LIMIT = 5000
+SCRATCHPAD_LATEST = 10
+
+
+def _updated_key(doc: Dict[str, Any]) -> datetime:
+    value = doc.get("updated_at")
+    if isinstance(value, str):
+        # Docs inserted before the timestamp_dates backfill hold ISO strings.
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.min
+    return value if isinstance(value, datetime) else datetime.min
+
+
+def _newest_per_status(docs: Sequence[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    counts: Dict[Any, int] = {}
+    for doc in sorted(docs, key=_updated_key, reverse=True):
+        status = doc.get("status")
+        if counts.get(status, 0) < limit:
+            counts[status] = counts.get(status, 0) + 1
+            out.append(doc)
+    return out
+
+
+class LinkerWorkingSet:
+    def __init__(
+        self,
+        ticker: str,
+        *,
+        linked_store: Optional[LinkedEventStore],
+        scratchpad_store: Optional[ThreadScratchpadStore],
+        write_through: bool = False,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ) -> None:
+        self.ticker = ticker.upper()
+        self._linked_store = linked_store
+        self._scratchpad_store = scratchpad_store
+        self._write_through = write_through
+        self._unit_of_work = None if write_through else unit_of_work
+        self._lock = threading.Lock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._scratchpads: Dict[str, Dict[str, Any]] = {}
+        self._thread_members: Dict[str, Set[str]] = {}
+        self._thread_full: Set[str] = set()
+        self._windows_complete = False
+        self._days_window = 120
+        self._pending: List[Tuple[Callable[..., Any], tuple, dict]] = []
+        self._pending_scratchpads: Dict[str, Dict[str, Any]] = {}
+        self._touched: Set[str] = set()
+        self.reads = 0
+        self.writes = 0
+        # True when this set holds all gold state and Mongo is never consulted.
+        self.complete = False
+
+    @classmethod
+    def in_memory(cls, ticker: str) -> "LinkerWorkingSet":
+        working_set = cls(ticker, linked_store=None, scratchpad_store=None)
+        working_set.complete = True
+        working_set._windows_complete = True
+        return working_set
+
+    def linked_events(self) -> List[Dict[str, Any]]:
+        return list(self._docs.values())
+
+    def scratchpads(self) -> List[Dict[str, Any]]:
+        return list(self._scratchpads.values())
+
+    def _remember(self, docs: Sequence[Dict[str, Any]]) -> None:
+        for doc in docs:
+            linked_event_id = str(doc.get("linked_event_id") or "")
+            if linked_event_id:
+                self._docs.setdefault(linked_event_id, doc)
+
+    def load(
+        self,
+        *,
+        event_dates: Sequence[str],
+        lsh_bands: Sequence[str],
+        statuses: Sequence[str],
+        days_window: int = 120,
+        pool_limit: int = 200,
+    ) -> None:
+        self._days_window = days_window
+        windowed = self._linked_store.list_for_event_dates(
+            ticker=self.ticker,
+            event_dates=event_dates,
+            statuses=statuses,
+            days_window=days_window,
+            limit=WORKING_SET_MAX_DOCS,
+        )
+        self._windows_complete = len(windowed) < WORKING_SET_MAX_DOCS
+        self._remember(windowed)
+        self._remember(self._linked_store.list_by_ticker(self.ticker, statuses=statuses, limit=pool_limit))
+        self._remember(
+            self._linked_store.find_by_lsh_bands(
+                ticker=self.ticker, bands=list(lsh_bands), statuses=statuses, limit=LSH_LOAD_LIMIT
+            )
+        )
+        # Window and band lookups skip the query when they have nothing to match.
+        self.reads += 2 + any(date_window(d, days_window) for d in event_dates) + bool(lsh_bands)
+
+        for doc in self._scratchpad_store.load_by_ticker(self.ticker):
+            thread_id = str(doc.get("thread_id") or "")
+            ids = [str(x) for x in (doc.get("latest_linked_event_ids") or []) if str(x).strip()]
+            self._scratchpads[thread_id] = doc
+            self._thread_members[thread_id] = set(ids)
+            if len(ids) >= SCRATCHPAD_LATEST:
+                self._thread_full.add(thread_id)
+        listed = sorted({i for ids in self._thread_members.values() for i in ids} - set(self._docs))
+        if listed:
+            self._remember(self._linked_store.get_many(listed))
+            self.reads += 1
+
+    # Reads
+
+    def candidate_pool(self, *, event_date: str, statuses: Sequence[str], limit: int) -> List[Dict[str, Any]]:
+        window = date_window(event_date, self._days_window)
+        if window is not None and not self._windows_complete:
+            self.reads += 1
+            return self._linked_store.list_candidate_pool(
+                ticker=self.ticker, statuses=statuses, event_date=event_date, days_window=self._days_window, limit=limit
+            )
+        allowed = set(statuses)
+        docs = [
+            d
+            for d in self._docs.values()
+            if d.get("status") in allowed and (window is None or overlaps(d, *window))
+        ]
+        docs.sort(key=_updated_key, reverse=True)
+        return docs[:limit]
+
+    def get(self, linked_event_id: str) -> Optional[Dict[str, Any]]:
+        doc = self._docs.get(linked_event_id)
+        if doc is None and not self.complete:
+            self.reads += 1
+            doc = self._linked_store.get(linked_event_id)
+            if doc is not None:
+                self._remember([doc])
+        return doc
+
+    def get_many(self, linked_event_ids: Sequence[str], *, statuses: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        missing = [i for i in linked_event_ids if i not in self._docs]
+        if missing and not self.complete:
+            self.reads += 1
+            self._remember(self._linked_store.get_many(missing))
+        allowed = set(statuses or [])
+        return [
+            self._docs[i]
+            for i in linked_event_ids
+            if i in self._docs and (not allowed or self._docs[i].get("status") in allowed)
+        ]
+
+    def find_by_lsh_bands(self, bands: Sequence[str], *, statuses: Sequence[str]) -> List[Dict[str, Any]]:
+        wanted = set(bands)
+        allowed = set(statuses)
+        return [
+            d for d in self._docs.values() if d.get("status") in allowed and wanted.intersection(d.get("lsh_bands") or [])
+        ]
+
+    def scratchpad(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        return self._scratchpads.get(thread_id)
+
+    def scratchpad_catalog(self) -> List[Dict[str, Any]]:
+        """Every scratchpad of the ticker, newest first."""
+        return sorted(self._scratchpads.values(), key=_updated_key, reverse=True)
+
+    def latest_by_threads(
+        self, thread_ids: Sequence[str], *, statuses: Sequence[str], limit: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Newest ``limit`` events per (thread, status), newest first per thread."""
+        allowed = set(statuses)
+        members: Dict[str, List[Dict[str, Any]]] = {}
+        for thread_id in thread_ids:
+            members[thread_id] = [
+                self._docs[i]
+                for i in self._thread_members.get(thread_id, set())
+                if i in self._docs and self._docs[i].get("status") in allowed and self._docs[i].get("thread_id") == thread_id
+            ]
+        unknown = [t for t in thread_ids if t in self._thread_full]
+        if unknown:
+            self.reads += 1
+            # Over-fetch by what this run changed, since changed docs may
+            # leave a status bucket in memory.
+            stored = self._linked_store.latest_by_threads(
+                ticker=self.ticker, thread_ids=unknown, statuses=statuses, limit=limit + len(self._touched)
+            )
+            for thread_id in unknown:
+                seen = {str(d.get("linked_event_id")) for d in members[thread_id]}
+                for doc in stored.get(thread_id, []):
+                    linked_event_id = str(doc.get("linked_event_id") or "")
+                    if linked_event_id in seen:
+                        continue
+                    # This run's version wins over the stored one.
+                    doc = self._docs.get(linked_event_id, doc)
+                    if doc.get("status") in allowed and doc.get("thread_id") == thread_id:
+                        members[thread_id].append(doc)
+                        seen.add(linked_event_id)
+        return {thread_id: _newest_per_status(docs, limit) for thread_id, docs in members.items()}
+
+    # Writes
+
+    def _queue(self, method: str, *args: Any, **kwargs: Any) -> None:
+        """Send or queue ``LinkedEventStore.<method>(*args, **kwargs)``."""
+        if self.complete:
+            return
+        if self._write_through:
+            getattr(self._linked_store, method)(*args, **kwargs)
+            self.writes += 1
+        elif self._unit_of_work is not None:
+            op = getattr(self._linked_store, f"{method}_op")(*args, **kwargs)
+            self._unit_of_work.add(linked_event_store.COLLECTION, op)
+        else:
+            self._pending.append((getattr(self._linked_store, method), args, kwargs))
+
+    def _touch(self, doc: Dict[str, Any], **fields: Any) -> None:
+        doc.update(fields, updated_at=datetime.utcnow())
+        self._touched.add(str(doc["linked_event_id"]))
+        self._thread_members.setdefault(str(doc.get("thread_id") or ""), set()).add(str(doc["linked_event_id"]))
+
+    def create(self, model: LinkedEventDocument) -> str:
+        with self._lock:
+            doc = model.model_dump()
+            self._docs[model.linked_event_id] = doc
+            self._touch(doc)
+            self._queue("create", model)
+        return model.linked_event_id
+
+    def append_supporting_silver(self, linked_event_id: str, silver_event_id: str) -> bool:
+        with self._lock:
+            doc = self.get(linked_event_id)
+            if doc is None:
+                return False
+            ids = list(doc.get("supporting_silver_event_ids") or [])
+            if silver_event_id not in ids:
+                ids.append(silver_event_id)
+            self._touch(doc, supporting_silver_event_ids=ids)
+            self._queue("append_supporting_silver", linked_event_id, silver_event_id)
+        return True
+
+    def mark_superseded(self, *, old_linked_event_id: str, new_linked_event_id: str) -> bool:
+        with self._lock:
+            doc = self.get(old_linked_event_id)
+            if doc is None:
+                return False
+            self._touch(doc, status="SUPERSEDED", superseded_by=new_linked_event_id)
+            self._queue(
+                "mark_superseded",
+                old_linked_event_id=old_linked_event_id,
+                new_linked_event_id=new_linked_event_id,
+            )
+        return True
+
+    def mark_retracted(self, linked_event_id: str) -> bool:
+        with self._lock:
+            doc = self.get(linked_event_id)
+            if doc is None:
+                return False
+            self._touch(doc, status="RETRACTED")
+            self._queue("mark_retracted", linked_event_id)
+        return True
+
+    def upsert_scratchpad(self, **fields: Any) -> None:
+        """Queue a scratchpad write; scratchpads are sent in one batch by ``flush`` in every mode."""
+        thread_id = str(fields["thread_id"])
+        with self._lock:
+            self._scratchpads[thread_id] = {**fields, "updated_at": datetime.utcnow()}
+            if not self.complete:
+                self._pending_scratchpads[thread_id] = fields
+
+    def flush(self) -> int:
+        """Send queued writes in decision order; returns how many were sent."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            scratchpads, self._pending_scratchpads = self._pending_scratchpads, {}
+        if self._unit_of_work is not None:
+            for fields in scratchpads.values():
+                self._unit_of_work.add(thread_scratchpad_store.COLLECTION, self._scratchpad_store.upsert_op(**fields))
+            before = self._unit_of_work.batches
+            sent = self._unit_of_work.commit()
+            self.writes += self._unit_of_work.batches - before
+            return sent
+        for fn, args, kwargs in pending:
+            fn(*args, **kwargs)
+        if scratchpads:
+            self._scratchpad_store.upsert_many(list(scratchpads.values()))
+        sent = len(pending) + len(scratchpads)
+        self.writes += len(pending) + bool(scratchpads)
+        return sent
@@ -1,5 +1,5 @@
 """LLM client wrappers."""
 
-from pr_flow_agents.llm.gemini_client import GeminiClient, generate_json, generate_text
+from pr_flow_agents.llm.gemini_client import DEFAULT_MODEL, GeminiClient, generate_json, generate_text
 
-__all__ = ["GeminiClient", "generate_text", "generate_json"]
+__all__ = ["DEFAULT_MODEL", "GeminiClient", "generate_text", "generate_json"]
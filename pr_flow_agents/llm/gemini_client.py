@@ -14,6 +14,8 @@ from pr_flow_agents.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_MODEL = "gemini-2.5-flash"
+
 try:
     import mlflow
 except Exception:
@@ -39,7 +41,7 @@ class GeminiClient:
         self._client = genai.Client(api_key=key)
 
     @_trace(span_type="LLM")
-    def generate_text(self, prompt: str, model: str = "gemini-2.5-flash") -> str:
+    def generate_text(self, prompt: str, model: str = DEFAULT_MODEL) -> str:
         logger.debug(
             "gemini_generate_text_start model=%s prompt_chars=%s",
             model,
@@ -62,7 +64,7 @@ class GeminiClient:
     def generate_json(
         self,
         prompt: str,
-        model: str = "gemini-2.5-flash",
+        model: str = DEFAULT_MODEL,
         retries: int = 2,
     ) -> Any:
         """Generate strict JSON with small retry loop."""
@@ -108,9 +110,9 @@ def _client() -> GeminiClient:
     return _default_client
 
 
-def generate_text(prompt: str, model: str = "gemini-2.5-flash") -> str:
+def generate_text(prompt: str, model: str = DEFAULT_MODEL) -> str:
     return _client().generate_text(prompt, model=model)
 
 
-def generate_json(prompt: str, model: str = "gemini-2.5-flash", retries: int = 2) -> Any:
+def generate_json(prompt: str, model: str = DEFAULT_MODEL, retries: int = 2) -> Any:
     return _client().generate_json(prompt, model=model, retries=retries)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """High-level orchestration layer."""
 
 from pr_flow_agents.orchestration.baseline_summary_orchestrator import BaselineSummaryOrchestrator
+from pr_flow_agents.orchestration.batch_ingestion_runner import BatchIngestionRunner
 from pr_flow_agents.orchestration.ingestion_event_orchestrator import IngestionEventOrchestrator
 
-__all__ = ["IngestionEventOrchestrator", "BaselineSummaryOrchestrator"]
+__all__ = ["IngestionEventOrchestrator", "BaselineSummaryOrchestrator", "BatchIngestionRunner"]
@@ -6,10 +6,12 @@ import argparse
 from contextlib import nullcontext
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pr_flow_agents.graph.baseline.graph import build_graph
+from pr_flow_agents.graph.baseline.nodes import release_run_blobs
 from pr_flow_agents.graph.baseline.state import BaselineState
+from pr_flow_agents.graph.checkpointing import get_checkpointer, invoke_graph, new_run_id, run_config
 from pr_flow_agents.logging_utils import configure_logging, get_logger
 
 logger = get_logger(__name__)
@@ -20,10 +22,23 @@ class BaselineSummaryOrchestrator:
     """Runs the baseline summary graph for one press release."""
 
     def __init__(self) -> None:
-        self._app = build_graph()
-
-    def run(self, *, press_release_id: str) -> Dict[str, Any]:
-        logger.info("baseline_orchestrator_start press_release_id=%s", press_release_id)
+        self._app = build_graph(checkpointer=get_checkpointer())
+
+    def run(
+        self,
+        *,
+        press_release_id: str,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+    ) -> Dict[str, Any]:
+        run_id = run_id or new_run_id()
+        config = run_config("baseline", press_release_id, run_id)
+        logger.info(
+            "baseline_orchestrator_start press_release_id=%s run_id=%s resume=%s",
+            press_release_id,
+            run_id,
+            resume,
+        )
 
         tracking_enabled = str(os.getenv("MLFLOW_TRACKING_ENABLED", "1")).strip().lower() not in {"0", "false", "no", "off"}
         mlflow = None
@@ -44,18 +59,21 @@ class BaselineSummaryOrchestrator:
         if mlflow is not None and mlflow.active_run() is None:
             run_ctx = mlflow.start_run(run_name=f"baseline_orchestrator_{press_release_id}")
 
-        state: BaselineState = {"press_release_id": press_release_id}
+        state: BaselineState = {"press_release_id": press_release_id, "run_id": run_id}
         with run_ctx:
-            if mlflow is not None:
-                with mlflow.start_span(name="baseline_orchestrator") as root_span:
-                    root_span.set_inputs(state)
-                    with mlflow.start_span(name="baseline_graph"):
-                        out = self._app.invoke(state)
+            try:
+                if mlflow is not None:
+                    with mlflow.start_span(name="baseline_orchestrator") as root_span:
+                        root_span.set_inputs(state)
+                        with mlflow.start_span(name="baseline_graph"):
+                            out = invoke_graph(self._app, state, config=config, resume=resume)
+                        result = out.get("result") or {}
+                        root_span.set_outputs(result)
+                else:
+                    out = invoke_graph(self._app, state, config=config, resume=resume)
                     result = out.get("result") or {}
-                    root_span.set_outputs(result)
-            else:
-                out = self._app.invoke(state)
-                result = out.get("result") or {}
+            finally:
+                release_run_blobs(run_id)
 
             if mlflow is not None:
                 mlflow.log_param("baseline_orchestrator_press_release_id", press_release_id)
@@ -67,12 +85,21 @@ class BaselineSummaryOrchestrator:
             press_release_id,
             result.get("status"),
         )
-        return result
+        return {**result, "run_id": run_id}
+
+    def resume(self, *, press_release_id: str, run_id: str) -> Dict[str, Any]:
+        """Continue an interrupted run from its last checkpointed node."""
+        return self.run(press_release_id=press_release_id, run_id=run_id, resume=True)
 
 
 def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Run baseline summary orchestration")
     p.add_argument("--press-release-id", required=True, help="MongoDB _id from crawl_results")
+    p.add_argument(
+        "--resume-run-id",
+        default=None,
+        help="Resume a previous run from its last checkpoint (requires PR_FLOW_CHECKPOINTER)",
+    )
     return p.parse_args()
 
 
@@ -80,7 +107,10 @@ def main() -> None:
     configure_logging()
     args = _parse_args()
     orchestrator = BaselineSummaryOrchestrator()
-    out = orchestrator.run(press_release_id=args.press_release_id)
+    if args.resume_run_id:
+        out = orchestrator.resume(press_release_id=args.press_release_id, run_id=args.resume_run_id)
+    else:
+        out = orchestrator.run(press_release_id=args.press_release_id)
     print(json.dumps(out, indent=2))
 
 
@@ -0,0 +1,407 @@
+"""Batch ingestion across many press releases on a worker pool.
+
+Extraction and silver persistence are independent per release and run in
+parallel. Linking is not: each linker decision depends on the gold events
+created by earlier releases of the same ticker, so it runs one release at a
+time per ticker in ``press_release_timestamp`` order (different tickers link
+concurrently, up to the batch parallelism). In the default pipelined mode a
+single-writer lane per ticker links releases as soon as they and their
+predecessors are extracted, while extraction of later releases continues up
+to a bounded queue depth.
+
+Example:
+python -m pr_flow_agents.orchestration.batch_ingestion_runner \\
+  --ticker ACME --start 2023-01-01 --end 2024-12-31 --parallelism 8
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from pr_flow_agents.logging_utils import configure_logging, get_logger
+from pr_flow_agents.orchestration.ingestion_event_orchestrator import IngestionEventOrchestrator
+from pr_flow_agents.storage.mongo_store import MongoStore
+
+logger = get_logger(__name__)
+
+BATCH_PARALLELISM_DEFAULT = 4
+# serial: one release at a time with the linker inline (the old loop).
+# phased: parallel ingestion, then ordered linking per ticker.
+# pipelined: ordered per-ticker linking overlaps extraction of later releases.
+BATCH_MODES = ("pipelined", "phased", "serial")
+BATCH_MODE_DEFAULT = "pipelined"
+# Default backpressure limit: releases extracted or in flight but not yet
+# linked, per extraction worker.
+QUEUE_DEPTH_PER_WORKER = 2
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a stored or user-supplied timestamp; naive values are taken as UTC."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        ts = value
+    else:
+        ts = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def parse_bound(value: Optional[str], *, end: bool = False) -> Optional[datetime]:
+    ts = parse_timestamp(value)
+    if ts is not None and end and len(str(value).strip()) == 10:
+        # A bare end date includes the whole day.
+        ts = ts + timedelta(days=1) - timedelta(microseconds=1)
+    return ts
+
+
+class BatchIngestionRunner:
+    """Runs IngestionEventOrchestrator over many releases with bounded parallelism."""
+
+    def __init__(
+        self,
+        orchestrator: Optional[IngestionEventOrchestrator] = None,
+        mongo_store: Optional[MongoStore] = None,
+    ) -> None:
+        self._orchestrator = orchestrator or IngestionEventOrchestrator()
+        self._mongo_store = mongo_store or MongoStore()
+
+    def resolve_releases(
+        self,
+        *,
+        ticker: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        press_release_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Return {"releases": [...], "missing": [...]} sorted by (ticker, timestamp)."""
+        missing: List[str] = []
+        docs: List[Dict[str, Any]] = []
+        if press_release_ids:
+            for prid in dict.fromkeys(str(x).strip() for x in press_release_ids if str(x).strip()):
+                doc = self._mongo_store.get_by_id(prid, projection={"ticker": 1, "press_release_timestamp": 1})
+                if doc:
+                    docs.append(doc)
+                else:
+                    missing.append(prid)
+        elif ticker:
+            docs = self._mongo_store.list_by_ticker(ticker)
+        else:
+            raise ValueError("ticker or press_release_ids is required")
+
+        releases: List[Dict[str, Any]] = []
+        for doc in docs:
+            ts = parse_timestamp(doc.get("press_release_timestamp"))
+            doc_ticker = str(doc.get("ticker") or "").upper()
+            if ticker and doc_ticker != ticker.upper():
+                continue
+            if (start and (ts is None or ts < start)) or (end and (ts is None or ts > end)):
+                continue
+            releases.append({"press_release_id": str(doc["_id"]), "ticker": doc_ticker, "press_release_timestamp": ts})
+        releases.sort(key=lambda r: (r["ticker"], r["press_release_timestamp"] or datetime.min.replace(tzinfo=timezone.utc)))
+        return {"releases": releases, "missing": missing}
+
+    def _ingest_one(self, release: Dict[str, Any], run_kwargs: Dict[str, Any], *, link: bool = False) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            summary = self._orchestrator.run(press_release_id=release["press_release_id"], link=link, **run_kwargs)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("batch_ingest_failed press_release_id=%s", release["press_release_id"])
+            summary = {
+                "press_release_id": release["press_release_id"],
+                "error": f"ingestion_failed: {exc}",
+                "ingest_failed": True,
+                "linker": None,
+            }
+        summary["ingest_seconds"] = round(time.perf_counter() - started, 3)
+        summary["ticker"] = summary.get("ticker") or release["ticker"]
+        ts = release["press_release_timestamp"]
+        summary["press_release_timestamp"] = ts.isoformat() if ts else None
+        return summary
+
+    def _link_one(self, summary: Dict[str, Any]) -> None:
+        if summary.get("ingest_failed") or not summary.get("ticker"):
+            return
+        started = time.perf_counter()
+        try:
+            summary["linker"] = self._orchestrator.run_linker(
+                press_release_id=summary["press_release_id"],
+                ticker=summary.get("ticker"),
+                sector=summary.get("sector"),
+                run_id=summary.get("run_id"),
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("batch_link_failed press_release_id=%s", summary["press_release_id"])
+            summary["linker"] = {"enabled": True, "status": "ERROR", "error": str(exc)}
+        summary["link_seconds"] = round(time.perf_counter() - started, 3)
+
+    def _run_serial(self, releases: List[Dict[str, Any]], run_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """One release at a time, linker inline: the pre-batch behaviour, kept as a baseline."""
+        return {"summaries": [self._ingest_one(r, run_kwargs, link=True) for r in releases]}
+
+    def _run_phased(self, releases: List[Dict[str, Any]], run_kwargs: Dict[str, Any], parallelism: int) -> Dict[str, Any]:
+        """Ingest everything in parallel, then link each ticker in timestamp order."""
+        with ThreadPoolExecutor(max_workers=parallelism) as pool:
+            summaries = list(pool.map(lambda r: self._ingest_one(r, run_kwargs), releases))
+
+        by_ticker: Dict[str, List[Dict[str, Any]]] = {}
+        for summary in summaries:
+            by_ticker.setdefault(str(summary.get("ticker") or ""), []).append(summary)
+        with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(by_ticker)))) as pool:
+            list(pool.map(lambda lane: [self._link_one(s) for s in lane], by_ticker.values()))
+        return {"summaries": summaries}
+
+    def _run_pipelined(
+        self,
+        releases: List[Dict[str, Any]],
+        run_kwargs: Dict[str, Any],
+        parallelism: int,
+        queue_depth: int,
+    ) -> Dict[str, Any]:
+        """Extract ahead on a worker pool while one linker lane per ticker links in order.
+
+        ``queue_depth`` caps releases that are being extracted or waiting to be
+        linked; the submitter blocks once it is reached (backpressure). Releases
+        are submitted in global timestamp order, so every lane's next release is
+        always submitted before any later release of the same ticker holds a
+        slot, which rules out a deadlock between the cap and the lanes.
+
+        Lanes share a link pool of at most ``parallelism`` workers. A lane
+        never occupies a worker while it waits: its next release is queued onto
+        the pool only once extracted, and the lane's following release only
+        after that link finishes.
+        """
+        slots = threading.BoundedSemaphore(queue_depth)
+        placeholders: List[Future] = [Future() for _ in releases]
+        order = sorted(
+            range(len(releases)),
+            key=lambda i: releases[i]["press_release_timestamp"] or datetime.min.replace(tzinfo=timezone.utc),
+        )
+        lanes: Dict[str, List[int]] = {}
+        for idx in order:
+            lanes.setdefault(releases[idx]["ticker"], []).append(idx)
+        lane_of = {idx: ticker for ticker, indices in lanes.items() for idx in indices}
+        # Position of each lane's next release to link, and lanes with a link queued or running.
+        lane_pos = {ticker: 0 for ticker in lanes}
+        lane_busy: set[str] = set()
+        lane_lock = threading.Lock()
+        remaining = [len(releases)]
+        all_linked = threading.Event()
+        if not releases:
+            all_linked.set()
+        backpressure_wait = 0.0
+
+        def _schedule(ticker: str) -> None:
+            with lane_lock:
+                if ticker in lane_busy or lane_pos[ticker] >= len(lanes[ticker]):
+                    return
+                idx = lanes[ticker][lane_pos[ticker]]
+                if not placeholders[idx].done():
+                    return
+                lane_busy.add(ticker)
+            link_pool.submit(_link_next, ticker, idx)
+
+        def _link_next(ticker: str, idx: int) -> None:
+            try:
+                self._link_one(placeholders[idx].result())
+            except Exception:  # noqa: BLE001
+                logger.exception("batch_link_lane_failed press_release_id=%s", releases[idx]["press_release_id"])
+            finally:
+                slots.release()
+                with lane_lock:
+                    lane_pos[ticker] += 1
+                    lane_busy.discard(ticker)
+                    remaining[0] -= 1
+                    if not remaining[0]:
+                        all_linked.set()
+                _schedule(ticker)
+
+        def _forward(src: Future, dst: Future, idx: int) -> None:
+            exc = src.exception()
+            if exc is not None:
+                dst.set_exception(exc)
+            else:
+                dst.set_result(src.result())
+            _schedule(lane_of[idx])
+
+        with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(lanes)))) as link_pool, ThreadPoolExecutor(
+            max_workers=parallelism
+        ) as extract_pool:
+            for idx in order:
+                wait_started = time.perf_counter()
+                slots.acquire()
+                backpressure_wait += time.perf_counter() - wait_started
+                fut = extract_pool.submit(self._ingest_one, releases[idx], run_kwargs)
+                fut.add_done_callback(lambda f, dst=placeholders[idx], i=idx: _forward(f, dst, i))
+            # Links queue further links from inside the pool; wait for the last
+            # one before the pool shuts down.
+            all_linked.wait()
+        return {
+            "summaries": [p.result() for p in placeholders],
+            "queue_depth": queue_depth,
+            "backpressure_wait_seconds": round(backpressure_wait, 3),
+        }
+
+    def run(
+        self,
+        *,
+        ticker: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        press_release_ids: Optional[List[str]] = None,
+        parallelism: int = BATCH_PARALLELISM_DEFAULT,
+        mode: str = BATCH_MODE_DEFAULT,
+        queue_depth: Optional[int] = None,
+        max_hops: Optional[int] = None,
+        local_validator_strict: Optional[bool] = None,
+        pack_short_releases: bool = False,
+        severity_gate: Optional[bool] = None,
+        revision_mode: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        if mode not in BATCH_MODES:
+            raise ValueError(f"mode must be one of {', '.join(BATCH_MODES)}")
+        parallelism = max(1, int(parallelism))
+        queue_depth = max(1, int(queue_depth or parallelism * QUEUE_DEPTH_PER_WORKER))
+        resolved = self.resolve_releases(ticker=ticker, start=start, end=end, press_release_ids=press_release_ids)
+        releases: List[Dict[str, Any]] = resolved["releases"]
+        run_kwargs = {
+            "max_hops": max_hops,
+            "local_validator_strict": local_validator_strict,
+            "pack_short_releases": True if pack_short_releases else None,
+            "severity_gate": severity_gate,
+            "revision_mode": revision_mode,
+            "force": force,
+        }
+        logger.info(
+            "batch_ingestion_start releases=%s missing=%s mode=%s parallelism=%s",
+            len(releases),
+            len(resolved["missing"]),
+            mode,
+            parallelism,
+        )
+
+        started = time.perf_counter()
+        if mode == "serial":
+            out = self._run_serial(releases, run_kwargs)
+        elif mode == "phased":
+            out = self._run_phased(releases, run_kwargs, parallelism)
+        else:
+            out = self._run_pipelined(releases, run_kwargs, parallelism, queue_depth)
+        wall_seconds = time.perf_counter() - started
+        summaries: List[Dict[str, Any]] = out.pop("summaries")
+
+        failed = sum(1 for s in summaries if s.get("ingest_failed") or s.get("error"))
+        ingest_times = [float(s.get("ingest_seconds") or 0.0) for s in summaries if not s.get("ingest_failed")]
+        hop_counts = Counter(int(s.get("hop_count") or 0) for s in summaries if not s.get("ingest_failed"))
+        final_events = sum(int(s.get("final_events_count") or 0) for s in summaries)
+        throughput = {
+            "mode": mode,
+            "releases": len(summaries),
+            "succeeded": len(summaries) - failed,
+            "failed": failed,
+            "final_events": final_events,
+            "persisted_events": sum(int(s.get("persisted_events_count") or 0) for s in summaries),
+            "parallelism": 1 if mode == "serial" else parallelism,
+            **out,
+            "wall_seconds": round(wall_seconds, 3),
+            # Summed per-release busy time; in serial mode ingest includes linking.
+            "ingest_seconds": round(sum(float(s.get("ingest_seconds") or 0.0) for s in summaries), 3),
+            "link_seconds": round(sum(float(s.get("link_seconds") or 0.0) for s in summaries), 3),
+            # Per-release distributions, for comparing ingestion settings on
+            # the same --ids list.
+            "hop_counts": {str(k): hop_counts[k] for k in sorted(hop_counts)},
+            "ingest_seconds_p50": round(_percentile(ingest_times, 0.5), 3),
+            "ingest_seconds_p90": round(_percentile(ingest_times, 0.9), 3),
+            "releases_per_minute": round(len(summaries) * 60.0 / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "events_per_minute": round(final_events * 60.0 / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        }
+        logger.info(
+            "batch_ingestion_done mode=%s releases=%s failed=%s wall_seconds=%.1f releases_per_minute=%s",
+            mode,
+            throughput["releases"],
+            failed,
+            wall_seconds,
+            throughput["releases_per_minute"],
+        )
+        return {"throughput": throughput, "missing": resolved["missing"], "releases": summaries}
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Run event orchestration for many press releases in parallel")
+    p.add_argument("--ticker", default=None, help="Process every release of this ticker (optionally within --start/--end)")
+    p.add_argument("--start", default=None, help="Earliest press_release_timestamp (ISO date or datetime)")
+    p.add_argument("--end", default=None, help="Latest press_release_timestamp (ISO date or datetime, inclusive)")
+    p.add_argument("--ids", nargs="+", default=None, help="Explicit crawl_results _ids instead of a ticker")
+    p.add_argument("--parallelism", type=int, default=BATCH_PARALLELISM_DEFAULT, help="Concurrent ingestion workers")
+    p.add_argument("--mode", choices=BATCH_MODES, default=BATCH_MODE_DEFAULT, help="Scheduling strategy")
+    p.add_argument(
+        "--queue-depth",
+        type=int,
+        default=None,
+        help=f"Pipelined mode: max releases extracted but not yet linked (default parallelism*{QUEUE_DEPTH_PER_WORKER})",
+    )
+    p.add_argument("--max-hops", type=int, default=None, help="Optional override for ingestion loop hops")
+    p.add_argument(
+        "--strict-local-validation",
+        action="store_true",
+        help="Skip the LLM validator when every candidate passes local validation untouched",
+    )
+    p.add_argument(
+        "--pack-short-releases",
+        action="store_true",
+        help="Send short releases extracted concurrently to the extractor in one packed call",
+    )
+    p.add_argument(
+        "--revise-on-advisory",
+        action="store_true",
+        help="Re-extract on any expert REVISE instead of applying advisory-only feedback locally",
+    )
+    p.add_argument(
+        "--full-revision",
+        action="store_true",
+        help="Re-extract every event on a REVISE hop instead of patching only the events under review",
+    )
+    p.add_argument("--force", action="store_true", help="Ignore memoized ingestion output and re-run every LLM hop")
+    args = p.parse_args()
+    if not args.ticker and not args.ids:
+        p.error("--ticker or --ids is required")
+    return args
+
+
+def main() -> None:
+    configure_logging()
+    args = _parse_args()
+    out = BatchIngestionRunner().run(
+        ticker=args.ticker,
+        start=parse_bound(args.start),
+        end=parse_bound(args.end, end=True),
+        press_release_ids=args.ids,
+        parallelism=args.parallelism,
+        mode=args.mode,
+        queue_depth=args.queue_depth,
+        max_hops=args.max_hops,
+        local_validator_strict=True if args.strict_local_validation else None,
+        pack_short_releases=args.pack_short_releases,
+        severity_gate=False if args.revise_on_advisory else None,
+        revision_mode="full" if args.full_revision else None,
+        force=args.force,
+    )
+    print(json.dumps(out, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,9 @@ import json
 import os
 from typing import Any, Dict, Optional, Tuple
 
+from pr_flow_agents.graph.checkpointing import get_checkpointer, has_checkpoint, invoke_graph, new_run_id, run_config
 from pr_flow_agents.graph.ingestion.graph import build_graph
+from pr_flow_agents.graph.ingestion.nodes import release_run_blobs
 from pr_flow_agents.graph.ingestion.state import IngestionState
 from pr_flow_agents.graph.linker.graph import build_graph as build_linker_graph
 from pr_flow_agents.graph.linker.state import LinkerState
@@ -23,6 +25,19 @@ from pr_flow_agents.storage.extracted_event_store import ExtractedEventStore
 logger = get_logger(__name__)
 MLFLOW_EXPERIMENT = "ingestion_flow"
 
+# Linker summary placeholder for run(link=False).
+DEFERRED_LINKER_SUMMARY: Dict[str, Any] = {
+    "enabled": False,
+    "status": "DEFERRED",
+    "processed_silver_events_count": 0,
+    "linked_events_created": 0,
+    "linked_events_duplicates": 0,
+    "linked_events_updated": 0,
+    "linked_events_retracted": 0,
+    "impacted_threads_count": 0,
+    "decisions": [],
+}
+
 
 def _parse_iso_timestamp(value: str) -> datetime:
     ts = (value or "").strip()
@@ -41,22 +56,56 @@ class IngestionEventOrchestrator:
     """Orchestrates ingestion loop, silver persistence, and linker pipeline."""
 
     def __init__(self) -> None:
-        self._app = build_graph()
-        self._linker_app = build_linker_graph()
+        checkpointer = get_checkpointer()
+        self._app = build_graph(checkpointer=checkpointer)
+        self._linker_app = build_linker_graph(checkpointer=checkpointer)
         self._company_store = CompanyStore()
         self._event_store = ExtractedEventStore()
 
-    def _run_ingestion_loop(self, *, press_release_id: str, max_hops: Optional[int]) -> Dict[str, Any]:
+    def _run_ingestion_loop(
+        self,
+        *,
+        press_release_id: str,
+        max_hops: Optional[int],
+        local_validator_strict: Optional[bool] = None,
+        strip_boilerplate: Optional[bool] = None,
+        pack_short_releases: Optional[bool] = None,
+        severity_gate: Optional[bool] = None,
+        revision_mode: Optional[str] = None,
+        force: bool = False,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+    ) -> Dict[str, Any]:
         state: IngestionState = {"press_release_id": press_release_id}
+        if run_id:
+            state["run_id"] = run_id
         if max_hops is not None:
             state["max_hops"] = int(max_hops)
-        return self._app.invoke(state)
+        if local_validator_strict is not None:
+            state["local_validator_strict"] = bool(local_validator_strict)
+        if strip_boilerplate is not None:
+            state["strip_boilerplate"] = bool(strip_boilerplate)
+        if pack_short_releases is not None:
+            state["pack_short_releases"] = bool(pack_short_releases)
+        if severity_gate is not None:
+            state["severity_gate"] = bool(severity_gate)
+        if revision_mode is not None:
+            state["revision_mode"] = revision_mode
+        if force:
+            state["force"] = True
+        config = run_config("ingestion", press_release_id, run_id) if run_id else None
+        try:
+            return invoke_graph(self._app, state, config=config, resume=resume)
+        finally:
+            if run_id:
+                release_run_blobs(run_id)
 
     def _persist_silver_events(
         self,
         *,
         press_release_id: str,
         out: Dict[str, Any],
+        write: bool = True,
     ) -> Dict[str, Any]:
         ticker = str(out.get("ticker") or "").upper()
         release_ts_iso = str(out.get("press_release_timestamp") or "")
@@ -73,6 +122,12 @@ class IngestionEventOrchestrator:
             company = self._company_store.get(ticker) or {}
             company_id = str(company.get("_id")) if company.get("_id") else None
 
+        if ticker and release_ts_iso and not write:
+            # Resuming a linker run: silver events were already persisted and
+            # the linker checkpoint refers to their ids, so they must not be
+            # replaced.
+            inserted_count = len(self._event_store.list_by_release(press_release_id))
+        elif ticker and release_ts_iso:
             inserted_count = self._event_store.replace_for_release(
                 press_release_id=press_release_id,
                 company_ticker=ticker,
@@ -100,13 +155,16 @@ class IngestionEventOrchestrator:
         press_release_id: str,
         ticker: Optional[str],
         sector: Optional[str],
+        run_id: Optional[str] = None,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         state: LinkerState = {
             "press_release_id": press_release_id,
             "ticker": str(ticker or "").upper(),
             "sector": sector,
         }
-        out = self._linker_app.invoke(state)
+        config = run_config("linker", press_release_id, run_id) if run_id else None
+        out = invoke_graph(self._linker_app, state, config=config, resume=resume)
         return out.get("result") or {
             "enabled": True,
             "status": "ERROR",
@@ -119,8 +177,51 @@ class IngestionEventOrchestrator:
             "decisions": [],
         }
 
-    def run(self, *, press_release_id: str, max_hops: Optional[int] = None) -> Dict[str, Any]:
-        logger.info("ingestion_event_orchestrator_start press_release_id=%s", press_release_id)
+    def run_linker(
+        self,
+        *,
+        press_release_id: str,
+        ticker: Optional[str],
+        sector: Optional[str],
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run only the linker step for a release whose silver events are persisted.
+
+        Used by batch runners that ingest releases in parallel but must link
+        them one at a time in ``press_release_timestamp`` order per ticker.
+        """
+        return self._run_linker_pipeline(
+            press_release_id=press_release_id,
+            ticker=ticker,
+            sector=sector,
+            run_id=run_id,
+        )
+
+    def run(
+        self,
+        *,
+        press_release_id: str,
+        max_hops: Optional[int] = None,
+        local_validator_strict: Optional[bool] = None,
+        strip_boilerplate: Optional[bool] = None,
+        pack_short_releases: Optional[bool] = None,
+        severity_gate: Optional[bool] = None,
+        revision_mode: Optional[str] = None,
+        force: bool = False,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+        link: bool = True,
+    ) -> Dict[str, Any]:
+        """Ingest, persist and link one release; ``link=False`` defers linking to ``run_linker``."""
+        run_id = run_id or new_run_id()
+        logger.info(
+            "ingestion_event_orchestrator_start press_release_id=%s run_id=%s resume=%s",
+            press_release_id,
+            run_id,
+            resume,
+        )
+        linker_config = run_config("linker", press_release_id, run_id)
+        linker_started = resume and has_checkpoint(self._linker_app, linker_config)
 
         tracking_enabled = str(os.getenv("MLFLOW_TRACKING_ENABLED", "1")).strip().lower() not in {"0", "false", "no", "off"}
         mlflow = None
@@ -146,23 +247,63 @@ class IngestionEventOrchestrator:
                 with mlflow.start_span(name="ingestion_event_orchestrator") as root_span:
                     root_span.set_inputs({"press_release_id": press_release_id, "max_hops": max_hops})
                     with mlflow.start_span(name="ingestion_graph"):
-                        out = self._run_ingestion_loop(press_release_id=press_release_id, max_hops=max_hops)
+                        out = self._run_ingestion_loop(
+                            press_release_id=press_release_id,
+                            max_hops=max_hops,
+                            local_validator_strict=local_validator_strict,
+                            strip_boilerplate=strip_boilerplate,
+                            pack_short_releases=pack_short_releases,
+                            severity_gate=severity_gate,
+                            revision_mode=revision_mode,
+                            force=force,
+                            run_id=run_id,
+                            resume=resume,
+                        )
                     with mlflow.start_span(name="persist_silver_events"):
-                        persist_summary = self._persist_silver_events(press_release_id=press_release_id, out=out)
-                    with mlflow.start_span(name="linker_graph"):
-                        linker_summary = self._run_linker_pipeline(
+                        persist_summary = self._persist_silver_events(
                             press_release_id=press_release_id,
-                            ticker=persist_summary.get("ticker"),
-                            sector=str(out.get("route") or out.get("sector") or ""),
+                            out=out,
+                            write=not linker_started,
                         )
+                    if link:
+                        with mlflow.start_span(name="linker_graph"):
+                            linker_summary = self._run_linker_pipeline(
+                                press_release_id=press_release_id,
+                                ticker=persist_summary.get("ticker"),
+                                sector=str(out.get("route") or out.get("sector") or ""),
+                                run_id=run_id,
+                                resume=resume,
+                            )
+                    else:
+                        linker_summary = dict(DEFERRED_LINKER_SUMMARY)
             else:
-                out = self._run_ingestion_loop(press_release_id=press_release_id, max_hops=max_hops)
-                persist_summary = self._persist_silver_events(press_release_id=press_release_id, out=out)
-                linker_summary = self._run_linker_pipeline(
+                out = self._run_ingestion_loop(
+                    press_release_id=press_release_id,
+                    max_hops=max_hops,
+                    local_validator_strict=local_validator_strict,
+                    strip_boilerplate=strip_boilerplate,
+                    pack_short_releases=pack_short_releases,
+                    severity_gate=severity_gate,
+                    revision_mode=revision_mode,
+                    force=force,
+                    run_id=run_id,
+                    resume=resume,
+                )
+                persist_summary = self._persist_silver_events(
                     press_release_id=press_release_id,
-                    ticker=persist_summary.get("ticker"),
-                    sector=str(out.get("route") or out.get("sector") or ""),
+                    out=out,
+                    write=not linker_started,
                 )
+                if link:
+                    linker_summary = self._run_linker_pipeline(
+                        press_release_id=press_release_id,
+                        ticker=persist_summary.get("ticker"),
+                        sector=str(out.get("route") or out.get("sector") or ""),
+                        run_id=run_id,
+                        resume=resume,
+                    )
+                else:
+                    linker_summary = dict(DEFERRED_LINKER_SUMMARY)
 
             final_events = out.get("final_events", []) or []
             loop_status = str(out.get("loop_status") or "")
@@ -170,9 +311,13 @@ class IngestionEventOrchestrator:
 
             summary = {
                 "press_release_id": press_release_id,
+                "run_id": run_id,
                 "ticker": persist_summary.get("ticker"),
+                "sector": str(out.get("route") or out.get("sector") or "") or None,
+                "press_release_timestamp": out.get("press_release_timestamp") or None,
                 "loop_status": loop_status or None,
                 "hop_count": out.get("hop_count"),
+                "memo_hit": bool(out.get("memo_hit")),
                 "final_events_count": len(final_events) if isinstance(final_events, list) else 0,
                 "persisted_events_count": persist_summary.get("persisted_events_count", 0),
                 "fiscal_year": persist_summary.get("fiscal_year"),
@@ -209,11 +354,45 @@ class IngestionEventOrchestrator:
         )
         return summary
 
+    def resume(self, *, press_release_id: str, run_id: str, max_hops: Optional[int] = None) -> Dict[str, Any]:
+        """Continue an interrupted run from the last checkpointed node of each graph."""
+        return self.run(press_release_id=press_release_id, max_hops=max_hops, run_id=run_id, resume=True)
+
 
 def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Run event orchestration and persist extracted events")
     p.add_argument("--press-release-id", required=True, help="MongoDB _id from crawl_results")
     p.add_argument("--max-hops", type=int, default=None, help="Optional override for ingestion loop hops")
+    p.add_argument(
+        "--strict-local-validation",
+        action="store_true",
+        help="Skip the LLM validator when every candidate passes local validation untouched",
+    )
+    p.add_argument(
+        "--keep-boilerplate",
+        action="store_true",
+        help="Send the full release body to prompts instead of stripping disclaimers/about/contact sections",
+    )
+    p.add_argument(
+        "--revise-on-advisory",
+        action="store_true",
+        help="Re-extract on any expert REVISE instead of applying advisory-only feedback locally",
+    )
+    p.add_argument(
+        "--full-revision",
+        action="store_true",
+        help="Re-extract every event on a REVISE hop instead of patching only the events under review",
+    )
+    p.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore memoized ingestion output and re-run every LLM hop",
+    )
+    p.add_argument(
+        "--resume-run-id",
+        default=None,
+        help="Resume a previous run from its last checkpoint (requires PR_FLOW_CHECKPOINTER)",
+    )
     return p.parse_args()
 
 
@@ -221,9 +400,22 @@ def main() -> None:
     configure_logging()
     args = _parse_args()
     orchestrator = IngestionEventOrchestrator()
+    if args.resume_run_id:
+        out = orchestrator.resume(
+            press_release_id=args.press_release_id,
+            run_id=args.resume_run_id,
+            max_hops=args.max_hops,
+        )
+        print(json.dumps(out, indent=2))
+        return
     out = orchestrator.run(
         press_release_id=args.press_release_id,
         max_hops=args.max_hops,
+        local_validator_strict=True if args.strict_local_validation else None,
+        strip_boilerplate=False if args.keep_boilerplate else None,
+        severity_gate=False if args.revise_on_advisory else None,
+        revision_mode="full" if args.full_revision else None,
+        force=args.force,
     )
     print(json.dumps(out, indent=2))
 
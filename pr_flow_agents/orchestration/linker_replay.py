@@ -0,0 +1,335 @@
+"""Rebuild a ticker's linked events and thread scratchpads from its extracted events.
+
+After a linker prompt change the gold state of a ticker has to be rebuilt
+from all of its historical ``extracted_events``. Running the linker graph
+release by release does that with Mongo round trips and strictly
+sequential LLM calls. The replay engine instead:
+
+1. streams the ticker's silver events in ``press_release_timestamp`` order
+   (``ExtractedEventStore.iter_by_ticker``), one release at a time;
+2. keeps all gold state in an in-memory ``LinkerWorkingSet`` and runs the
+   linker nodes against it, with no claim index and no Mongo reads;
+3. decides up to ``concurrency`` events of a release at once. Each
+   speculative decision is checked before it is applied in order. If an
+   earlier event of the same wave touched its thread, or changed its
+   near-duplicate match or candidates (same date window), it is decided
+   again against the current state. Events on other threads and in other
+   date windows keep their speculative decision;
+4. writes the final state into shadow collections and switches them in with
+   an atomic ``renameCollection`` (``storage/collection_swap.py``), then
+   drops the ticker's claim index so it is rebuilt on next use.
+
+Each collection swap is atomic on its own, but the two are not atomic
+together. The replay holds the ticker's linker lease
+(``storage/ticker_lock_store.py``) from its first read to the swap, renewing
+it after every release, so linker runs for the ticker wait until it is done.
+The linker graph relies on the same lease: one writer per ticker at a time.
+
+Node tracing is off during a replay (``--trace`` turns it back on): one
+trace per node call over the whole history costs more than the decisions.
+
+Example:
+python -m pr_flow_agents.orchestration.linker_replay --ticker ACME --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pr_flow_agents.graph.linker import nodes
+from pr_flow_agents.graph.linker.claim_index import claim_index_from_env
+from pr_flow_agents.graph.linker.state import LinkerState
+from pr_flow_agents.graph.linker.working_set import LinkerWorkingSet
+from pr_flow_agents.logging_utils import configure_logging, get_logger
+from pr_flow_agents.storage import linked_event_store, thread_scratchpad_store
+from pr_flow_agents.storage.collection_swap import replace_ticker_docs
+from pr_flow_agents.storage.company_store import CompanyStore
+from pr_flow_agents.storage.extracted_event_store import ExtractedEventStore
+from pr_flow_agents.storage.linked_event_store import LinkedEventStore
+from pr_flow_agents.storage.models import LinkedEventDocument
+from pr_flow_agents.storage.thread_scratchpad_store import ThreadScratchpadStore
+from pr_flow_agents.storage.ticker_lock_store import TickerLease, TickerLockStore
+
+try:
+    import mlflow
+except Exception:  # noqa: BLE001
+    mlflow = None
+
+logger = get_logger(__name__)
+
+REPLAY_CONCURRENCY_DEFAULT = 8
+# Per-event fields a decision carries from speculation into apply_decision.
+_EVENT_KEYS = (
+    "current_silver_event_id",
+    "current_silver_event",
+    "provisional_thread_id",
+    "provisional_thread_name",
+    "scratchpad_text",
+    "candidates",
+    "decision",
+)
+_COUNTER_KEYS = ("refine_calls", "refine_skipped", "refine_ms", "near_duplicate_short_circuits")
+_ACTION_COUNTERS = {
+    "NEW": "linked_events_created",
+    "DUPLICATE": "linked_events_duplicates",
+    "UPDATE": "linked_events_updated",
+    "RETRACT": "linked_events_retracted",
+}
+
+
+def _candidate_key(state: LinkerState) -> Tuple[Any, ...]:
+    """What a decision was based on: near-duplicate target and candidate snapshot."""
+    decision = state.get("decision") or {}
+    target = decision.get("target_linked_event_id") if decision.get("short_circuit") else None
+    return target, tuple(
+        (c.get("linked_event_id"), c.get("status"), tuple(c.get("supporting_silver_event_ids") or []))
+        for c in state.get("candidates") or []
+    )
+
+
+class LinkerReplay:
+    def __init__(
+        self,
+        silver_store: Optional[ExtractedEventStore] = None,
+        company_store: Optional[CompanyStore] = None,
+        lock_store: Optional[TickerLockStore] = None,
+    ) -> None:
+        self._silver_store = silver_store or ExtractedEventStore()
+        self._company_store = company_store or CompanyStore()
+        self._lock_store = lock_store or TickerLockStore()
+
+    def releases(self, ticker: str) -> Iterator[List[Dict[str, Any]]]:
+        """The ticker's silver events grouped by release, oldest release first."""
+        batch: List[Dict[str, Any]] = []
+        for doc in self._silver_store.iter_by_ticker(ticker):
+            if batch and doc.get("press_release_id") != batch[0].get("press_release_id"):
+                yield batch
+                batch = []
+            batch.append(doc)
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _retrieve(state: LinkerState) -> LinkerState:
+        state = nodes.prepare_current_event(state)
+        state = nodes.check_near_duplicate(state)
+        if (state.get("decision") or {}).get("short_circuit"):
+            return state
+        return nodes.retrieve_candidates(state)
+
+    def _decide(self, state: LinkerState) -> LinkerState:
+        state = self._retrieve(state)
+        if (state.get("decision") or {}).get("short_circuit"):
+            return state
+        state = nodes.decide_action(state)
+        return nodes.refine_decision(state)
+
+    def _still_valid(self, state: LinkerState, speculated: LinkerState, touched_threads: Set[str]) -> bool:
+        threads = {
+            str(speculated.get("provisional_thread_id") or ""),
+            str((speculated.get("decision") or {}).get("thread_id") or ""),
+        }
+        if threads & touched_threads:
+            return False
+        return _candidate_key(self._retrieve(state)) == _candidate_key(speculated)
+
+    def _replay_release(
+        self,
+        pool: ThreadPoolExecutor,
+        working_set: LinkerWorkingSet,
+        base: LinkerState,
+        silver: List[Dict[str, Any]],
+        concurrency: int,
+        totals: Counter,
+    ) -> LinkerState:
+        state: LinkerState = {
+            **base,
+            "press_release_id": str(silver[0].get("press_release_id") or ""),
+            "silver_events": silver,
+            "cursor": 0,
+            "decisions": [],
+            "impacted_threads": {},
+            **{key: 0 for key in _COUNTER_KEYS},
+        }
+        state = nodes.assign_threads(state)
+        for start in range(0, len(silver), concurrency):
+            wave = list(range(start, min(len(silver), start + concurrency)))
+            wave_base = state
+            speculated = list(pool.map(lambda i: self._decide({**wave_base, "cursor": i}), wave))
+            touched_threads: Set[str] = set()
+            for i, event_state in zip(wave, speculated):
+                if touched_threads and not self._still_valid({**state, "cursor": i}, event_state, touched_threads):
+                    totals["redecided"] += 1
+                    event_state = self._decide({**state, "cursor": i})
+                    counter_base = state
+                else:
+                    counter_base = wave_base
+                merged: LinkerState = {**state, "cursor": i, **{k: event_state.get(k) for k in _EVENT_KEYS}}
+                for key in _COUNTER_KEYS:
+                    merged[key] = state.get(key, 0) + event_state.get(key, 0) - counter_base.get(key, 0)
+                state = nodes.apply_decision(merged)
+                applied = state.get("applied") or {}
+                touched_threads.update(
+                    {str(event_state.get("provisional_thread_id") or ""), str(applied.get("thread_id") or "")}
+                )
+        nodes.refresh_thread_scratchpads(working_set, base["ticker"], state["impacted_threads"])
+        for decision in state.get("decisions") or []:
+            totals[_ACTION_COUNTERS.get(str((decision.get("applied") or {}).get("action")), "other")] += 1
+        for key in _COUNTER_KEYS:
+            totals[key] += state.get(key, 0)
+        totals["silver_events"] += len(silver)
+        totals["releases"] += 1
+        return state
+
+    def _replay_all(
+        self,
+        ticker: str,
+        sector: Optional[str],
+        concurrency: int,
+        refine_gate: Optional[bool],
+        trace: bool,
+        lease: Optional[TickerLease],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Counter]:
+        """Decide the ticker's whole history in memory; returns linked events, scratchpads and totals."""
+        working_set = LinkerWorkingSet.in_memory(ticker)
+        key = nodes.attach_working_set(working_set)
+        base: LinkerState = {"ticker": ticker, "sector": sector, "working_set_key": key}
+        if refine_gate is not None:
+            base["refine_gate"] = refine_gate
+        totals: Counter = Counter()
+        tracing_off = mlflow is not None and not trace
+        if tracing_off:
+            mlflow.tracing.disable()
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for silver in self.releases(ticker):
+                    self._replay_release(pool, working_set, base, silver, concurrency, totals)
+                    if lease is not None and not lease.renew():
+                        raise RuntimeError(f"linker lease for {ticker} was taken over during the replay")
+                    logger.info(
+                        "linker_replay_release_done ticker=%s press_release_id=%s events=%s linked_events=%s",
+                        ticker,
+                        silver[0].get("press_release_id"),
+                        len(silver),
+                        len(working_set.linked_events()),
+                    )
+        finally:
+            nodes.detach_working_set(key)
+            if tracing_off:
+                mlflow.tracing.enable()
+        return working_set.linked_events(), working_set.scratchpads(), totals
+
+    def _swap(
+        self,
+        ticker: str,
+        linked_events: List[Dict[str, Any]],
+        scratchpads: List[Dict[str, Any]],
+        lease: TickerLease,
+    ) -> None:
+        if not lease.renew():
+            raise RuntimeError(f"linker lease for {ticker} was taken over before the swap")
+        replace_ticker_docs(
+            linked_event_store.COLLECTION,
+            ticker,
+            [LinkedEventStore.create_op(LinkedEventDocument(**doc)) for doc in linked_events],
+        )
+        replace_ticker_docs(
+            thread_scratchpad_store.COLLECTION,
+            ticker,
+            [
+                ThreadScratchpadStore.upsert_op(**{k: v for k, v in doc.items() if k != "updated_at"})
+                for doc in scratchpads
+            ],
+        )
+        claim_index = claim_index_from_env()
+        if claim_index is not None:
+            claim_index.drop(ticker)
+
+    def run(
+        self,
+        *,
+        ticker: str,
+        sector: Optional[str] = None,
+        concurrency: int = REPLAY_CONCURRENCY_DEFAULT,
+        refine_gate: Optional[bool] = None,
+        swap: bool = True,
+        trace: bool = False,
+    ) -> Dict[str, Any]:
+        ticker = ticker.upper()
+        if sector is None:
+            sector = str((self._company_store.get(ticker) or {}).get("sector") or "") or None
+        concurrency = max(1, int(concurrency))
+        # A dry run writes nothing, so it does not keep linker runs waiting.
+        lease = self._lock_store.acquire(nodes.linker_lease_name(ticker)) if swap else None
+        try:
+            started = time.perf_counter()
+            linked_events, scratchpads, totals = self._replay_all(ticker, sector, concurrency, refine_gate, trace, lease)
+            decide_seconds = time.perf_counter() - started
+            if lease is not None:
+                self._swap(ticker, linked_events, scratchpads, lease)
+        finally:
+            if lease is not None:
+                lease.release()
+        out = {
+            "ticker": ticker,
+            "releases": totals["releases"],
+            "silver_events": totals["silver_events"],
+            "linked_events": len(linked_events),
+            "thread_scratchpads": len(scratchpads),
+            "linked_events_created": totals["linked_events_created"],
+            "linked_events_duplicates": totals["linked_events_duplicates"],
+            "linked_events_updated": totals["linked_events_updated"],
+            "linked_events_retracted": totals["linked_events_retracted"],
+            "near_duplicate_short_circuits": totals["near_duplicate_short_circuits"],
+            "refine_calls": totals["refine_calls"],
+            "redecided": totals["redecided"],
+            "concurrency": concurrency,
+            "decide_seconds": round(decide_seconds, 3),
+            "total_seconds": round(time.perf_counter() - started, 3),
+            "swapped": swap,
+        }
+        logger.info("linker_replay_done %s", " ".join(f"{k}={v}" for k, v in out.items()))
+        return out
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Rebuild a ticker's linked events and scratchpads from extracted events")
+    p.add_argument("--ticker", required=True, help="Ticker to replay")
+    p.add_argument("--sector", default=None, help="Sector route for thread heuristics (default: from companies)")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=REPLAY_CONCURRENCY_DEFAULT,
+        help="Silver events of a release decided concurrently",
+    )
+    p.add_argument(
+        "--always-refine",
+        action="store_true",
+        help="Run refine_decision for every silver event instead of only ambiguous first decisions",
+    )
+    p.add_argument("--trace", action="store_true", help="Record an mlflow trace per linker node call")
+    p.add_argument("--dry-run", action="store_true", help="Replay in memory only; leave the collections untouched")
+    return p.parse_args()
+
+
+def main() -> None:
+    configure_logging()
+    args = _parse_args()
+    out = LinkerReplay().run(
+        ticker=args.ticker,
+        sector=args.sector,
+        concurrency=args.concurrency,
+        refine_gate=False if args.always_refine else None,
+        swap=not args.dry_run,
+        trace=args.trace,
+    )
+    print(json.dumps(out, indent=2))
+
+
+if __name__ == "__main__":
+    main()
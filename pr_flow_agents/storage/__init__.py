@@ -1,29 +1,41 @@
 from pr_flow_agents.storage.company_store import CompanyStore, add_company
 from pr_flow_agents.storage.baseline_summary_store import BaselineSummaryStore
+from pr_flow_agents.storage.boilerplate_store import BoilerplateStore
 from pr_flow_agents.storage.extracted_event_store import ExtractedEventStore
+from pr_flow_agents.storage.ingestion_memo_store import IngestionMemoStore
 from pr_flow_agents.storage.linked_event_store import LinkedEventStore
 from pr_flow_agents.storage.models import (
     BaselineSummaryDocument,
+    BoilerplateSavingsDocument,
     Company,
     ExtractedEventDocument,
+    IngestionMemoDocument,
     LinkedEventDocument,
     StoredCrawlDocument,
     ThreadScratchpadDocument,
 )
 from pr_flow_agents.storage.mongo_store import MongoStore, save_crawl_to_mongo
+from pr_flow_agents.storage.run_blob_store import RunBlobStore
 from pr_flow_agents.storage.thread_scratchpad_store import ThreadScratchpadStore
+from pr_flow_agents.storage.ticker_lock_store import TickerLockStore
 
 __all__ = [
     "MongoStore", "save_crawl_to_mongo",
     "CompanyStore", "add_company",
     "BaselineSummaryStore",
+    "BoilerplateStore",
     "ExtractedEventStore",
+    "IngestionMemoStore",
     "LinkedEventStore",
+    "RunBlobStore",
     "ThreadScratchpadStore",
+    "TickerLockStore",
     "BaselineSummaryDocument",
+    "BoilerplateSavingsDocument",
     "Company",
     "StoredCrawlDocument",
     "ExtractedEventDocument",
+    "IngestionMemoDocument",
     "LinkedEventDocument",
     "ThreadScratchpadDocument",
 ]
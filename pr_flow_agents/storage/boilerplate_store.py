@@ -0,0 +1,99 @@
+"""Store for learned boilerplate paragraph frequencies and stripping savings."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pymongo
+
+from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.migrations import run_collection
+from pr_flow_agents.storage.migrations.boilerplate import PARAGRAPHS_COLLECTION, SAVINGS_COLLECTION
+from pr_flow_agents.storage.models import BoilerplateSavingsDocument
+
+
+class BoilerplateStore:
+    def __init__(self, uri: Optional[str] = None, database: Optional[str] = None) -> None:
+        self._uri = uri or get_uri()
+        self._db = database or get_database()
+        self._client: Optional[pymongo.MongoClient] = None
+
+    def _coll(self, name: str):
+        if self._client is None:
+            self._client = pymongo.MongoClient(self._uri)
+            run_collection(self._uri, self._db, PARAGRAPHS_COLLECTION)
+            run_collection(self._uri, self._db, SAVINGS_COLLECTION)
+        return self._client[self._db][name]
+
+    def doc_counts(self, *, scope: str, fingerprints: List[str], exclude_release_id: str) -> Dict[str, int]:
+        """Number of releases other than ``exclude_release_id`` containing each fingerprint."""
+        if not fingerprints:
+            return {}
+        rows = self._coll(PARAGRAPHS_COLLECTION).aggregate(
+            [
+                {"$match": {"scope": scope.upper(), "fingerprint": {"$in": list(fingerprints)}}},
+                {
+                    "$project": {
+                        "fingerprint": 1,
+                        "count": {"$size": {"$setDifference": ["$release_ids", [exclude_release_id]]}},
+                    }
+                },
+            ]
+        )
+        return {row["fingerprint"]: int(row["count"]) for row in rows}
+
+    def record(self, *, scope: str, fingerprints: List[str], press_release_id: str) -> None:
+        """Add ``press_release_id`` to the document set of each fingerprint (idempotent)."""
+        if not fingerprints:
+            return
+        now = datetime.utcnow()
+        self._coll(PARAGRAPHS_COLLECTION).bulk_write(
+            [
+                pymongo.UpdateOne(
+                    {"scope": scope.upper(), "fingerprint": fp},
+                    {"$addToSet": {"release_ids": press_release_id}, "$set": {"updated_at": now}},
+                    upsert=True,
+                )
+                for fp in fingerprints
+            ],
+            ordered=False,
+        )
+
+    def record_savings(self, doc: BoilerplateSavingsDocument) -> None:
+        self._coll(SAVINGS_COLLECTION).update_one(
+            {"press_release_id": doc.press_release_id},
+            {"$set": doc.model_dump(mode="json")},
+            upsert=True,
+        )
+
+    def savings_by_sector(self, *, chars_per_token: float = 4.0) -> List[Dict[str, Any]]:
+        rows = self._coll(SAVINGS_COLLECTION).aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": "$sector",
+                        "releases": {"$sum": 1},
+                        "original_chars": {"$sum": "$original_chars"},
+                        "stripped_chars": {"$sum": "$stripped_chars"},
+                        "removed_sections": {"$sum": "$removed_sections"},
+                    }
+                },
+                {"$sort": {"_id": 1}},
+            ]
+        )
+        out: List[Dict[str, Any]] = []
+        for row in rows:
+            removed = int(row["original_chars"]) - int(row["stripped_chars"])
+            out.append(
+                {
+                    "sector": row["_id"],
+                    "releases": int(row["releases"]),
+                    "original_chars": int(row["original_chars"]),
+                    "removed_chars": removed,
+                    "removed_sections": int(row["removed_sections"]),
+                    "saved_tokens_est_per_prompt": int(round(removed / chars_per_token)),
+                    "removed_ratio": round(removed / row["original_chars"], 4) if row["original_chars"] else 0.0,
+                }
+            )
+        return out
@@ -0,0 +1,56 @@
+"""Replace one ticker's documents in a collection through a shadow copy.
+
+``replace_ticker_docs`` builds ``<collection>__shadow``. It copies every
+document of the other tickers with ``$out`` and adds the new documents for
+the ticker with ``bulk_write``. It then creates the collection's registered
+indexes on the copy and switches it in with ``renameCollection``
+(``dropTarget``). The rename is atomic, so readers see either the old or the
+new collection and never a partial one.
+
+Writes to the collection between the copy and the rename are lost. Stop
+the linker for the ticker's collections while a swap runs.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+import pymongo
+
+from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.migrations import run_collection
+
+BATCH_SIZE = 1000
+
+
+def shadow_name(collection: str) -> str:
+    return f"{collection}__shadow"
+
+
+def replace_ticker_docs(
+    collection: str,
+    ticker: str,
+    ops: Sequence[Any],
+    *,
+    ticker_field: str = "ticker",
+    uri: Optional[str] = None,
+    database: Optional[str] = None,
+) -> int:
+    """Swap in ``collection`` with the ticker's docs replaced by ``ops`` (pymongo write ops)."""
+    uri = uri or get_uri()
+    database = database or get_database()
+    shadow = shadow_name(collection)
+    client = pymongo.MongoClient(uri)
+    try:
+        db = client[database]
+        db.drop_collection(shadow)
+        db[collection].aggregate([{"$match": {ticker_field: {"$ne": ticker.upper()}}}, {"$out": shadow}])
+        if shadow not in db.list_collection_names(filter={"name": shadow}):
+            db.create_collection(shadow)
+        for start in range(0, len(ops), BATCH_SIZE):
+            db[shadow].bulk_write(list(ops[start : start + BATCH_SIZE]), ordered=True)
+        run_collection(uri, database, collection, target=shadow)
+        client.admin.command("renameCollection", f"{database}.{shadow}", to=f"{database}.{collection}", dropTarget=True)
+    finally:
+        client.close()
+    return len(ops)
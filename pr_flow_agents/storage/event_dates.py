@@ -0,0 +1,74 @@
+"""Parsed date ranges for ``event_date`` strings.
+
+Extracted and linked events keep ``event_date`` as extracted: ``YYYY-MM-DD``,
+``YYYY-QN``, ``YYYY`` or null. Next to it they store ``event_date_start`` /
+``event_date_end``, the first and last day the string covers (a quarter or a
+year expands to its full range). Date-window queries then become one
+interval-overlap range scan on ``(ticker, status, event_date_start)``:
+
+    event_date_start in [window_start - MAX_EVENT_SPAN_DAYS, window_end]
+    and event_date_end >= window_start
+
+The lower bound on ``event_date_start`` is only there to keep the index
+scan bounded. No stored range is longer than ``MAX_EVENT_SPAN_DAYS``, so it
+never excludes an overlapping event.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+# A leap year is the longest range event_date can express.
+MAX_EVENT_SPAN_DAYS = 366
+
+_DAY_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:$|[T ])")
+_QUARTER_RE = re.compile(r"^(\d{4})-Q([1-4])$")
+_YEAR_RE = re.compile(r"^(\d{4})$")
+
+DateRange = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def event_date_range(value: Any) -> DateRange:
+    """(first day, last day) covered by ``value``; (None, None) when unparseable."""
+    raw = str(value or "").strip()
+    try:
+        m = _DAY_RE.match(raw)
+        if m:
+            day = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            return day, day
+        m = _QUARTER_RE.match(raw)
+        if m:
+            year, quarter = int(m.group(1)), int(m.group(2))
+            start = datetime(year, 3 * quarter - 2, 1)
+            end = datetime(year + 1, 1, 1) if quarter == 4 else datetime(year, 3 * quarter + 1, 1)
+            return start, end - timedelta(days=1)
+        m = _YEAR_RE.match(raw)
+        if m:
+            year = int(m.group(1))
+            return datetime(year, 1, 1), datetime(year, 12, 31)
+    except ValueError:
+        pass
+    return None, None
+
+
+def event_date_fields(value: Any) -> Dict[str, Optional[datetime]]:
+    start, end = event_date_range(value)
+    return {"event_date_start": start, "event_date_end": end}
+
+
+def overlap_query(start: datetime, end: datetime) -> Dict[str, Any]:
+    """Filter for stored ranges overlapping ``[start, end]``."""
+    return {
+        "event_date_start": {"$gte": start - timedelta(days=MAX_EVENT_SPAN_DAYS), "$lte": end},
+        "event_date_end": {"$gte": start},
+    }
+
+
+def overlaps(doc: Dict[str, Any], start: datetime, end: datetime) -> bool:
+    """In-memory form of ``overlap_query``; parses ``event_date`` if the fields are missing."""
+    doc_start, doc_end = doc.get("event_date_start"), doc.get("event_date_end")
+    if not isinstance(doc_start, datetime) or not isinstance(doc_end, datetime):
+        doc_start, doc_end = event_date_range(doc.get("event_date"))
+    return doc_start is not None and doc_end is not None and doc_start <= end and doc_end >= start
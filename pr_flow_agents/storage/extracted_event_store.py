@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pymongo
 
 from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.event_dates import event_date_fields
 from pr_flow_agents.storage.migrations import run_collection
 from pr_flow_agents.storage.models import ExtractedEventDocument
 
@@ -48,6 +49,7 @@ class ExtractedEventStore:
         for idx, event in enumerate(events):
             if not isinstance(event, dict):
                 continue
+            event_date = str(event.get("event_date")) if event.get("event_date") is not None else None
             model = ExtractedEventDocument(
                 press_release_id=press_release_id,
                 company_ticker=company_ticker.upper(),
@@ -58,11 +60,15 @@ class ExtractedEventStore:
                 fiscal_quarter=fiscal_quarter,
                 event_index=idx,
                 event_type=str(event.get("event_type") or ""),
-                event_date=str(event.get("event_date")) if event.get("event_date") is not None else None,
+                event_date=event_date,
+                **event_date_fields(event_date),
                 claim=str(event.get("claim") or ""),
                 entities=[str(x) for x in (event.get("entities") or []) if str(x).strip()],
                 numbers=[str(x) for x in (event.get("numbers") or []) if str(x).strip()],
                 evidence_span=str(event.get("evidence_span") or ""),
+                evidence_start=event.get("evidence_start"),
+                evidence_end=event.get("evidence_end"),
+                evidence_match_score=event.get("evidence_match_score"),
                 confidence=str(event.get("confidence")) if event.get("confidence") is not None else None,
                 event_payload={
                     **event,
@@ -72,6 +78,8 @@ class ExtractedEventStore:
                 },
             )
             doc = model.model_dump(mode="json")
+            # Keep the date range as BSON dates so range queries compare dates.
+            doc.update(model.model_dump(include={"event_date_start", "event_date_end"}))
             if quality_flag:
                 doc["quality_flag"] = str(quality_flag)
             if hop_count is not None:
@@ -86,6 +94,18 @@ class ExtractedEventStore:
         coll.insert_many(docs)
         return len(docs)
 
+    def iter_by_ticker(self, ticker: str, *, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Every event of a ticker in release order (press_release_timestamp, release, event_index)."""
+        cursor = (
+            self._coll()
+            .find({"company_ticker": ticker.upper()})
+            .sort([("press_release_timestamp", 1), ("press_release_id", 1), ("event_index", 1)])
+            .batch_size(int(batch_size))
+        )
+        for doc in cursor:
+            doc["_id"] = str(doc["_id"])
+            yield doc
+
     def list_by_release(self, press_release_id: str) -> List[Dict[str, Any]]:
         docs = list(self._coll().find({"press_release_id": press_release_id}).sort("event_index", 1))
         for d in docs:
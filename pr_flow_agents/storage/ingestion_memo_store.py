@@ -0,0 +1,46 @@
+"""Store for memoized ingestion graph output."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pymongo
+
+from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.migrations import run_collection
+from pr_flow_agents.storage.models import IngestionMemoDocument
+
+COLLECTION = "ingestion_memos"
+
+
+class IngestionMemoStore:
+    def __init__(self, uri: Optional[str] = None, database: Optional[str] = None) -> None:
+        self._uri = uri or get_uri()
+        self._db = database or get_database()
+        self._client: Optional[pymongo.MongoClient] = None
+
+    def _coll(self):
+        if self._client is None:
+            self._client = pymongo.MongoClient(self._uri)
+            run_collection(self._uri, self._db, COLLECTION)
+        return self._client[self._db][COLLECTION]
+
+    def get(self, memo_key: str) -> Optional[Dict[str, Any]]:
+        doc = self._coll().find_one_and_update(
+            {"memo_key": memo_key},
+            {"$inc": {"hit_count": 1}, "$set": {"last_hit_at": datetime.utcnow()}},
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
+        if doc and "_id" in doc:
+            doc["_id"] = str(doc["_id"])
+        return doc
+
+    def put(self, doc: IngestionMemoDocument) -> None:
+        payload = doc.model_dump(mode="json")
+        created_at = payload.pop("created_at")
+        self._coll().update_one(
+            {"memo_key": doc.memo_key},
+            {"$set": payload, "$setOnInsert": {"created_at": created_at, "hit_count": 0}},
+            upsert=True,
+        )
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pymongo
 
 from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.event_dates import event_date_range, overlap_query
 from pr_flow_agents.storage.migrations import run_collection
 from pr_flow_agents.storage.models import LinkedEventDocument
 
@@ -27,8 +28,7 @@ class LinkedEventStore:
         return self._client[self._db][COLLECTION]
 
     def create(self, doc: LinkedEventDocument) -> str:
-        payload = doc.model_dump(mode="json")
-        self._coll().insert_one(payload)
+        self._coll().insert_one(_insert_payload(doc))
         return doc.linked_event_id
 
     def get(self, linked_event_id: str) -> Optional[Dict[str, Any]]:
@@ -72,6 +72,118 @@ class LinkedEventStore:
                 doc["_id"] = str(doc["_id"])
         return docs
 
+    def latest_by_threads(
+        self,
+        *,
+        ticker: str,
+        thread_ids: Sequence[str],
+        statuses: Sequence[str],
+        limit: int = 10,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Newest ``limit`` linked events per (thread, status) for many threads in one aggregation.
+
+        Each thread's list is newest first within a status; callers merge
+        statuses themselves. Threads without matching events are absent.
+        """
+        if not thread_ids:
+            return {}
+        pipeline = [
+            {
+                "$match": {
+                    "ticker": ticker.upper(),
+                    "thread_id": {"$in": list(thread_ids)},
+                    "status": {"$in": list(statuses)},
+                }
+            },
+            {"$sort": {"thread_id": 1, "updated_at": -1}},
+            {
+                "$group": {
+                    "_id": {"thread_id": "$thread_id", "status": "$status"},
+                    "docs": {
+                        "$push": {
+                            "linked_event_id": "$linked_event_id",
+                            "thread_id": "$thread_id",
+                            "status": "$status",
+                            "canonical_claim": "$canonical_claim",
+                            "updated_at": "$updated_at",
+                        }
+                    },
+                }
+            },
+            {"$project": {"docs": {"$slice": ["$docs", int(limit)]}}},
+        ]
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for group in self._coll().aggregate(pipeline, allowDiskUse=True):
+            out.setdefault(group["_id"]["thread_id"], []).extend(group["docs"])
+        return out
+
+    def get_many(
+        self,
+        linked_event_ids: Sequence[str],
+        *,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Docs for ``linked_event_ids`` in the given order; missing ids are skipped."""
+        query: Dict[str, Any] = {"linked_event_id": {"$in": list(linked_event_ids)}}
+        if statuses:
+            query["status"] = {"$in": list(statuses)}
+        by_id = {}
+        for doc in self._coll().find(query):
+            if "_id" in doc:
+                doc["_id"] = str(doc["_id"])
+            by_id[doc["linked_event_id"]] = doc
+        return [by_id[i] for i in linked_event_ids if i in by_id]
+
+    def iter_by_ticker(self, ticker: str, *, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Every linked event of a ticker in insertion order, for index backfills."""
+        cursor = self._coll().find(
+            {"ticker": ticker.upper()},
+            {"_id": 0, "linked_event_id": 1, "canonical_claim": 1, "entities": 1, "event_date": 1, "status": 1},
+        ).batch_size(int(batch_size))
+        yield from cursor
+
+    def find_by_lsh_bands(
+        self,
+        *,
+        ticker: str,
+        bands: Sequence[str],
+        statuses: Optional[Sequence[str]] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Linked events sharing at least one LSH band key with ``bands``."""
+        if not bands:
+            return []
+        query: Dict[str, Any] = {"ticker": ticker.upper(), "lsh_bands": {"$in": list(bands)}}
+        if statuses:
+            query["status"] = {"$in": list(statuses)}
+        docs = list(self._coll().find(query).limit(int(limit)))
+        for doc in docs:
+            if "_id" in doc:
+                doc["_id"] = str(doc["_id"])
+        return docs
+
+    def iter_missing_signatures(self, ticker: str) -> Iterator[Dict[str, Any]]:
+        """Linked events created before minhash/lsh_bands were stored."""
+        yield from self._coll().find(
+            {"ticker": ticker.upper(), "minhash": {"$exists": False}},
+            {"_id": 0, "linked_event_id": 1, "canonical_claim": 1, "entities": 1, "numbers": 1},
+        )
+
+    def set_signatures(self, items: Sequence[Tuple[str, List[int], List[str]]]) -> int:
+        if not items:
+            return 0
+        res = self._coll().bulk_write(
+            [
+                pymongo.UpdateOne(
+                    {"linked_event_id": linked_event_id},
+                    {"$set": {"minhash": list(signature), "lsh_bands": list(bands)}},
+                )
+                for linked_event_id, signature, bands in items
+            ],
+            ordered=False,
+        )
+        return res.modified_count
+
     def list_candidate_pool(
         self,
         *,
@@ -81,23 +193,50 @@ class LinkedEventStore:
         days_window: int = 120,
         limit: int = 200,
     ) -> List[Dict[str, Any]]:
+        docs = list(
+            self.candidate_pool_cursor(
+                ticker=ticker, statuses=statuses, event_date=event_date, days_window=days_window, limit=limit
+            )
+        )
+        for doc in docs:
+            if "_id" in doc:
+                doc["_id"] = str(doc["_id"])
+        return docs
+
+    def candidate_pool_cursor(
+        self,
+        *,
+        ticker: str,
+        statuses: Optional[Sequence[str]] = None,
+        event_date: Optional[str] = None,
+        days_window: int = 120,
+        limit: int = 200,
+    ) -> pymongo.cursor.Cursor:
+        """The cursor behind ``list_candidate_pool``, e.g. to ``explain()`` its plan."""
+        query = candidate_pool_query(ticker=ticker, statuses=statuses, event_date=event_date, days_window=days_window)
+        return self._coll().find(query).sort("updated_at", -1).limit(int(limit))
+
+    def list_for_event_dates(
+        self,
+        *,
+        ticker: str,
+        event_dates: Sequence[str],
+        statuses: Optional[Sequence[str]] = None,
+        days_window: int = 120,
+        limit: int = 20000,
+    ) -> List[Dict[str, Any]]:
+        """Union of the ``list_candidate_pool`` date filters for several event dates, unsorted."""
+        windows = merge_windows(w for w in (date_window(d, days_window) for d in event_dates) if w is not None)
+        if not windows:
+            return []
         query: Dict[str, Any] = {"ticker": ticker.upper()}
+        if len(windows) == 1:
+            query.update(overlap_query(*windows[0]))
+        else:
+            query["$or"] = [overlap_query(*w) for w in windows]
         if statuses:
             query["status"] = {"$in": list(statuses)}
-
-        # Pre-filter by date range for canonical YYYY-MM-DD event dates.
-        dt = _parse_iso_day(event_date)
-        if dt is not None:
-            start = (dt - timedelta(days=max(1, int(days_window)))).strftime("%Y-%m-%d")
-            end = (dt + timedelta(days=max(1, int(days_window)))).strftime("%Y-%m-%d")
-            year = dt.year
-            query["$or"] = [
-                {"event_date": {"$gte": start, "$lte": end}},
-                {"event_date": {"$regex": f"^{year}-Q[1-4]$"}},
-                {"event_date": str(year)},
-            ]
-
-        docs = list(self._coll().find(query).sort("updated_at", -1).limit(int(limit)))
+        docs = list(self._coll().find(query).limit(int(limit)))
         for doc in docs:
             if "_id" in doc:
                 doc["_id"] = str(doc["_id"])
@@ -105,31 +244,90 @@ class LinkedEventStore:
 
     def append_supporting_silver(self, linked_event_id: str, silver_event_id: str) -> bool:
         res = self._coll().update_one(
-            {"linked_event_id": linked_event_id},
-            {"$addToSet": {"supporting_silver_event_ids": silver_event_id}, "$set": {"updated_at": datetime.utcnow()}},
+            {"linked_event_id": linked_event_id}, _supporting_silver_update(silver_event_id)
         )
         return res.matched_count > 0
 
     def mark_superseded(self, *, old_linked_event_id: str, new_linked_event_id: str) -> bool:
         res = self._coll().update_one(
-            {"linked_event_id": old_linked_event_id},
-            {"$set": {"status": "SUPERSEDED", "superseded_by": new_linked_event_id, "updated_at": datetime.utcnow()}},
+            {"linked_event_id": old_linked_event_id}, _superseded_update(new_linked_event_id)
         )
         return res.matched_count > 0
 
     def mark_retracted(self, linked_event_id: str) -> bool:
-        res = self._coll().update_one(
-            {"linked_event_id": linked_event_id},
-            {"$set": {"status": "RETRACTED", "updated_at": datetime.utcnow()}},
-        )
+        res = self._coll().update_one({"linked_event_id": linked_event_id}, _retracted_update())
         return res.matched_count > 0
 
+    # Bulk-write operations for UnitOfWork, one per write method above.
+
+    @staticmethod
+    def create_op(doc: LinkedEventDocument) -> pymongo.InsertOne:
+        return pymongo.InsertOne(_insert_payload(doc))
+
+    @staticmethod
+    def append_supporting_silver_op(linked_event_id: str, silver_event_id: str) -> pymongo.UpdateOne:
+        return pymongo.UpdateOne({"linked_event_id": linked_event_id}, _supporting_silver_update(silver_event_id))
+
+    @staticmethod
+    def mark_superseded_op(*, old_linked_event_id: str, new_linked_event_id: str) -> pymongo.UpdateOne:
+        return pymongo.UpdateOne({"linked_event_id": old_linked_event_id}, _superseded_update(new_linked_event_id))
+
+    @staticmethod
+    def mark_retracted_op(linked_event_id: str) -> pymongo.UpdateOne:
+        return pymongo.UpdateOne({"linked_event_id": linked_event_id}, _retracted_update())
+
+
+def _insert_payload(doc: LinkedEventDocument) -> Dict[str, Any]:
+    payload = doc.model_dump(mode="json")
+    # Keep the date range and timestamps as BSON dates so range queries and
+    # updated_at sorts compare dates (updates also set BSON dates).
+    payload.update(doc.model_dump(include={"event_date_start", "event_date_end", "created_at", "updated_at"}))
+    return payload
+
+
+def _supporting_silver_update(silver_event_id: str) -> Dict[str, Any]:
+    return {"$addToSet": {"supporting_silver_event_ids": silver_event_id}, "$set": {"updated_at": datetime.utcnow()}}
 
-def _parse_iso_day(value: Optional[str]) -> Optional[datetime]:
-    raw = str(value or "").strip()
-    try:
-        if len(raw) == 10:
-            return datetime.fromisoformat(raw)
-    except Exception:
+
+def _superseded_update(new_linked_event_id: str) -> Dict[str, Any]:
+    return {"$set": {"status": "SUPERSEDED", "superseded_by": new_linked_event_id, "updated_at": datetime.utcnow()}}
+
+
+def _retracted_update() -> Dict[str, Any]:
+    return {"$set": {"status": "RETRACTED", "updated_at": datetime.utcnow()}}
+
+
+def candidate_pool_query(
+    *,
+    ticker: str,
+    statuses: Optional[Sequence[str]] = None,
+    event_date: Optional[str] = None,
+    days_window: int = 120,
+) -> Dict[str, Any]:
+    query: Dict[str, Any] = {"ticker": ticker.upper()}
+    if statuses:
+        query["status"] = {"$in": list(statuses)}
+    # Pre-filter to events whose date range overlaps the window.
+    window = date_window(event_date, days_window)
+    if window is not None:
+        query.update(overlap_query(*window))
+    return query
+
+
+def date_window(event_date: Optional[str], days_window: int) -> Optional[Tuple[datetime, datetime]]:
+    """The event's date range widened by ``days_window`` on both sides; None if undated."""
+    start, end = event_date_range(event_date)
+    if start is None or end is None:
         return None
-    return None
+    pad = timedelta(days=max(1, int(days_window)))
+    return start - pad, end + pad
+
+
+def merge_windows(windows: Iterable[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+    merged: List[Tuple[datetime, datetime]] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,13 @@
+"""Boilerplate paragraph document frequencies and per-release stripping savings."""
+
+PARAGRAPHS_COLLECTION = "boilerplate_paragraphs"
+SAVINGS_COLLECTION = "boilerplate_savings"
+
+PARAGRAPH_INDEXES = [
+    ("scope_1_fingerprint_1", [("scope", 1), ("fingerprint", 1)], {"unique": True}),
+]
+
+SAVINGS_INDEXES = [
+    ("press_release_id_1", [("press_release_id", 1)], {"unique": True}),
+    ("sector_1", [("sector", 1)]),
+]
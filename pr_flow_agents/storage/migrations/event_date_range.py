@@ -0,0 +1,23 @@
+"""Backfill event_date_start / event_date_end on documents written before they existed."""
+
+import pymongo
+
+from pr_flow_agents.storage.event_dates import event_date_fields
+
+BATCH_SIZE = 1000
+
+
+def backfill(coll) -> int:
+    """Set the parsed range on every doc missing it; returns how many were updated."""
+    cursor = coll.find({"event_date_start": {"$exists": False}}, {"_id": 1, "event_date": 1})
+    updated = 0
+    batch = []
+    for doc in cursor.batch_size(BATCH_SIZE):
+        # Undated and unparseable docs get explicit nulls so they are not rescanned.
+        batch.append(pymongo.UpdateOne({"_id": doc["_id"]}, {"$set": event_date_fields(doc.get("event_date"))}))
+        if len(batch) >= BATCH_SIZE:
+            updated += coll.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += coll.bulk_write(batch, ordered=False).modified_count
+    return updated
@@ -7,4 +7,5 @@ INDEXES = [
     ("company_ticker_1_press_release_timestamp_-1", [("company_ticker", 1), ("press_release_timestamp", -1)]),
     ("fiscal_year_1_fiscal_quarter_1", [("fiscal_year", 1), ("fiscal_quarter", 1)]),
     ("event_type_1", [("event_type", 1)]),
+    ("company_ticker_1_event_date_start_1", [("company_ticker", 1), ("event_date_start", 1)]),
 ]
@@ -0,0 +1,9 @@
+"""Memoized ingestion graph output keyed by content/prompt/model hash."""
+
+COLLECTION = "ingestion_memos"
+
+INDEXES = [
+    ("memo_key_1", [("memo_key", 1)], {"unique": True}),
+    ("content_hash_1", [("content_hash", 1)]),
+    ("updated_at_-1", [("updated_at", -1)]),
+]
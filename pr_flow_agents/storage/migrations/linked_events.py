@@ -7,4 +7,9 @@ INDEXES = [
     ("ticker_1_thread_id_1_updated_at_-1", [("ticker", 1), ("thread_id", 1), ("updated_at", -1)]),
     ("ticker_1_event_type_1_status_1", [("ticker", 1), ("event_type", 1), ("status", 1)]),
     ("ticker_1_event_date_1", [("ticker", 1), ("event_date", 1)]),
+    (
+        "ticker_1_status_1_event_date_start_1",
+        [("ticker", 1), ("status", 1), ("event_date_start", 1)],
+    ),
+    ("ticker_1_lsh_bands_1", [("ticker", 1), ("lsh_bands", 1)]),
 ]
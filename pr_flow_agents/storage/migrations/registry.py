@@ -1,14 +1,21 @@
 """
 Migration registry. Add new domains: create migrations/<domain>.py, then register below.
 Index format: (name, keys) or (name, keys, opts) e.g. opts={"unique": True}
+Data backfills go in BACKFILLS: callables taking the collection, run by run_all after indexes.
 """
 
 REGISTRY: dict[str, list] = {}
+BACKFILLS: dict[str, list] = {}
 
 from pr_flow_agents.storage.migrations import ingestion, companies
 from pr_flow_agents.storage.migrations import extracted_events
 from pr_flow_agents.storage.migrations import linked_events, thread_scratchpads
 from pr_flow_agents.storage.migrations import baseline_summaries
+from pr_flow_agents.storage.migrations import ingestion_memos, run_blobs
+from pr_flow_agents.storage.migrations import boilerplate
+from pr_flow_agents.storage.migrations import event_date_range
+from pr_flow_agents.storage.migrations import ticker_locks
+from pr_flow_agents.storage.migrations import timestamp_dates
 
 REGISTRY[ingestion.COLLECTION] = ingestion.INDEXES
 REGISTRY[companies.COLLECTION] = companies.INDEXES
@@ -16,6 +23,16 @@ REGISTRY[extracted_events.COLLECTION] = extracted_events.INDEXES
 REGISTRY[linked_events.COLLECTION] = linked_events.INDEXES
 REGISTRY[thread_scratchpads.COLLECTION] = thread_scratchpads.INDEXES
 REGISTRY[baseline_summaries.COLLECTION] = baseline_summaries.INDEXES
+REGISTRY[ingestion_memos.COLLECTION] = ingestion_memos.INDEXES
+REGISTRY[run_blobs.COLLECTION] = run_blobs.INDEXES
+REGISTRY[boilerplate.PARAGRAPHS_COLLECTION] = boilerplate.PARAGRAPH_INDEXES
+REGISTRY[boilerplate.SAVINGS_COLLECTION] = boilerplate.SAVINGS_INDEXES
+REGISTRY[ticker_locks.COLLECTION] = ticker_locks.INDEXES
+
+BACKFILLS[extracted_events.COLLECTION] = [event_date_range.backfill]
+BACKFILLS[linked_events.COLLECTION] = [event_date_range.backfill, timestamp_dates.backfill]
+BACKFILLS[thread_scratchpads.COLLECTION] = [timestamp_dates.backfill]
+BACKFILLS[run_blobs.COLLECTION] = [run_blobs.backfill_last_used]
 
 
 def run_all(uri: str, database: str) -> None:
@@ -31,15 +48,19 @@ def run_all(uri: str, database: str) -> None:
             else:
                 name, keys, opts = spec
                 coll.create_index(keys, name=name, **opts)
+    for coll_name, backfills in BACKFILLS.items():
+        for backfill in backfills:
+            backfill(db[coll_name])
     client.close()
 
 
-def run_collection(uri: str, database: str, collection: str) -> None:
+def run_collection(uri: str, database: str, collection: str, *, target: str | None = None) -> None:
+    """Create ``collection``'s indexes, on ``target`` instead when given (e.g. a shadow copy)."""
     if collection not in REGISTRY:
         return
     import pymongo
     client = pymongo.MongoClient(uri)
-    coll = client[database][collection]
+    coll = client[database][target or collection]
     for spec in REGISTRY[collection]:
         if len(spec) == 2:
             name, keys = spec
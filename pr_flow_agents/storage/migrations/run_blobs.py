@@ -0,0 +1,22 @@
+"""Per-run blobs referenced by graph state handles (content, event lists)."""
+
+COLLECTION = "run_blobs"
+
+# Blobs are shared by content across runs, so expiry counts from the last
+# run that used one, not from the run that first wrote it.
+INDEXES = [
+    ("run_ids_1", [("run_ids", 1)]),
+    ("last_used_at_ttl", [("last_used_at", 1)], {"expireAfterSeconds": 7 * 24 * 3600}),
+]
+
+LEGACY_TTL_INDEX = "created_at_ttl"
+
+
+def backfill_last_used(coll) -> int:
+    """Drop the old created_at TTL and date blobs written before last_used_at existed."""
+    if LEGACY_TTL_INDEX in coll.index_information():
+        coll.drop_index(LEGACY_TTL_INDEX)
+    return coll.update_many(
+        {"last_used_at": {"$exists": False}},
+        [{"$set": {"last_used_at": {"$ifNull": ["$created_at", "$$NOW"]}}}],
+    ).modified_count
@@ -0,0 +1,9 @@
+"""Per-ticker linker leases (one document per ticker, _id is the lease name)."""
+
+COLLECTION = "ticker_locks"
+
+# Expired leases are taken over by the next run anyway; the TTL index only
+# keeps tickers that are no longer linked from accumulating documents.
+INDEXES = [
+    ("expires_at_ttl", [("expires_at", 1)], {"expireAfterSeconds": 0}),
+]
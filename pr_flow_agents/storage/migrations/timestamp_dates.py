@@ -0,0 +1,38 @@
+"""Backfill ``created_at`` / ``updated_at`` stored as ISO strings to BSON dates.
+
+Inserts used to dump these fields in JSON mode (strings) while updates set
+BSON dates. Mongo orders every string before every date, so sorting on
+``updated_at`` put any updated document ahead of newer inserts.
+"""
+
+from datetime import datetime
+
+import pymongo
+
+BATCH_SIZE = 1000
+FIELDS = ("created_at", "updated_at")
+
+
+def _parse(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def backfill(coll) -> int:
+    """Convert string timestamps in place; returns how many docs were updated."""
+    query = {"$or": [{field: {"$type": "string"}} for field in FIELDS]}
+    cursor = coll.find(query, {"_id": 1, **{field: 1 for field in FIELDS}})
+    updated = 0
+    batch = []
+    for doc in cursor.batch_size(BATCH_SIZE):
+        fields = {f: _parse(doc[f]) for f in FIELDS if isinstance(doc.get(f), str)}
+        # Unparseable strings become null so they are not rescanned.
+        batch.append(pymongo.UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+        if len(batch) >= BATCH_SIZE:
+            updated += coll.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += coll.bulk_write(batch, ordered=False).modified_count
+    return updated
@@ -57,10 +57,18 @@ class ExtractedEventDocument(BaseModel):
     event_index: int = Field(..., description="0-based event index within one release")
     event_type: str = Field(..., description="Event category")
     event_date: Optional[str] = Field(default=None, description="Event date string as extracted")
+    event_date_start: Optional[datetime] = Field(default=None, description="First day covered by event_date")
+    event_date_end: Optional[datetime] = Field(default=None, description="Last day covered by event_date")
     claim: str = Field(..., description="Short event claim")
     entities: List[str] = Field(default_factory=list, description="Named entities in event")
     numbers: List[str] = Field(default_factory=list, description="Numeric strings in event evidence")
     evidence_span: str = Field(default="", description="Verbatim evidence text")
+    evidence_start: Optional[int] = Field(default=None, description="Start offset of evidence_span in the release content")
+    evidence_end: Optional[int] = Field(default=None, description="End offset (exclusive) of evidence_span in the release content")
+    evidence_match_score: Optional[float] = Field(
+        default=None,
+        description="1.0 verbatim, 0.95 after normalization, lower for approximate matches",
+    )
     confidence: Optional[str] = Field(default=None, description="Model confidence label")
     event_payload: Dict[str, Any] = Field(default_factory=dict, description="Full extracted event payload")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Persist timestamp")
@@ -76,7 +84,13 @@ class LinkedEventDocument(BaseModel):
     thread_id: str = Field(..., description="Thread grouping id")
     event_type: str = Field(..., description="Canonical event type")
     event_date: Optional[str] = Field(default=None, description="Event date string")
+    event_date_start: Optional[datetime] = Field(default=None, description="First day covered by event_date")
+    event_date_end: Optional[datetime] = Field(default=None, description="Last day covered by event_date")
     canonical_claim: str = Field(..., description="Canonical claim for linked event")
+    entities: List[str] = Field(default_factory=list, description="Entities of the founding silver event")
+    numbers: List[str] = Field(default_factory=list, description="Numbers of the founding silver event")
+    minhash: List[int] = Field(default_factory=list, description="MinHash of claim shingles, entities and numbers")
+    lsh_bands: List[str] = Field(default_factory=list, description="LSH band keys of minhash")
     status: str = Field(..., description="ACTIVE | SUPERSEDED | RETRACTED")
     supporting_silver_event_ids: List[str] = Field(default_factory=list, description="Silver evidence ids")
     supersedes: Optional[str] = Field(default=None, description="Linked event id superseded by this record")
@@ -117,3 +131,37 @@ class BaselineSummaryDocument(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class IngestionMemoDocument(BaseModel):
+    """Memoized ingestion graph output for one content/prompt/model key."""
+
+    memo_key: str = Field(..., description="sha256 over normalized content, route, prompt versions and model routing")
+    content_hash: str = Field(..., description="sha256 of normalized press release content")
+    route: str = Field(..., description="Sector route used for extraction")
+    prompt_versions: Dict[str, str] = Field(default_factory=dict, description="Prompt template digests")
+    model_routing: Dict[str, str] = Field(default_factory=dict, description="Model used per graph stage")
+    source_press_release_id: str = Field(..., description="Release whose run produced this memo")
+    loop_status: str = Field(..., description="Final loop status of the memoized run")
+    hop_count: int = Field(default=0, description="Hops used by the memoized run")
+    final_events: List[Dict[str, Any]] = Field(default_factory=list)
+    review_trace: List[Dict[str, Any]] = Field(default_factory=list)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BoilerplateSavingsDocument(BaseModel):
+    """Boilerplate removed from one release before it went into ingestion prompts."""
+
+    press_release_id: str = Field(..., description="Mongo _id of source crawl_results document")
+    ticker: str = Field(..., description="Company ticker")
+    sector: str = Field(..., description="Sector route used for extraction")
+    original_chars: int = Field(..., description="Release body length before stripping")
+    stripped_chars: int = Field(..., description="Release body length sent to prompts")
+    removed_sections: int = Field(default=0, description="Sections/paragraphs removed")
+    removed_by_reason: Dict[str, int] = Field(default_factory=dict, description="Removed chars per rule")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,116 @@
+"""Content-addressed blob store for large graph-state payloads.
+
+Graph state carries short handles (``blob:<sha256>``) instead of the release
+body and event lists, so per-node state copies, tracing and checkpoints stay
+small. Blobs are cached in-process per run; with ``durable=True`` they are
+also written to the ``run_blobs`` collection so a resumed run in a new
+process can dereference handles from its checkpoint.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import pymongo
+
+from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.migrations import run_collection
+
+COLLECTION = "run_blobs"
+HANDLE_PREFIX = "blob:"
+
+
+def blob_digest(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    ).hexdigest()
+
+
+class RunBlobStore:
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        database: Optional[str] = None,
+        *,
+        durable: bool = False,
+    ) -> None:
+        self._uri = uri
+        self._db = database
+        self._durable = durable
+        self._client: Optional[pymongo.MongoClient] = None
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self._runs: Dict[str, set[str]] = {}
+
+    def _coll(self):
+        if self._client is None:
+            self._uri = self._uri or get_uri()
+            self._db = self._db or get_database()
+            self._client = pymongo.MongoClient(self._uri)
+            run_collection(self._uri, self._db, COLLECTION)
+        return self._client[self._db][COLLECTION]
+
+    def put(self, value: Any, *, run_id: str) -> str:
+        """Store ``value`` for ``run_id`` and return its handle."""
+
+        digest = blob_digest(value)
+        with self._lock:
+            known = digest in self._runs.get(run_id, set())
+            self._values[digest] = value
+            self._runs.setdefault(run_id, set()).add(digest)
+        if self._durable and not known:
+            # last_used_at drives the TTL: a blob reused by a later run must
+            # outlive that run's checkpoint, not the first writer's.
+            now = datetime.utcnow()
+            self._coll().update_one(
+                {"_id": digest},
+                {
+                    "$setOnInsert": {"payload": json.dumps(value, ensure_ascii=True), "created_at": now},
+                    "$set": {"last_used_at": now},
+                    "$addToSet": {"run_ids": run_id},
+                },
+                upsert=True,
+            )
+        return f"{HANDLE_PREFIX}{digest}"
+
+    def get(self, handle: Optional[str], default: Any = None) -> Any:
+        if not handle:
+            return default
+        digest = handle[len(HANDLE_PREFIX):] if handle.startswith(HANDLE_PREFIX) else handle
+        with self._lock:
+            if digest in self._values:
+                return self._values[digest]
+        if not self._durable:
+            return default
+        # A resumed run may only read a blob; reading it counts as use too.
+        doc = self._coll().find_one_and_update(
+            {"_id": digest},
+            {"$set": {"last_used_at": datetime.utcnow()}},
+            projection={"payload": 1},
+        )
+        if not doc:
+            return default
+        value = json.loads(doc["payload"])
+        with self._lock:
+            self._values[digest] = value
+        return value
+
+    def release(self, run_id: str) -> None:
+        """Drop in-process copies held only by ``run_id``."""
+
+        with self._lock:
+            digests = self._runs.pop(run_id, set())
+            still_used = set().union(*self._runs.values()) if self._runs else set()
+            for digest in digests - still_used:
+                self._values.pop(digest, None)
+
+
+def digest_of(handle: Optional[str]) -> str:
+    """Digest part of a handle; equal handles mean byte-identical payloads."""
+
+    raw = str(handle or "")
+    return raw[len(HANDLE_PREFIX):] if raw.startswith(HANDLE_PREFIX) else raw
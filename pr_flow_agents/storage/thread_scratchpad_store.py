@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import pymongo
 
@@ -32,6 +32,27 @@ class ThreadScratchpadStore:
             doc["_id"] = str(doc["_id"])
         return doc
 
+    def list_by_ticker(self, ticker: str, *, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recently updated threads for a ticker (id, name and latest claims)."""
+        cursor = (
+            self._coll()
+            .find(
+                {"ticker": ticker.upper()},
+                {"_id": 0, "thread_id": 1, "thread_name": 1, "latest_claims": 1},
+            )
+            .sort("updated_at", -1)
+            .limit(int(limit))
+        )
+        return list(cursor)
+
+    def load_by_ticker(self, ticker: str) -> List[Dict[str, Any]]:
+        """Every scratchpad of a ticker, newest first."""
+        docs = list(self._coll().find({"ticker": ticker.upper()}).sort("updated_at", -1))
+        for doc in docs:
+            if "_id" in doc:
+                doc["_id"] = str(doc["_id"])
+        return docs
+
     def upsert(
         self,
         *,
@@ -42,6 +63,34 @@ class ThreadScratchpadStore:
         latest_linked_event_ids: list[str],
         latest_claims: Optional[list[str]] = None,
     ) -> None:
+        op = self.upsert_op(
+            ticker=ticker,
+            thread_id=thread_id,
+            thread_name=thread_name,
+            summary=summary,
+            latest_linked_event_ids=latest_linked_event_ids,
+            latest_claims=latest_claims,
+        )
+        self._coll().bulk_write([op])
+
+    def upsert_many(self, items: Sequence[Dict[str, Any]]) -> int:
+        """``upsert`` for several threads in one bulk write; items are ``upsert`` kwargs."""
+        if not items:
+            return 0
+        self._coll().bulk_write([self.upsert_op(**fields) for fields in items], ordered=True)
+        return len(items)
+
+    @staticmethod
+    def upsert_op(
+        *,
+        ticker: str,
+        thread_id: str,
+        thread_name: str,
+        summary: str,
+        latest_linked_event_ids: list[str],
+        latest_claims: Optional[list[str]] = None,
+    ) -> pymongo.UpdateOne:
+        """``upsert`` as a bulk-write operation for UnitOfWork."""
         model = ThreadScratchpadDocument(
             ticker=ticker.upper(),
             thread_id=thread_id,
@@ -51,8 +100,11 @@ class ThreadScratchpadStore:
             latest_claims=list(latest_claims or []),
             updated_at=datetime.utcnow(),
         )
-        self._coll().update_one(
+        payload = model.model_dump(mode="json")
+        # BSON date, so updated_at sorts compare dates.
+        payload["updated_at"] = model.updated_at
+        return pymongo.UpdateOne(
             {"ticker": model.ticker, "thread_id": model.thread_id},
-            {"$set": model.model_dump(mode="json")},
+            {"$set": payload},
             upsert=True,
         )
@@ -0,0 +1,113 @@
+"""Per-ticker leases that serialize linker writers across processes.
+
+A linker run loads its ticker's gold state once, decides against that
+snapshot and writes at the end (``LinkerWorkingSet``). Two runs on the same
+ticker would each rewrite scratchpads and supersede/retract targets from
+their own snapshot, and the last flush would win. A run therefore holds the
+ticker's lease from working-set load to flush.
+
+A lease is one document per ticker with an owner and an expiry. A holder
+that outlives its TTL must not write: the next run may already have taken
+the lease over. Long holders (the history replay) renew it as they go.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import time
+from typing import Optional
+from uuid import uuid4
+
+import pymongo
+from pymongo.errors import DuplicateKeyError
+
+from pr_flow_agents.storage.config import get_database, get_uri
+from pr_flow_agents.storage.migrations import run_collection
+
+COLLECTION = "ticker_locks"
+# Longer than any single-release linker run.
+LEASE_TTL_SECONDS = 1800
+# How long a run waits for another run on the same ticker before failing.
+LEASE_WAIT_SECONDS = 1800
+LEASE_POLL_SECONDS = 1.0
+
+
+class TickerLease:
+    """A held lease; never renewed in the background.
+
+    A run that dies without releasing it blocks the ticker only until it expires.
+    """
+
+    def __init__(self, store: "TickerLockStore", name: str, owner: str, ttl_seconds: int) -> None:
+        self.name = name
+        self.owner = owner
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        # Local deadline, a little early to stay clear of clock skew.
+        self._deadline = time.monotonic() + ttl_seconds * 0.9
+
+    @property
+    def expired(self) -> bool:
+        """True once another run may have taken the lease over."""
+        return time.monotonic() >= self._deadline
+
+    def renew(self) -> bool:
+        """Extend the lease by its TTL; False when it was already taken over."""
+        if not self._store.renew(self.name, self.owner, self._ttl_seconds):
+            return False
+        self._deadline = time.monotonic() + self._ttl_seconds * 0.9
+        return True
+
+    def release(self) -> None:
+        self._store.release(self.name, self.owner)
+
+
+class TickerLockStore:
+    def __init__(self, uri: Optional[str] = None, database: Optional[str] = None) -> None:
+        self._uri = uri or get_uri()
+        self._db = database or get_database()
+        self._client: Optional[pymongo.MongoClient] = None
+
+    def _coll(self):
+        if self._client is None:
+            self._client = pymongo.MongoClient(self._uri)
+            run_collection(self._uri, self._db, COLLECTION)
+        return self._client[self._db][COLLECTION]
+
+    def try_acquire(self, name: str, owner: str, ttl_seconds: int = LEASE_TTL_SECONDS) -> bool:
+        """Take ``name`` if it is free, expired or already ``owner``'s."""
+        now = datetime.utcnow()
+        try:
+            doc = self._coll().find_one_and_update(
+                {"_id": name, "$or": [{"expires_at": {"$lte": now}}, {"owner": owner}]},
+                {"$set": {"owner": owner, "acquired_at": now, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+                upsert=True,
+                return_document=pymongo.ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Held by another owner: the filter missed and the upsert collided.
+            return False
+        return bool(doc) and doc.get("owner") == owner
+
+    def renew(self, name: str, owner: str, ttl_seconds: int = LEASE_TTL_SECONDS) -> bool:
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+        return self._coll().update_one({"_id": name, "owner": owner}, {"$set": {"expires_at": expires_at}}).matched_count == 1
+
+    def release(self, name: str, owner: str) -> None:
+        self._coll().delete_one({"_id": name, "owner": owner})
+
+    def acquire(
+        self,
+        name: str,
+        *,
+        ttl_seconds: int = LEASE_TTL_SECONDS,
+        wait_seconds: float = LEASE_WAIT_SECONDS,
+    ) -> TickerLease:
+        """Wait for ``name`` and return the held lease; TimeoutError after ``wait_seconds``."""
+        owner = uuid4().hex
+        deadline = time.monotonic() + wait_seconds
+        while not self.try_acquire(name, owner, ttl_seconds):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"lease {name} still held after {wait_seconds}s")
+            time.sleep(LEASE_POLL_SECONDS)
+        return TickerLease(self, name, owner, ttl_seconds)
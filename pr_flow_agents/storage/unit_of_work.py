@@ -0,0 +1,97 @@
+"""Unit of work: buffered writes flushed as bulk_write batches.
+
+Callers add pymongo write operations (``InsertOne``, ``UpdateOne`` ...) per
+collection, usually built by a store's ``*_op`` helpers. ``commit`` sends
+them as one ordered ``bulk_write`` per collection, chunked at
+``BATCH_SIZE``. On a replica set or sharded cluster all batches run inside
+one transaction. A standalone server cannot run transactions, so there the
+batches are sent one after another without one.
+
+Units of work are meant to be short-lived (one per linker run), so they
+share one client per URI. They do not run migrations; the stores whose ops
+they hold have already done so on first use.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import pymongo
+
+from pr_flow_agents.storage.config import get_database, get_uri
+
+BATCH_SIZE = 1000
+
+# Clients and transaction support per URI; probed once per process.
+_clients: Dict[str, pymongo.MongoClient] = {}
+_transactions_supported: Dict[str, bool] = {}
+_lock = threading.Lock()
+
+
+def _client_for(uri: str) -> pymongo.MongoClient:
+    with _lock:
+        if uri not in _clients:
+            _clients[uri] = pymongo.MongoClient(uri)
+        return _clients[uri]
+
+
+def supports_transactions(client: pymongo.MongoClient, uri: str) -> bool:
+    with _lock:
+        if uri not in _transactions_supported:
+            hello = client.admin.command("hello")
+            _transactions_supported[uri] = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+        return _transactions_supported[uri]
+
+
+class UnitOfWork:
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        database: Optional[str] = None,
+        *,
+        transactional: Optional[bool] = None,
+    ) -> None:
+        """``transactional=None`` uses a transaction whenever the deployment supports one."""
+        self._uri = uri or get_uri()
+        self._db = database or get_database()
+        self._transactional = transactional
+        self._ops: Dict[str, List[Any]] = {}
+        self.batches = 0
+
+    def __len__(self) -> int:
+        return sum(len(ops) for ops in self._ops.values())
+
+    def add(self, collection: str, op: Any) -> None:
+        self._ops.setdefault(collection, []).append(op)
+
+    def _write(self, db, session=None) -> None:
+        for collection, ops in self._ops.items():
+            for start in range(0, len(ops), BATCH_SIZE):
+                db[collection].bulk_write(ops[start : start + BATCH_SIZE], ordered=True, session=session)
+                self.batches += 1
+
+    def commit(self) -> int:
+        """Send every buffered op; returns how many were sent."""
+        sent = len(self)
+        if not sent:
+            return 0
+        client = _client_for(self._uri)
+        db = client[self._db]
+        transactional = self._transactional
+        if transactional is None:
+            transactional = supports_transactions(client, self._uri)
+        if transactional:
+            with client.start_session() as session:
+                before = self.batches
+
+                # with_transaction retries transient errors, so count batches per attempt.
+                def _callback(s):
+                    self.batches = before
+                    self._write(db, s)
+
+                session.with_transaction(_callback)
+        else:
+            self._write(db)
+        self._ops = {}
+        return sent
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Check that the linker candidate-pool query is an index range scan on event_date_start.
+
+Usage:
+  python scripts/explain_candidate_pool.py <TICKER> <EVENT_DATE> [DAYS_WINDOW]
+
+Runs explain() on the query LinkedEventStore.list_candidate_pool sends and
+exits non-zero if the winning plan does not use
+ticker_1_status_1_event_date_start_1 with bounded event_date_start.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+INDEX_NAME = "ticker_1_status_1_event_date_start_1"
+ACTIVE_STATUSES = ("ACTIVE", "SUPERSEDED")
+
+
+def _load_env():
+    from dotenv import load_dotenv
+    load_dotenv(ROOT / ".env")
+
+
+def _stages(plan):
+    """Yield every stage of a (possibly nested) winning plan."""
+    yield plan
+    for key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(key), dict):
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages") or []:
+        yield from _stages(child)
+
+
+def explain(ticker: str, event_date: str, days_window: int) -> dict:
+    _load_env()
+    from pr_flow_agents.storage.linked_event_store import LinkedEventStore, candidate_pool_query
+
+    query = candidate_pool_query(
+        ticker=ticker, statuses=ACTIVE_STATUSES, event_date=event_date, days_window=days_window
+    )
+    if "event_date_start" not in query:
+        raise ValueError(f"Unparseable event date: {event_date!r}")
+    store = LinkedEventStore()
+    return store.candidate_pool_cursor(
+        ticker=ticker, statuses=ACTIVE_STATUSES, event_date=event_date, days_window=days_window
+    ).explain()
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2:
+        print(__doc__)
+        sys.exit(1)
+    try:
+        plan = explain(args[0], args[1], int(args[2]) if len(args) > 2 else 120)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    winning = plan["queryPlanner"]["winningPlan"]
+    scans = [s for s in _stages(winning) if s.get("stage") == "IXSCAN"]
+    ok = any(
+        s.get("indexName") == INDEX_NAME and "[MinKey, MaxKey]" not in json.dumps(s.get("indexBounds", {}).get("event_date_start"))
+        for s in scans
+    )
+    print(json.dumps(winning, indent=2, default=str))
+    if not ok:
+        print(f"FAIL: winning plan does not range-scan {INDEX_NAME}")
+        sys.exit(1)
+    print(f"OK: range scan on {INDEX_NAME}")
+
+
+if __name__ == "__main__":
+    main()
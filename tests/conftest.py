@@ -0,0 +1,44 @@
+"""Shared fixtures. Mongo-backed tests skip unless ``MONGODB_URI`` points at a reachable server."""
+
+from __future__ import annotations
+
+import os
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_node_tracing():
+    """Graph nodes are mlflow-traced; tests must not write traces to the working tree.
+
+    Tracing is not re-enabled afterwards: enabling it initializes the
+    default tracking store (``./mlflow.db``).
+    """
+    try:
+        import mlflow
+    except Exception:  # noqa: BLE001
+        return
+    mlflow.tracing.disable()
+
+
+@pytest.fixture
+def mongo_db():
+    """(uri, database name) of a throwaway database, dropped after the test."""
+    uri = os.environ.get("MONGODB_URI", "").strip()
+    if not uri:
+        pytest.skip("MONGODB_URI not set")
+    import pymongo
+
+    client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=2000)
+    try:
+        client.admin.command("ping")
+    except pymongo.errors.PyMongoError as exc:
+        client.close()
+        pytest.skip(f"MongoDB not reachable: {exc}")
+    name = f"pr_flow_test_{uuid4().hex[:8]}"
+    try:
+        yield uri, name
+    finally:
+        client.drop_database(name)
+        client.close()
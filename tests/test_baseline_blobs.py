@@ -0,0 +1,41 @@
+"""Baseline state carries a blob handle for the release body, released with the run."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pr_flow_agents.graph.baseline import nodes
+
+RELEASE = "ACME grew revenue 10% to $5 million in the third quarter.\n"
+
+
+class _FakeMongoStore:
+    def get_by_id(self, press_release_id, projection=None):
+        return {
+            "ticker": "acme",
+            "title": "ACME Q3",
+            "press_release_timestamp": datetime(2026, 10, 1),
+            "raw_result": {"markdown_content": RELEASE},
+        }
+
+
+def test_body_travels_as_a_handle_and_is_released(monkeypatch):
+    monkeypatch.setattr(nodes, "MongoStore", _FakeMongoStore)
+    prompts = []
+
+    def fake_generate_json(prompt):
+        prompts.append(prompt)
+        return {"summary": "ACME grew.", "change_notes": ""}
+
+    monkeypatch.setattr(nodes, "generate_json", fake_generate_json)
+    run_id = "test-baseline-blobs"
+    state = nodes.load_press_release({"press_release_id": "pr-1", "run_id": run_id})
+    assert state["content_ref"].startswith("blob:")
+    assert RELEASE not in repr(state)
+
+    out = nodes.update_summaries({**state, "fiscal_year": 2026, "fiscal_quarter": "Q4"})
+    assert len(prompts) == 2 and all(RELEASE in p for p in prompts)
+    assert out["company_summary"] == "ACME grew."
+
+    nodes.release_run_blobs(run_id)
+    assert nodes._content(state) == ""
@@ -0,0 +1,57 @@
+"""The batch extraction endpoint queues a background job and reports it by id."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers import press_releases
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    def fake_run(**kwargs):
+        calls.append(kwargs)
+        if kwargs["ticker"] == "FAIL":
+            raise RuntimeError("boom")
+        return {"releases": 2}
+
+    monkeypatch.setattr(press_releases.batch_runner, "run", fake_run)
+    app = FastAPI()
+    app.include_router(press_releases.router)
+    with TestClient(app) as c:
+        c.calls = calls
+        yield c
+
+
+def test_batch_returns_job_id_and_runs_in_background(client):
+    resp = client.post(
+        "/press-releases/extract-events/batch",
+        json={"ticker": "ACME", "local_validator_strict": True, "revision_mode": "patch"},
+    )
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+    # TestClient runs background tasks before returning the response.
+    job = client.get(f"/press-releases/extract-events/batch/{job_id}").json()
+    assert job["status"] == "done" and job["result"] == {"releases": 2}
+    assert client.calls[0]["local_validator_strict"] is True
+    assert client.calls[0]["revision_mode"] == "patch"
+
+
+def test_failed_batch_is_reported_on_the_job(client):
+    job_id = client.post("/press-releases/extract-events/batch", json={"ticker": "FAIL"}).json()["job_id"]
+    job = client.get(f"/press-releases/extract-events/batch/{job_id}").json()
+    assert job["status"] == "failed" and "boom" in job["error"]
+
+
+def test_unknown_revision_mode_is_rejected(client):
+    resp = client.post("/press-releases/extract-events/batch", json={"ticker": "ACME", "revision_mode": "rewrite"})
+    assert resp.status_code == 422
+    assert not client.calls
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/press-releases/extract-events/batch/missing").status_code == 404
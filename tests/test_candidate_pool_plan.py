@@ -0,0 +1,51 @@
+"""The linker candidate-pool query must be an index range scan, not a collection scan."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+from pr_flow_agents.storage.event_dates import event_date_fields
+from pr_flow_agents.storage.linked_event_store import LinkedEventStore
+
+INDEX_NAME = "ticker_1_status_1_event_date_start_1"
+STATUSES = ("ACTIVE", "SUPERSEDED")
+
+
+def _stages(plan):
+    yield plan
+    for key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(key), dict):
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages") or []:
+        yield from _stages(child)
+
+
+def test_candidate_pool_uses_event_date_start_index(mongo_db):
+    uri, database = mongo_db
+    store = LinkedEventStore(uri, database)
+    day = datetime(2023, 1, 1)
+    docs = []
+    for i in range(500):
+        event_date = (day + timedelta(days=i)).strftime("%Y-%m-%d")
+        docs.append(
+            {
+                "linked_event_id": f"le_{i}",
+                "ticker": "ACME" if i % 2 else "OTHR",
+                "status": STATUSES[i % 3 == 0],
+                "event_date": event_date,
+                **event_date_fields(event_date),
+                "updated_at": day + timedelta(days=i),
+            }
+        )
+    store._coll().insert_many(docs)
+
+    plan = store.candidate_pool_cursor(
+        ticker="ACME", statuses=STATUSES, event_date="2023-06-15", days_window=30
+    ).explain()
+    winning = plan["queryPlanner"]["winningPlan"]
+    stages = list(_stages(winning))
+    assert not any(s.get("stage") == "COLLSCAN" for s in stages)
+    scans = [s for s in stages if s.get("stage") == "IXSCAN" and s.get("indexName") == INDEX_NAME]
+    assert scans, json.dumps(winning, default=str)
+    assert all("[MinKey, MaxKey]" not in json.dumps(s["indexBounds"]["event_date_start"]) for s in scans)
@@ -0,0 +1,77 @@
+"""Chunking of long releases and the merge of per-chunk events."""
+
+from __future__ import annotations
+
+from pr_flow_agents.graph.ingestion.chunking import (
+    CHUNK_THRESHOLD_CHARS,
+    chunk_markdown,
+    merge_chunk_events,
+    should_chunk,
+)
+
+MAX_CHARS = 1200
+OVERLAP_CHARS = 200
+
+
+def _release(sections: int = 12) -> str:
+    parts = []
+    for s in range(sections):
+        sentences = " ".join(f"Segment {s} metric {k} rose {k + s}% year over year." for k in range(4))
+        parts.append(f"## Segment {s}\n\n{sentences}\n\n{sentences}\n\n")
+    return "".join(parts)
+
+
+def _bodies(chunks):
+    """Chunks with the overlap prefix taken off, i.e. the slices that tile the release."""
+    out = [chunks[0]]
+    for prev, chunk in zip(chunks, chunks[1:]):
+        prefix = next(n for n in range(min(len(prev), len(chunk)), -1, -1) if prev.endswith(chunk[:n]))
+        out.append(chunk[prefix:])
+    return out
+
+
+def test_chunks_overlap_by_a_line_aligned_tail():
+    content = _release()
+    chunks = chunk_markdown(content, max_chars=MAX_CHARS, overlap_chars=OVERLAP_CHARS)
+    assert len(chunks) > 2
+    bodies = _bodies(chunks)
+    assert "".join(bodies) == content
+    for prev, chunk, body in zip(bodies, chunks[1:], bodies[1:]):
+        overlap = chunk[: len(chunk) - len(body)]
+        assert 0 < len(overlap) <= OVERLAP_CHARS
+        assert prev.endswith(overlap)
+        assert prev[len(prev) - len(overlap) - 1] == "\n"
+
+
+def test_chunks_end_on_paragraph_boundaries():
+    content = _release()
+    chunks = chunk_markdown(content, max_chars=MAX_CHARS, overlap_chars=OVERLAP_CHARS)
+    for body in _bodies(chunks):
+        assert len(body) <= MAX_CHARS
+        # Every sentence in the release ends with "." at a paragraph end.
+        assert body.endswith(".\n\n")
+
+
+def test_short_release_is_one_chunk():
+    content = _release(sections=2)
+    assert not should_chunk(content)
+    assert should_chunk("x" * (CHUNK_THRESHOLD_CHARS + 1))
+    assert chunk_markdown(content) == [content]
+
+
+def test_merge_drops_duplicates_from_overlapping_chunks():
+    first = [
+        {"claim": "Revenue rose 12%", "numbers": ["12%"], "evidence_span": "Revenue rose 12% to $48 million."},
+        {"claim": "Opened Ohio site", "numbers": [], "evidence_span": "It opened a site in Ohio."},
+    ]
+    second = [
+        # Same span as seen at the end of chunk 0, with different whitespace and case.
+        {"claim": "Ohio site opened", "numbers": [], "evidence_span": "it opened a  site\nin Ohio."},
+        # Same claim and numbers, quoted from a different sentence.
+        {"claim": "revenue rose 12%", "numbers": ["12%"], "evidence_span": "Sales grew 12%."},
+        {"claim": "Guidance raised", "numbers": ["$200 million"], "evidence_span": "Guidance is $200 million."},
+    ]
+    merged = merge_chunk_events([first, second])
+    assert [ev["claim"] for ev in merged] == ["Revenue rose 12%", "Opened Ohio site", "Guidance raised"]
+    # First occurrence wins, so chunk order decides which copy is kept.
+    assert merge_chunk_events([second, first])[0]["claim"] == "Ohio site opened"
@@ -0,0 +1,102 @@
+"""Claim index: recall against the date-window pool, single-writer lock, flush-failure drop."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from pr_flow_agents.graph.linker import nodes
+from pr_flow_agents.graph.linker.claim_index import ClaimIndex, TickerClaimIndex
+from pr_flow_agents.storage.event_dates import overlaps
+from pr_flow_agents.storage.linked_event_store import date_window
+
+TOPICS = 40
+EVENTS_PER_TOPIC = 6
+K = 10
+WINDOW_DAYS = 120
+
+
+def _corpus(seed: int = 7):
+    """Topics whose events are spread over three years, plus unrelated noise."""
+    rng = random.Random(seed)
+    start = date(2022, 1, 1)
+    verbs = ["reported", "announced", "updated", "presented", "completed", "initiated"]
+    docs, queries = [], []
+    for topic in range(TOPICS):
+        drug = f"drug{topic}x"
+        site = f"site{topic}y"
+        for n in range(EVENTS_PER_TOPIC + 1):
+            day = start + timedelta(days=rng.randrange(0, 3 * 365))
+            claim = f"{rng.choice(verbs)} phase {1 + n % 3} {drug} trial results at {site} cohort {rng.randrange(100)}"
+            doc = {
+                "linked_event_id": f"le_{topic}_{n}",
+                "topic": topic,
+                "canonical_claim": claim,
+                "entities": [drug.upper()],
+                "event_date": day.isoformat(),
+                "status": "ACTIVE",
+            }
+            # The last event of each topic is the query; the rest are its relevant set.
+            (queries if n == EVENTS_PER_TOPIC else docs).append(doc)
+    for n in range(TOPICS * EVENTS_PER_TOPIC):
+        day = start + timedelta(days=rng.randrange(0, 3 * 365))
+        docs.append(
+            {
+                "linked_event_id": f"noise_{n}",
+                "topic": -1,
+                "canonical_claim": f"{rng.choice(verbs)} quarterly revenue and operating expenses note {n}",
+                "entities": [],
+                "event_date": day.isoformat(),
+                "status": "ACTIVE",
+            }
+        )
+    return docs, queries
+
+
+def test_claim_index_recall_at_k_beats_date_window(tmp_path):
+    docs, queries = _corpus()
+    index = TickerClaimIndex(tmp_path / "ACME")
+    index.add_many(docs)
+    index_hits = window_hits = relevant = 0
+    for query in queries:
+        wanted = {d["linked_event_id"] for d in docs if d["topic"] == query["topic"]}
+        top = {i for i, _ in index.search(claim=query["canonical_claim"], entities=query["entities"], event_date=query["event_date"], k=K)}
+        window = date_window(query["event_date"], WINDOW_DAYS)
+        # Upper bound for the date-window pool: every relevant event it can reach.
+        in_window = {d["linked_event_id"] for d in docs if d["linked_event_id"] in wanted and overlaps(d, *window)}
+        index_hits += len(top & wanted)
+        window_hits += len(in_window)
+        relevant += len(wanted)
+    index_recall = index_hits / relevant
+    window_recall = window_hits / relevant
+    assert index_recall >= 0.9
+    assert index_recall > window_recall
+
+
+def test_second_writer_is_refused(tmp_path):
+    first = TickerClaimIndex(tmp_path / "ACME")
+    with pytest.raises(RuntimeError):
+        TickerClaimIndex(tmp_path / "ACME")
+    first.close()
+    TickerClaimIndex(tmp_path / "ACME").close()
+
+
+class _FailingWorkingSet:
+    ticker = "ACME"
+    complete = False
+    reads = writes = 0
+
+    def flush(self):
+        raise RuntimeError("bulk_write failed")
+
+
+def test_failed_flush_drops_ticker_index(tmp_path, monkeypatch):
+    claim_index = ClaimIndex(tmp_path)
+    claim_index.for_ticker("ACME").add({"linked_event_id": "le_1", "canonical_claim": "phase 2 data"})
+    monkeypatch.setattr(nodes, "_claim_index", claim_index)
+    monkeypatch.setitem(nodes._working_sets, "k", _FailingWorkingSet())
+    with pytest.raises(RuntimeError):
+        nodes._release_working_set({"working_set_key": "k"})
+    assert not claim_index.exists("ACME")
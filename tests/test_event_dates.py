@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pytest
+
+from pr_flow_agents.storage.event_dates import event_date_fields, event_date_range, overlap_query, overlaps
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-03-15", (datetime(2024, 3, 15), datetime(2024, 3, 15))),
+        ("2024-03-15T08:30:00Z", (datetime(2024, 3, 15), datetime(2024, 3, 15))),
+        ("2024-Q1", (datetime(2024, 1, 1), datetime(2024, 3, 31))),
+        ("2024-Q4", (datetime(2024, 10, 1), datetime(2024, 12, 31))),
+        ("2024", (datetime(2024, 1, 1), datetime(2024, 12, 31))),
+        (" 2025-Q2 ", (datetime(2025, 4, 1), datetime(2025, 6, 30))),
+    ],
+)
+def test_event_date_range_parses_days_quarters_and_years(value, expected):
+    assert event_date_range(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "2024-Q5", "2024-02-30", "2024-13-01", "Q1 2024", "24-03-15"])
+def test_event_date_range_unparseable_is_none(value):
+    assert event_date_range(value) == (None, None)
+    assert event_date_fields(value) == {"event_date_start": None, "event_date_end": None}
+
+
+def test_overlap_query_bounds_start_by_max_span():
+    query = overlap_query(datetime(2024, 6, 1), datetime(2024, 6, 30))
+    assert query["event_date_start"]["$lte"] == datetime(2024, 6, 30)
+    assert query["event_date_start"]["$gte"] == datetime(2023, 6, 1)
+    assert query["event_date_end"] == {"$gte": datetime(2024, 6, 1)}
+
+
+def test_overlaps_uses_stored_range_or_parses_event_date():
+    window = (datetime(2024, 3, 1), datetime(2024, 3, 31))
+    assert overlaps({"event_date": "2024-Q1"}, *window)
+    assert not overlaps({"event_date": "2024-Q2"}, *window)
+    assert not overlaps({"event_date": None}, *window)
+    stored = {"event_date": "ignored", "event_date_start": datetime(2024, 3, 31), "event_date_end": datetime(2024, 4, 2)}
+    assert overlaps(stored, *window)
@@ -0,0 +1,72 @@
+"""Final-hop cancellation of expert reviews only on blocking feedback."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from pr_flow_agents.graph.ingestion import nodes
+
+ADVISORY = {
+    "decision": "REVISE",
+    "issues": ["Claim wording is vague"],
+    "suggestions": [
+        {
+            "action": "UPDATE",
+            "target": "FINANCIAL",
+            "severity": "ADVISORY",
+            "field": "claim",
+            "value": "Revenue grew 10%",
+            "note": "Claim wording is vague",
+        }
+    ],
+}
+BLOCKING = {
+    "decision": "REVISE",
+    "issues": ["Missing event"],
+    "suggestions": [{"action": "ADD", "target": "CLINICAL", "note": "Missing event"}],
+}
+ACCEPT = {"decision": "ACCEPT", "issues": [], "suggestions": []}
+
+
+@pytest.fixture
+def serial_experts(monkeypatch):
+    """One review at a time, in prompt order, with canned feedback per expert."""
+    monkeypatch.setattr(nodes, "MAX_PARALLEL_LLM_CALLS", 1)
+    lock = threading.Lock()
+
+    def install(feedback):
+        def fake(name, prompt):
+            with lock:
+                return dict(feedback[name])
+
+        monkeypatch.setattr(nodes, "_call_expert", fake)
+
+    return install
+
+
+def test_advisory_revise_on_final_hop_keeps_remaining_reviews(serial_experts):
+    serial_experts({"A": ADVISORY, "B": ACCEPT, "C": ACCEPT})
+    results, cancelled = nodes._fan_out_expert_reviews(
+        {"A": "a", "B": "b", "C": "c"}, final_hop=True, severity_gate=True
+    )
+    assert not cancelled
+    assert set(results) == {"A", "B", "C"}
+
+
+def test_blocking_revise_on_final_hop_cancels_pending_reviews(serial_experts):
+    serial_experts({"A": BLOCKING, "B": ACCEPT, "C": ACCEPT})
+    results, cancelled = nodes._fan_out_expert_reviews(
+        {"A": "a", "B": "b", "C": "c"}, final_hop=True, severity_gate=True
+    )
+    assert "A" in results
+    assert cancelled and not cancelled & set(results)
+
+
+def test_any_revise_cancels_when_gate_is_off(serial_experts):
+    serial_experts({"A": ADVISORY, "B": ACCEPT, "C": ACCEPT})
+    _, cancelled = nodes._fan_out_expert_reviews(
+        {"A": "a", "B": "b", "C": "c"}, final_hop=True, severity_gate=False
+    )
+    assert cancelled
@@ -0,0 +1,42 @@
+"""The ingestion memo key follows the stripped prompt text and packing option."""
+
+from __future__ import annotations
+
+import pytest
+
+from pr_flow_agents.graph.ingestion import nodes
+from pr_flow_agents.graph.ingestion.graph import build_graph
+
+RELEASE = "ACME grew revenue 10% to $5 million in the quarter.\n\nACME is a maker of industrial widgets.\n"
+
+
+@pytest.fixture
+def state():
+    run_id = "test-memo-key"
+    base = {"run_id": run_id}
+    yield {"run_id": run_id, "route": "biotech", "content_ref": nodes._put_blob(base, RELEASE)}
+    nodes.release_run_blobs(run_id)
+
+
+def _with_prompt(state, text):
+    return {**state, "prompt_content_ref": nodes._put_blob(state, text)}
+
+
+def test_learned_boilerplate_changes_the_key(state):
+    full = _with_prompt(state, RELEASE)
+    learned = _with_prompt(state, "ACME grew revenue 10% to $5 million in the quarter.\n")
+    assert nodes._memo_key_for(full) != nodes._memo_key_for(learned)
+    assert nodes._memo_key_for(full) == nodes._memo_key_for(_with_prompt(state, RELEASE))
+
+
+def test_packing_changes_the_key(state):
+    assert nodes._memo_key_for(state) != nodes._memo_key_for({**state, "pack_short_releases": True})
+    assert nodes._memo_key_for(state) == nodes._memo_key_for({**state, "pack_short_releases": None})
+
+
+def test_boilerplate_is_stripped_before_the_memo_check():
+    graph = build_graph().get_graph()
+    edges = {(e.source, e.target) for e in graph.edges}
+    assert ("configure_experts", "strip_release_boilerplate") in edges
+    assert ("strip_release_boilerplate", "check_memo") in edges
+    assert ("check_memo", "run_extractor") in edges
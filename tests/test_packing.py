@@ -0,0 +1,40 @@
+"""Releases whose ids collide, raw or sanitized, are never split out of one pack."""
+
+from __future__ import annotations
+
+from pr_flow_agents.graph.ingestion.packing import ExtractionPacker, _PackRequest, split_packed_output
+
+DOCS = [
+    ("pr 1", "ACME grew revenue 10% to $5 million."),
+    # Sanitizes to the same delimiter id as "pr 1".
+    ("pr_1", "ACME opened a plant in Ohio."),
+    ("pr-2", "ACME named a new CFO."),
+]
+
+
+def _event(span):
+    return {"event_type": "OTHER", "evidence_span": span}
+
+
+def test_take_defers_colliding_ids_to_a_later_pack():
+    packer = ExtractionPacker(lambda prompt: None)
+    packer._pending["g"] = [_PackRequest(doc_id=d, content=c, system_prompt="") for d, c in DOCS + [DOCS[0]]]
+    first = packer._take("g")
+    assert [r.doc_id for r in first] == ["pr 1", "pr-2"]
+    assert [r.doc_id for r in packer._take("g")] == ["pr_1"]
+    assert [r.doc_id for r in packer._take("g")] == ["pr 1"]
+    assert packer._take("g") == [] and "g" not in packer._pending
+
+
+def test_split_refuses_ambiguous_ids():
+    raw = {
+        "documents": [
+            {"doc_id": "pr_1", "events": [_event("ACME opened a plant in Ohio.")]},
+            {"doc_id": "pr-2", "events": [_event("ACME named a new CFO.")]},
+        ]
+    }
+    out = split_packed_output(raw, DOCS)
+    assert out["pr 1"] is None and out["pr_1"] is None
+    assert out["pr-2"] == [_event("ACME named a new CFO.")]
+    out = split_packed_output(raw, DOCS[1:])
+    assert out["pr_1"] == [_event("ACME opened a plant in Ohio.")]
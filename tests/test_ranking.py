@@ -0,0 +1,83 @@
+"""Local candidate and thread ranking: relevance beats recency, ties keep pool order."""
+
+from __future__ import annotations
+
+from pr_flow_agents.graph.linker.ranking import rank_candidates, rank_threads
+
+EVENT = {
+    "event_type": "CLINICAL_TRIAL",
+    "event_date": "2026-09-30",
+    "claim": "Acme started the Phase 3 ZEN-301 trial of AC-101 in 400 patients",
+    "entities": ["Acme", "AC-101", "ZEN-301"],
+    "numbers": ["400"],
+}
+
+
+def _candidate(linked_event_id, **fields):
+    return {"linked_event_id": linked_event_id, **fields}
+
+
+def test_relevant_older_candidate_beats_irrelevant_recent_ones():
+    # Pool order is newest first, as list_candidate_pool returns it.
+    pool = [
+        _candidate(
+            f"recent-{i}",
+            event_type="FINANCIAL",
+            event_date="2026-09-29",
+            canonical_claim=f"Acme reported quarterly revenue of ${50 + i} million",
+            entities=["Acme"],
+            numbers=[f"{50 + i}"],
+        )
+        for i in range(12)
+    ] + [
+        _candidate(
+            "older-match",
+            event_type="CLINICAL_TRIAL",
+            event_date="2026-06-15",
+            canonical_claim="Acme dosed the first of 400 patients in the Phase 3 ZEN-301 trial of AC-101",
+            entities=["Acme", "AC-101", "ZEN-301"],
+            numbers=["400"],
+        )
+    ]
+    ranked = rank_candidates(EVENT, pool, k=10)
+    assert ranked[0]["linked_event_id"] == "older-match"
+    assert ranked[0]["rank_score"] > ranked[1]["rank_score"]
+
+
+def test_ties_keep_pool_order_and_are_repeatable():
+    twin = {
+        "event_type": "CLINICAL_TRIAL",
+        "event_date": "2026-09-30",
+        "canonical_claim": "Acme started the Phase 3 ZEN-301 trial",
+        "entities": ["Acme", "ZEN-301"],
+    }
+    pool = [_candidate(f"twin-{i}", **twin) for i in range(6)]
+    ranked = rank_candidates(EVENT, pool, k=4)
+    assert [c["linked_event_id"] for c in ranked] == ["twin-0", "twin-1", "twin-2", "twin-3"]
+    assert len({c["rank_score"] for c in ranked}) == 1
+    assert rank_candidates(EVENT, pool, k=4) == ranked
+
+
+def test_candidates_below_min_score_are_dropped():
+    pool = [_candidate("unrelated", event_type="LEGAL", canonical_claim="Lawsuit dismissed", entities=["Court"])]
+    assert rank_candidates(EVENT, pool, k=10) == []
+
+
+def test_relevant_thread_past_the_catalog_limit_is_offered():
+    # Catalog order is newest first, as scratchpad_catalog returns it.
+    catalog = [
+        {"thread_id": f"acme::revenue_q{i}", "thread_name": "Quarterly revenue", "latest_claims": ["Acme reported revenue"]}
+        for i in range(150)
+    ] + [
+        {
+            "thread_id": "acme::zen_301_trial",
+            "thread_name": "ZEN-301 Phase 3 trial",
+            "latest_claims": ["Acme dosed the first patient in the ZEN-301 trial of AC-101"],
+        }
+    ]
+    offered = rank_threads([EVENT], catalog, k=100)
+    assert len(offered) == 100
+    assert offered[0]["thread_id"] == "acme::zen_301_trial"
+    # Everything else ties, so the newest threads fill the rest.
+    assert [t["thread_id"] for t in offered[1:4]] == ["acme::revenue_q0", "acme::revenue_q1", "acme::revenue_q2"]
+    assert rank_threads([EVENT], catalog[:100], k=100) == catalog[:100]
@@ -0,0 +1,60 @@
+"""A diff-based review trace expands back into the full per-hop events and feedback."""
+
+from __future__ import annotations
+
+from pr_flow_agents.graph.ingestion.review_trace import diff_by_expert, diff_events, reconstruct_trace
+
+
+def _ev(span, **fields):
+    return {"event_type": "FINANCIAL", "claim": span, "numbers": [], "evidence_span": span, **fields}
+
+
+HOPS = [
+    [_ev("Revenue rose 12%."), _ev("Opened a site in Ohio."), _ev("Hired a new CFO.")],
+    # Removed the CFO event, changed the Ohio event, added a guidance event.
+    [_ev("Revenue rose 12%."), _ev("Opened a site in Ohio.", event_type="OPERATIONAL"), _ev("Guidance is $200 million.")],
+    # Field removed from an event and the list reordered.
+    [_ev("Guidance is $200 million."), {"claim": "Revenue rose 12%.", "evidence_span": "Revenue rose 12%."}],
+]
+FEEDBACK = [
+    {"FINANCIAL": {"decision": "REVISE", "issues": ["CFO hire is not financial"]}, "OPERATIONAL": {"decision": "ACCEPT"}},
+    {"FINANCIAL": {"decision": "ACCEPT"}, "OPERATIONAL": {"decision": "ACCEPT"}},
+]
+
+
+def _compact_trace(first_hop_key="validated_events", first_hop_value=None):
+    trace = [{"hop": 1, first_hop_key: first_hop_value if first_hop_value is not None else HOPS[0]}]
+    trace.append({"hop": 1, "feedback_diff": diff_by_expert({}, FEEDBACK[0])})
+    for hop in range(1, len(HOPS)):
+        trace.append({"hop": hop + 1, "validated_diff": diff_events(HOPS[hop - 1], HOPS[hop])})
+        if hop < len(FEEDBACK):
+            trace.append({"hop": hop + 1, "feedback_diff": diff_by_expert(FEEDBACK[hop - 1], FEEDBACK[hop])})
+    return trace
+
+
+def test_diffs_record_added_removed_and_changed_events():
+    diff = diff_events(HOPS[0], HOPS[1])
+    assert len(diff["removed"]) == 1 and len(diff["added"]) == 1
+    [change] = diff["changed"].values()
+    assert change == {"set": {"event_type": "OPERATIONAL"}}
+    diff = diff_events(HOPS[1], HOPS[2])
+    assert "order" in diff
+    assert any(set(c.get("unset") or []) == {"event_type", "numbers"} for c in diff["changed"].values())
+    assert diff_events(HOPS[2], HOPS[2]) == {}
+
+
+def test_reconstruct_trace_rebuilds_every_hop():
+    full = reconstruct_trace(_compact_trace())
+    assert [e["validated_events"] for e in full if "validated_events" in e] == HOPS
+    by_expert = [e["feedback"]["by_expert"] for e in full if "feedback" in e]
+    assert by_expert == FEEDBACK
+    assert [e["feedback"]["decision"] for e in full if "feedback" in e] == ["REVISE", "ACCEPT"]
+    assert not any("validated_diff" in e or "feedback_diff" in e for e in full)
+
+
+def test_reconstruct_trace_resolves_a_snapshot_handle():
+    blobs = {"blob:first": HOPS[0]}
+    trace = _compact_trace("validated_events_ref", "blob:first")
+    full = reconstruct_trace(trace, resolve=blobs.get)
+    assert [e["validated_events"] for e in full if "validated_events" in e] == HOPS
+    assert "validated_events_ref" not in full[0]
@@ -0,0 +1,59 @@
+"""Evidence-span lookup: exact, normalized, fuzzy and missing spans."""
+
+from __future__ import annotations
+
+from pr_flow_agents.graph.ingestion.text_index import (
+    EXACT_MATCH_SCORE,
+    FUZZY_MATCH_MAX_SCORE,
+    FUZZY_MIN_SCORE,
+    NORMALIZED_MATCH_SCORE,
+    TextIndex,
+    locate_evidence,
+)
+
+RELEASE = (
+    "# Acme Reports Third Quarter Results\n\n"
+    "CAMBRIDGE, Mass. — Acme Corp. today said revenue grew 12% to \\$48.2 million,\n"
+    "driven by “strong demand” for its **Widget X** platform.\n\n"
+    "The company expects full-year revenue of $190 million to $200 million, "
+    "and plans to open a second manufacturing site in Ohio during 2027.\n"
+)
+
+
+def test_exact_span_resolves_to_itself():
+    index = TextIndex(RELEASE)
+    span = "plans to open a second manufacturing site in Ohio"
+    assert index.resolve(span) == span
+    match = index.locate(span)
+    assert (match.start, match.score) == (RELEASE.index(span), EXACT_MATCH_SCORE)
+
+
+def test_whitespace_quotes_and_markdown_are_normalized():
+    index = TextIndex(RELEASE)
+    # Straight quotes, a collapsed line break, no escape or emphasis markers.
+    span = 'revenue grew 12% to $48.2 million, driven by "strong demand" for its Widget X platform'
+    resolved = index.resolve(span)
+    assert resolved == RELEASE[RELEASE.index("revenue grew") : RELEASE.index(" platform") + len(" platform")]
+    assert "\\$48.2 million,\ndriven" in resolved and "“strong demand”" in resolved
+    assert index.locate(span).score == NORMALIZED_MATCH_SCORE
+
+
+def test_fuzzy_span_is_located_by_seed_vote_but_not_resolved():
+    index = TextIndex(RELEASE)
+    # One word changed: no exact or normalized match.
+    span = "expects full-year revenue of $190 million to $210 million, and plans to open a second site"
+    assert index.resolve(span) is None
+    match = index.locate(span)
+    assert match is not None
+    assert FUZZY_MIN_SCORE <= match.score <= FUZZY_MATCH_MAX_SCORE
+    assert match.start == RELEASE.index("expects full-year")
+
+
+def test_unrelated_span_is_a_miss():
+    index = TextIndex(RELEASE)
+    span = "The board declared a quarterly dividend of $0.10 per share payable in March"
+    assert index.resolve(span) is None
+    assert index.locate(span) is None
+    assert index.resolve("") is None
+    [event] = locate_evidence([{"evidence_span": span}], index)
+    assert event["evidence_start"] is None and event["evidence_match_score"] is None
@@ -0,0 +1,66 @@
+"""One linker writer per ticker: lease semantics and the flush guard."""
+
+from __future__ import annotations
+
+import pytest
+
+from pr_flow_agents.graph.linker import nodes
+from pr_flow_agents.storage.ticker_lock_store import TickerLockStore
+
+
+def test_lease_excludes_other_owners_until_released_or_expired(mongo_db):
+    uri, name = mongo_db
+    store = TickerLockStore(uri, name)
+    lease = store.acquire("linker:ACME", wait_seconds=0)
+    assert not store.try_acquire("linker:ACME", "other")
+    with pytest.raises(TimeoutError):
+        store.acquire("linker:ACME", wait_seconds=0)
+    assert store.try_acquire("linker:OTHER", "other")
+    lease.release()
+    assert store.try_acquire("linker:ACME", "other")
+
+    # An expired lease is taken over, and its old holder can no longer renew it.
+    stale = store.acquire("linker:STALE", ttl_seconds=0, wait_seconds=0)
+    assert stale.expired
+    assert store.try_acquire("linker:STALE", "other")
+    assert not stale.renew()
+
+
+class _WorkingSet:
+    ticker = "ACME"
+    complete = False
+    reads = writes = 0
+
+    def __init__(self):
+        self.flushed = False
+
+    def flush(self):
+        self.flushed = True
+        return 0
+
+
+class _Lease:
+    name = "linker:ACME"
+
+    def __init__(self, expired):
+        self.expired = expired
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+@pytest.mark.parametrize("expired", [False, True])
+def test_flush_only_while_the_lease_is_held(monkeypatch, expired):
+    working_set, lease = _WorkingSet(), _Lease(expired)
+    monkeypatch.setattr(nodes, "_claim_index", None)
+    monkeypatch.setitem(nodes._working_sets, "k", working_set)
+    monkeypatch.setitem(nodes._leases, "k", lease)
+    if expired:
+        with pytest.raises(RuntimeError):
+            nodes._release_working_set({"working_set_key": "k"})
+    else:
+        nodes._release_working_set({"working_set_key": "k"})
+    assert working_set.flushed is not expired
+    assert lease.released
+    assert "k" not in nodes._leases
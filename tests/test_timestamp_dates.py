@@ -0,0 +1,54 @@
+"""updated_at is written and backfilled as a BSON date so sorts on it are chronological."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pymongo
+
+from pr_flow_agents.storage import linked_event_store
+from pr_flow_agents.storage.migrations import timestamp_dates
+from pr_flow_agents.storage.models import LinkedEventDocument
+from pr_flow_agents.storage.thread_scratchpad_store import ThreadScratchpadStore
+
+
+def _linked(linked_event_id: str) -> LinkedEventDocument:
+    return LinkedEventDocument(
+        linked_event_id=linked_event_id,
+        ticker="ACME",
+        thread_id="t1",
+        event_type="FINANCIAL",
+        canonical_claim="Revenue grew",
+        status="ACTIVE",
+    )
+
+
+def test_writes_store_timestamps_as_dates():
+    payload = linked_event_store._insert_payload(_linked("le-1"))
+    assert isinstance(payload["created_at"], datetime)
+    assert isinstance(payload["updated_at"], datetime)
+    op = ThreadScratchpadStore.upsert_op(
+        ticker="ACME", thread_id="t1", thread_name="Revenue", summary="", latest_linked_event_ids=[]
+    )
+    assert isinstance(op._doc["$set"]["updated_at"], datetime)
+
+
+def test_backfill_orders_legacy_strings_with_dates(mongo_db):
+    uri, name = mongo_db
+    client = pymongo.MongoClient(uri)
+    coll = client[name]["linked_events"]
+    now = datetime(2026, 10, 1, 12, 0, 0, 123456)
+    coll.insert_many(
+        [
+            # Inserted later than "updated" but stored as a string, so it sorted last.
+            {"linked_event_id": "new", "updated_at": (now + timedelta(days=1)).isoformat(), "created_at": now.isoformat()},
+            {"linked_event_id": "old", "updated_at": now},
+            {"linked_event_id": "bad", "updated_at": "not a date"},
+        ]
+    )
+    assert timestamp_dates.backfill(coll) == 2
+    assert timestamp_dates.backfill(coll) == 0
+    order = [d["linked_event_id"] for d in coll.find({"updated_at": {"$ne": None}}).sort("updated_at", -1)]
+    assert order == ["new", "old"]
+    assert coll.find_one({"linked_event_id": "new"})["created_at"] == now.replace(microsecond=123000)
+    client.close()
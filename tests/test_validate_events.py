@@ -0,0 +1,76 @@
+"""validate_events checks spans against the prompt text and reports drops by candidate index."""
+
+from __future__ import annotations
+
+import pytest
+
+from pr_flow_agents.graph.ingestion import nodes
+from pr_flow_agents.graph.ingestion.boilerplate import strip_boilerplate
+
+RELEASE = (
+    "ACME reports third quarter results.\n\n"
+    "ACME grew revenue 10% to $5 million in the quarter.\n\n"
+    "## About ACME\n\n"
+    "ACME is a maker of industrial widgets sold to customers around the world since 1990.\n\n"
+    "## Products\n\n"
+    "ACME also launched Widget X today for customers.\n"
+)
+
+
+def _event(event_type, span):
+    return {"event_type": event_type, "confidence": "HIGH", "event_date": "2026-10-01", "evidence_span": span, "numbers": []}
+
+
+CANDIDATES = [
+    _event("NOT_A_TYPE", "ACME grew revenue 10%"),
+    _event("FINANCIAL", "ACME grew revenue 10% to $5 million"),
+    # Contiguous in the stripped text only: the About section sat in between.
+    _event("OTHER", "in the quarter.\n\n## Products"),
+    _event("PRODUCT_LAUNCH", "ACME also launched Widget X today"),
+]
+
+
+@pytest.fixture
+def state():
+    run_id = "test-validate-events"
+    stripped = strip_boilerplate(RELEASE)
+    base = {"run_id": run_id}
+    yield {
+        "run_id": run_id,
+        "hop_count": 1,
+        "content_ref": nodes._put_blob(base, RELEASE),
+        "prompt_content_ref": nodes._put_blob(base, stripped.text),
+        "boilerplate_ref": nodes._put_blob(base, stripped.to_dict()),
+        "candidate_events_ref": nodes._put_blob(base, CANDIDATES),
+        "chunk_candidates_ref": nodes._put_blob(base, []),
+    }
+    nodes.release_run_blobs(run_id)
+
+
+def test_span_bridging_removed_boilerplate_is_dropped_locally(state, monkeypatch):
+    seen = []
+
+    def fake_llm(prompt, model=None):
+        seen.append(prompt)
+        return {"validated_events": [], "drops": []}
+
+    monkeypatch.setattr(nodes, "generate_json", fake_llm)
+    out = nodes.validate_events(state)
+    local = {d["event_index"]: d["reason"] for d in out["review_trace"][-1]["drops"] if d["stage"] == "local"}
+    assert local == {0: "invalid_event_type", 2: "evidence_span_not_in_release"}
+    assert "About ACME" not in seen[0]
+
+
+def test_llm_drop_positions_are_translated_to_candidate_indices(state, monkeypatch):
+    def fake_llm(prompt, model=None):
+        # Survivors are candidates 1 and 3; position 1 is candidate 3.
+        return {
+            "validated_events": [CANDIDATES[1]],
+            "drops": [{"event_index": 1, "reason": "not material"}, {"event_index": 7, "reason": "bogus"}],
+        }
+
+    monkeypatch.setattr(nodes, "generate_json", fake_llm)
+    out = nodes.validate_events(state)
+    llm = [d for d in out["review_trace"][-1]["drops"] if d["stage"] == "llm"]
+    assert llm[0]["event_index"] == 3
+    assert "event_index" not in llm[1] and llm[1]["llm_event_index"] == 7